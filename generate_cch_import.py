@@ -24,18 +24,23 @@ Supported forms:
 """
 
 import argparse
+import io
 import json
+import logging
 import sys
 from pathlib import Path
 from datetime import datetime
 
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, Alignment
 except ImportError:
     print("ERROR: openpyxl not found. Install with: pip install openpyxl")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # CCH COLUMN DEFINITIONS (based on actual CCH exports)
@@ -239,6 +244,13 @@ MTG_MAP = {
 }
 
 # 1099-R: Distributions from Pensions, Annuities, IRAs (103 columns)
+# Header row (simplified - just the key ones we use)
+R_COLUMNS = ["TSJ", "Payer's Name", "Gross Distribution", "Prior Year", "Taxable Amount",
+             "Capital Gain", "Federal Tax Withheld", "State Tax Withheld", "Local Tax Withheld",
+             "Dist. Code", "IRA", "IRA/SEP/SIMPLE", "FS", "State", "City",
+             "Payer's State ID Number", "Date of Payment", "Acct. Number", "Payer's Federal ID Number"]
+
+# Key column positions (1-indexed) for 1099-R
 R_MAP = {
     'tsj': 1,
     'payer_name': 2,
@@ -259,6 +271,12 @@ R_MAP = {
 }
 
 # 1099-B: Capital Gains and Losses (53 columns)
+# Header row (simplified - just the key ones we use)
+B_COLUMNS = ["Description", "Quantity", "Sales Price", "Cost or Other Basis",
+             "Accountant Gain / Loss - Override", "Date Acquired", "Date Sold",
+             "Term Code", "1099-B Code", "Corrected 1099-B Basis"]
+
+# Key column positions (1-indexed) for 1099-B
 B_MAP = {
     'description': 1,
     'quantity': 2,
@@ -272,6 +290,14 @@ B_MAP = {
 }
 
 # 1099-NEC: Nonemployee Compensation (60 columns)
+# Header row (simplified - just the key ones we use)
+NEC_COLUMNS = ["TSJ", "Name", "Street", "City", "State", "ZIP Code", "Foreign Country",
+               "Province, State or County", "Postal Code", "Telephone Number",
+               "Federal Identification Number", "Identification Number", "Name", "Street",
+               "City", "State", "ZIP or Postal Code", "Foreign Country", "Province, State or County",
+               "Account Number", "2nd TIN Not.", "Nonemployee Compensation"]
+
+# Key column positions (1-indexed) for 1099-NEC
 NEC_MAP = {
     'tsj': 1,
     'payer_name': 2,
@@ -293,6 +319,15 @@ NEC_MAP = {
 }
 
 # 1099-G: Certain Government Payments (54 columns)
+# Header row (simplified - just the key ones we use)
+G_COLUMNS = ["TSJ", "Name", "Street", "City", "State", "ZIP Code", "Telephone Number",
+             "Federal Identification Number", "Identification Number", "Name", "Address",
+             "City", "State", "ZIP or Postal Code", "Foreign Country", "Province / State / County",
+             "Account Number", "Unemployment Compensation", "Compensation Repaid",
+             "Box 2 State Income Tax Refund", "Box 2 Local Income Tax Refund", "Prior Year",
+             "Year for Box 2", "Federal Income Tax Withheld"]
+
+# Key column positions (1-indexed) for 1099-G
 G_MAP = {
     'tsj': 1,
     'payer_name': 2,
@@ -312,6 +347,16 @@ G_MAP = {
 }
 
 # 1099-MISC: Miscellaneous Income (72 columns)
+# Header row (simplified - just the key ones we use)
+MISC_COLUMNS = ["TSJ", "Name", "Street", "City", "State", "ZIP or Postal Code",
+                "Foreign Country", "Province, State or County", "Telephone Number",
+                "Payer's TIN", "Recipient's TIN", "Name", "Street", "City", "State",
+                "ZIP or Postal Code", "Foreign Country", "Province, State or County",
+                "Account Number", "FATCA Filing Requirement", "2nd TIN Not.",
+                "Section 409A Deferrals", "Section 409A Income", "Rents", "Royalties",
+                "Other Income", "Federal Tax Withheld"]
+
+# Key column positions (1-indexed) for 1099-MISC
 MISC_MAP = {
     'tsj': 1,
     'payer_name': 2,
@@ -336,6 +381,15 @@ MISC_MAP = {
 }
 
 # 1099-K: Payment Card Transactions (33 columns)
+# Header row (simplified - just the key ones we use)
+K_COLUMNS = ["TSJ", "Name", "Address", "City", "State", "ZIP or Postal Code",
+             "Foreign Country", "Province / County", "Telephone Number", "TIN", "TIN",
+             "Name", "Address", "City", "State", "ZIP or Postal Code", "Foreign Country",
+             "Province / County", "Gross Amount of Payment Card / Third Party Network Transactions",
+             "Card Not Present Transactions", "Cash Tips", "Treasury Tipped Occupation Code",
+             "Federal Income Tax Withheld"]
+
+# Key column positions (1-indexed) for 1099-K
 K_MAP = {
     'tsj': 1,
     'filer_name': 2,
@@ -353,6 +407,14 @@ K_MAP = {
 }
 
 # 1098-E: Student Loan Interest (27 columns)
+# Header row (simplified - just the key ones we use)
+SLI_COLUMNS = ["TSJ", "Name", "Address", "City", "State", "ZIP or Postal Code",
+               "Province / State / County", "Foreign Country", "Telephone Number",
+               "Federal Identification Number", "Social Security Number", "Name",
+               "Address", "City", "State", "ZIP or Postal Code", "Province / State / County",
+               "Foreign Country", "Account Number", "Student Loan Interest Received"]
+
+# Key column positions (1-indexed) for 1098-E
 SLI_MAP = {
     'tsj': 1,
     'lender_name': 2,
@@ -368,6 +430,16 @@ SLI_MAP = {
 }
 
 # 1099-SA: HSA/MSA Distributions (41 columns)
+# Header row (simplified - just the key ones we use)
+SA_COLUMNS = ["TS", "FS", "State", "City", "Payer Name", "Payer Address", "Payer City",
+              "Payer State", "Payer ZIP code", "Payer Province", "Payer Foreign Country",
+              "Payer Phone Number", "Payer Federal ID", "Recipient ID", "Recipient Name",
+              "Recipient Address", "Recipient City", "Recipient State", "Recipient ZIP Code",
+              "Recipient Province", "Recipient Foreign Country", "Account Number",
+              "Gross Distribution", "Earnings on Excess", "FMV on Date of Death",
+              "Distribution Code", "HSA / Archer MSA / MA MSA"]
+
+# Key column positions (1-indexed) for 1099-SA
 SA_MAP = {
     'ts': 1,
     'payer_name': 5,
@@ -386,6 +458,23 @@ SA_MAP = {
 }
 
 # 1098-T Tuition Statement (32 columns)
+# Header row (simplified - just the key ones we use)
+T_COLUMNS = ["TSJ", "Filer's Name", "Filer's Address", "Filer's City", "Filer's State",
+             "Filer's ZIP Code", "Province / State / County", "Foreign Country",
+             "Filer's Telephone Number", "Filer's Federal Identification Number",
+             "Student's SSN", "Student's Name", "Student's Address", "Student's City",
+             "Student's State", "Student's ZIP Code", "Student's Province",
+             "Student's Foreign Country", "Account Number",
+             "Payments Received for Qualified Tuition",  # Box 1
+             "Amounts Billed for Qualified Tuition",      # Box 2
+             "Adjustments Made for Prior Year",           # Box 4
+             "Scholarships or Grants",                    # Box 5
+             "Adjustments to Scholarships or Grants",     # Box 6
+             "Checked if Box 1 Includes Jan-Mar",         # Box 7
+             "At Least Half-Time Student",                # Box 8
+             "Graduate Student"]                          # Box 9
+
+# Key column positions (1-indexed) for 1098-T
 T_MAP = {
     'tsj': 1,
     'school_name': 2,
@@ -407,6 +496,21 @@ T_MAP = {
 }
 
 # 1099-Q Qualified Education Programs (35 columns)
+# Header row (simplified - just the key ones we use)
+Q_COLUMNS = ["TSJ", "Payer/Trustee Name", "Payer Address", "Payer City", "Payer State",
+             "Payer ZIP Code", "Province / State / County", "Foreign Country",
+             "Telephone Number", "Federal Identification Number",
+             "Recipient's TIN", "Recipient's Name", "Recipient's Address",
+             "Recipient's City", "Recipient's State", "Recipient's ZIP Code",
+             "Recipient's Province", "Recipient's Foreign Country", "Account Number",
+             "Gross Distribution",                    # Box 1
+             "Earnings",                              # Box 2
+             "Basis",                                 # Box 3
+             "Trustee-to-Trustee Transfer",          # Box 4
+             "Distribution Type (1=529, 2=Coverdell)", # Box 5
+             "Designated Beneficiary"]                # Box 6
+
+# Key column positions (1-indexed) for 1099-Q
 Q_MAP = {
     'tsj': 1,
     'payer_name': 2,
@@ -426,6 +530,20 @@ Q_MAP = {
 }
 
 # K-1 Partnership (99 columns)
+# Header row (simplified - just the key ones we use)
+K1_COLUMNS = ["Import Client ID", "Passthrough Entity Name", "Passthrough Entity ID",
+              "Partner / Shareholder / Beneficiary Name", "Partner / Shareholder / Beneficiary ID",
+              "Preparer Notes", "Activity number", "Activity Name / Description",
+              "100% Disposition ", "PTP (N/A 1041)", "Class code: 1 NP, 2 Act rental, 3 Passive, 4 MPREA",
+              "Type of Property", "L1 Ordinary Income (Loss)", "L2 Net Rental Real Estate",
+              "L3 Net Other Rent", "L4a Guaranteed Payments for Services",
+              "L4b Guaranteed Payments for Capital", "L4c Total Guaranteed Payments",
+              "L5 Interest", "Interest from US Bonds", "L6a Ordinary Dividends",
+              "L6b Qualified Dividends", "L7 Royalties", "L8 Short-Term Capital G/L",
+              "L9a Net Long-Term Capital G/L", "L9b Collectibles 28% G/L",
+              "L9c Unrecaptured Sec 1250 gain", "L10 Section 1231 Gain (Loss)"]
+
+# Key column positions (1-indexed) for K-1
 K1_MAP = {
     'client_id': 1,
     'entity_name': 2,
@@ -448,34 +566,257 @@ K1_MAP = {
 }
 
 
+# =============================================================================
+# PARSED FIELD -> ROW SLOT TABLES
+# =============================================================================
+# Optional fields copied into an import row when the parsed value is truthy.
+# Each entry pairs a parse_source_docs.py key with a *_MAP column name and is
+# resolved to a 0-based row slot at import time.
+
+def row_slots(col_map, fields):
+    """Resolve (entry key(s), map column name) pairs to (entry key(s), 0-based slot)."""
+    return tuple((key, col_map[name] - 1) for key, name in fields)
+
+
+INT_FIELDS = row_slots(INT_MAP, (
+    ('box1_interest', 'interest_income'),                # Box 1
+    ('box3_savings_bond', 'us_savings_bonds'),           # Box 3
+    ('box4_fed_withholding', 'fed_withholding'),         # Box 4
+    ('box8_tax_exempt_interest', 'tax_exempt_interest'), # Box 8
+    ('payer_tin', 'ein'),
+))
+
+DIV_FIELDS = row_slots(DIV_MAP, (
+    ('box1a_ordinary_dividends', 'ordinary_dividends'),    # Box 1a
+    ('box1b_qualified_dividends', 'qualified_dividends'),  # Box 1b
+    ('box2a_total_cap_gain', 'total_cap_gain_dist'),       # Box 2a
+    ('box3_nondiv_dist', 'nondividend_dist'),              # Box 3
+    ('box4_fed_withholding', 'fed_withholding'),           # Box 4
+    ('box5_sec199a', 'section_199a_dividends'),            # Box 5 (column 75!)
+    ('box7_foreign_tax', 'foreign_tax_paid'),              # Box 7
+    ('box12_exempt_int_div', 'exempt_int_dividends'),      # Box 12
+    ('payer_tin', 'ein'),
+))
+
+SSA_FIELDS = row_slots(SSA_MAP, (
+    ('beneficiary_ssn', 'beneficiary_ssn'),
+    ('box3_benefits_paid', 'benefits_paid'),       # Box 3
+    ('box4_benefits_repaid', 'benefits_repaid'),   # Box 4
+    ('box5_net_benefits', 'net_benefits'),         # Box 5
+    ('box6_fed_withholding', 'fed_withholding'),   # Box 6
+))
+
+W2_FIELDS = row_slots(W2_MAP, (
+    ('box1_wages', 'wages'),                         # Box 1
+    ('box2_fed_withholding', 'fed_withholding'),     # Box 2
+    ('box3_ss_wages', 'ss_wages'),                   # Box 3
+    ('box4_ss_tax', 'ss_tax'),                       # Box 4
+    ('box5_medicare_wages', 'medicare_wages'),       # Box 5
+    ('box6_medicare_tax', 'medicare_tax'),           # Box 6
+    ('employer_ein', 'employer_ein'),
+    ('box16_state_wages', 'state_wages'),            # Box 16
+    ('box17_state_withholding', 'state_tax'),        # Box 17
+))
+
+MTG_FIELDS = row_slots(MTG_MAP, (
+    ('lender_ein', 'lender_ein'),
+    ('box1_mortgage_interest', 'mortgage_interest'),          # Box 1
+    ('box2_outstanding_principal', 'outstanding_principal'),  # Box 2
+    ('box5_mortgage_insurance', 'mortgage_insurance'),        # Box 5
+    ('box10_property_tax', 'property_tax'),                   # Box 10
+    ('property_address', 'property_address'),
+))
+
+R_FIELDS = row_slots(R_MAP, (
+    ('box1_gross_distribution', 'gross_distribution'),  # Box 1
+    ('box2a_taxable_amount', 'taxable_amount'),         # Box 2a
+    ('box4_fed_withholding', 'fed_withholding'),        # Box 4
+    ('box7_distribution_code', 'dist_code'),            # Box 7
+    ('payer_ein', 'payer_ein'),
+))
+
+B_FIELDS = row_slots(B_MAP, (
+    ('quantity', 'quantity'),
+    ('cost_basis', 'cost_basis'),
+    ('date_acquired', 'date_acquired'),
+    ('date_sold', 'date_sold'),
+    ('term_code', 'term_code'),
+    ('code_1099b', 'code_1099b'),
+))
+
+NEC_FIELDS = row_slots(NEC_MAP, (
+    ('payer_ein', 'payer_ein'),
+    ('box4_fed_withholding', 'fed_withholding'),  # Box 4
+))
+
+G_FIELDS = row_slots(G_MAP, (
+    ('box1_unemployment', 'unemployment'),        # Box 1
+    ('box2_state_refund', 'state_tax_refund'),    # Box 2
+    ('box4_fed_withholding', 'fed_withholding'),  # Box 4
+))
+
+MISC_FIELDS = row_slots(MISC_MAP, (
+    ('box1_rents', 'rents'),                      # Box 1
+    ('box2_royalties', 'royalties'),              # Box 2
+    ('box3_other_income', 'other_income'),        # Box 3
+    ('box4_fed_withholding', 'fed_withholding'),  # Box 4
+))
+
+K_FIELDS = row_slots(K_MAP, (
+    ('payee_name', 'payee_name'),
+    ('box1a_gross_amount', 'gross_amount'),  # Box 1a
+    ('fed_withholding', 'fed_withholding'),
+))
+
+SLI_FIELDS = row_slots(SLI_MAP, (
+    ('lender_ein', 'lender_ein'),
+    ('borrower_name', 'borrower_name'),
+    ('box1_interest', 'student_loan_interest'),  # Box 1
+))
+
+SA_FIELDS = row_slots(SA_MAP, (
+    ('payer_ein', 'payer_ein'),
+    ('recipient_name', 'recipient_name'),
+    ('box1_gross_distribution', 'gross_distribution'),  # Box 1
+    ('box3_distribution_code', 'distribution_code'),    # Box 3
+))
+
+K1_FIELDS = row_slots(K1_MAP, (
+    ('partner_ssn', 'partner_ssn'),
+    ('box1_ordinary_income', 'ordinary_income'),            # Line 1
+    ('box2_net_rental_re', 'net_rental_re'),                # Line 2
+    ('box5_interest', 'interest'),                          # Line 5
+    ('box6a_ordinary_dividends', 'ordinary_dividends'),     # Line 6a
+    ('box6b_qualified_dividends', 'qualified_dividends'),   # Line 6b
+    ('box8_st_capital_gl', 'st_capital_gl'),                # Line 8
+    ('box9a_lt_capital_gl', 'lt_capital_gl'),               # Line 9a
+    ('box10_section_1231', 'section_1231_gl'),              # Line 10
+))
+
+T_FIELDS = row_slots(T_MAP, (
+    ('school_ein', 'school_ein'),
+    ('student_name', 'student_name'),
+    ('student_ssn', 'student_ssn'),
+    ('box1_payments_received', 'payments_received'),                # Box 1
+    ('box2_amounts_billed', 'amounts_billed'),                      # Box 2 (older forms)
+    ('box4_adjustments_prior_year', 'adjustments_prior'),           # Box 4
+    ('box5_scholarships', 'scholarships'),                          # Box 5
+    ('box6_adjustments_scholarships', 'adjustments_scholarships'),  # Box 6
+))
+
+# Checkbox fields are written as 'X' when the parsed value is truthy
+T_CHECKBOXES = row_slots(T_MAP, (
+    ('box7_checked', 'box7_checked'),  # Box 7: includes Jan-Mar of next year
+    ('box8_half_time', 'half_time'),   # Box 8
+    ('box9_graduate', 'graduate'),     # Box 9
+))
+
+Q_FIELDS = row_slots(Q_MAP, (
+    ('payer_ein', 'payer_ein'),
+    ('recipient_name', 'recipient_name'),
+    ('recipient_ssn', 'recipient_ssn'),
+    ('box1_gross_distribution', 'gross_distribution'),  # Box 1
+    ('box2_earnings', 'earnings'),                      # Box 2
+    ('box3_basis', 'basis'),                            # Box 3
+    ('box5_distribution_type', 'distribution_type'),    # Box 5 (1=529, 2=Coverdell)
+))
+
+Q_CHECKBOXES = row_slots(Q_MAP, (
+    ('box4_trustee_transfer', 'trustee_transfer'),              # Box 4
+    ('box6_designated_beneficiary', 'designated_beneficiary'),  # Box 6
+))
+
+# Fields the parsers report under alternative keys; the first truthy key wins
+B_FALLBACKS = row_slots(B_MAP, (
+    (('proceeds', 'sales_price'), 'sales_price'),
+))
+
+NEC_FALLBACKS = row_slots(NEC_MAP, (
+    (('box1_nec', 'nonemployee_compensation'), 'nec_compensation'),  # Box 1
+))
+
+K_FALLBACKS = row_slots(K_MAP, (
+    (('filer_name', 'payer_name'), 'filer_name'),
+))
+
+
+# Shared by every header cell; openpyxl copies it into each workbook's style table
+HEADER_FONT = Font(bold=True)
+
+
 def create_cch_workbook(sheet_name, columns, client_id=None):
-    """Create a CCH-formatted workbook with headers."""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = sheet_name
+    """
+    Create a write-only CCH-formatted workbook with the preamble and headers.
+
+    Rows 1-6 are streamed immediately, so callers add data rows (row 7 on)
+    with ws.append() and cannot go back and write individual cells.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
 
     # Row 1: Client ID (optional - CCH adds this on export)
-    if client_id:
-        ws.cell(row=1, column=1, value=client_id)
+    ws.append([client_id] if client_id else [])
 
     # Row 2: Worksheet path (optional)
-    ws.cell(row=2, column=1, value=f"{sheet_name} - {sheet_name}")
+    ws.append([f"{sheet_name} - {sheet_name}"])
 
     # Row 3: blank
+    ws.append([])
 
     # Row 4: Section header
-    ws.cell(row=4, column=1, value=sheet_name)
+    ws.append([sheet_name])
 
     # Row 5: blank (grouping row in CCH)
+    ws.append([])
 
     # Row 6: Column headers
-    for col_idx, header in enumerate(columns, 1):
-        cell = ws.cell(row=6, column=col_idx, value=header)
-        cell.font = Font(bold=True)
+    header_row = []
+    for header in columns:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = HEADER_FONT
+        header_row.append(cell)
+    ws.append(header_row)
 
     return wb, ws
 
 
+def save_workbook(wb, output_path):
+    """
+    Serialize the workbook in memory, then write the file in one call.
+
+    The output file is only opened once the whole workbook has been built,
+    so a failed save never leaves a truncated import file behind.
+    """
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    Path(output_path).write_bytes(buffer.getbuffer())
+
+
+def first_value(entry, keys):
+    """Return the first truthy value among alternative keys, else None."""
+    for key in keys:
+        value = entry.get(key)
+        if value:
+            return value
+    return None
+
+
+def fill_row(row, entry, fields, checkboxes=(), fallbacks=()):
+    """Copy truthy entry values into their row slots; checkboxes get 'X'."""
+    get = entry.get  # bound once per row, reused for every lookup
+    for key, idx in fields:
+        value = get(key)
+        if value:
+            row[idx] = value
+    for key, idx in checkboxes:
+        if get(key):
+            row[idx] = 'X'
+    for keys, idx in fallbacks:
+        value = first_value(entry, keys)
+        if value:
+            row[idx] = value
+
+
 # Minimum confidence threshold for including in CCH imports
 MIN_CONFIDENCE_THRESHOLD = 60
 
@@ -536,11 +877,159 @@ def filter_quality_entries(data_list, form_type):
         filtered.append(item)
 
     if skipped:
-        print(f"    ({skipped} {form_type} entries skipped due to quality issues)")
+        logger.info("    (%d %s entries skipped due to quality issues)", skipped, form_type)
 
     return filtered
 
 
+# =============================================================================
+# CCH IMPORT SCHEMAS
+# =============================================================================
+# Form-specific row quirks that do not fit the field tables. Each hook is
+# called as hook(row, entry, number) after the table fields are filled, with
+# number counting entries from 1.
+
+SSA_NAME_IDX = SSA_MAP['name'] - 1
+
+
+def ssa_beneficiary_name(row, entry, number):
+    """Name from the dedicated field or description, else a placeholder."""
+    name = entry.get('beneficiary_name', entry.get('description', ''))
+    if not name or name == 'Social Security Benefits':
+        name = f"Beneficiary {number}"
+    row[SSA_NAME_IDX] = name
+
+
+def cch_schema(label, file_base, sheet, columns, col_map, always, fields,
+               checkboxes=(), fallbacks=(), hook=None):
+    """
+    Build one CCH_SCHEMAS entry.
+
+    Args:
+        label: Canonical form name (FORM_ALIASES key, e.g. '1099-INT')
+        file_base: Form part of the import filename (e.g. '1099INT')
+        sheet: CCH worksheet title
+        columns: Header row written to row 6
+        col_map: *_MAP dict of 1-indexed column positions
+        always: (entry key, map column name) pairs written for every entry,
+            defaulting to ''
+        fields: Optional field table from row_slots()
+        checkboxes: Optional checkbox table from row_slots()
+        fallbacks: Optional (alternative keys, slot) table from row_slots()
+        hook: Optional hook(row, entry, number) for form-specific quirks
+    """
+    return {
+        'label': label,
+        'file_base': file_base,
+        'sheet': sheet,
+        'columns': columns,
+        'width': max(col_map.values()),
+        'always': row_slots(col_map, always),
+        'fields': fields,
+        'checkboxes': checkboxes,
+        'fallbacks': fallbacks,
+        'hook': hook,
+    }
+
+
+# Keyed by --forms code; insertion order is the order files are generated
+CCH_SCHEMAS = {
+    'W2': cch_schema('W-2', 'W2', "Wages and Salaries", W2_COLUMNS, W2_MAP,
+                     always=(('ts', 'ts'), ('employer_name', 'employer_name')),
+                     fields=W2_FIELDS),
+    'INT': cch_schema('1099-INT', '1099INT', "Interest", INT_COLUMNS, INT_MAP,
+                      always=(('tsj', 'tsj'), ('payer_name', 'payer')),
+                      fields=INT_FIELDS),
+    'DIV': cch_schema('1099-DIV', '1099DIV', "Dividends", DIV_COLUMNS, DIV_MAP,
+                      always=(('tsj', 'tsj'), ('payer_name', 'payer_name')),
+                      fields=DIV_FIELDS),
+    'SSA': cch_schema('SSA-1099', 'SSA1099', "Social Security Benefit Stmt", SSA_COLUMNS, SSA_MAP,
+                      always=(('tsj', 'tsj'),),
+                      fields=SSA_FIELDS, hook=ssa_beneficiary_name),
+    'MTG': cch_schema('1098', '1098', "Mortgage Interest", MTG_COLUMNS, MTG_MAP,
+                      always=(('tsj', 'tsj'), ('lender_name', 'lender_name')),
+                      fields=MTG_FIELDS),
+    'R': cch_schema('1099-R', '1099R', "Dist Pensions Annuities IRAs", R_COLUMNS, R_MAP,
+                    always=(('tsj', 'tsj'), ('payer_name', 'payer_name')),
+                    fields=R_FIELDS),
+    'B': cch_schema('1099-B', '1099B', "Capital Gains and Losses", B_COLUMNS, B_MAP,
+                    always=(('description', 'description'),),
+                    fields=B_FIELDS, fallbacks=B_FALLBACKS),
+    'NEC': cch_schema('1099-NEC', '1099NEC', "Nonemployee Compensation", NEC_COLUMNS, NEC_MAP,
+                      always=(('tsj', 'tsj'), ('payer_name', 'payer_name')),
+                      fields=NEC_FIELDS, fallbacks=NEC_FALLBACKS),
+    'G': cch_schema('1099-G', '1099G', "Certain Government Payments", G_COLUMNS, G_MAP,
+                    always=(('tsj', 'tsj'), ('payer_name', 'payer_name')),
+                    fields=G_FIELDS),
+    'MISC': cch_schema('1099-MISC', '1099MISC', "Miscellaneous Information", MISC_COLUMNS, MISC_MAP,
+                       always=(('tsj', 'tsj'), ('payer_name', 'payer_name')),
+                       fields=MISC_FIELDS),
+    'K': cch_schema('1099-K', '1099K', "Payment Card Transactions", K_COLUMNS, K_MAP,
+                    always=(('tsj', 'tsj'),),
+                    fields=K_FIELDS, fallbacks=K_FALLBACKS),
+    'SLI': cch_schema('1098-E', '1098E', "Student Loan Interest Statement", SLI_COLUMNS, SLI_MAP,
+                      always=(('tsj', 'tsj'), ('lender_name', 'lender_name')),
+                      fields=SLI_FIELDS),
+    'SA': cch_schema('1099-SA', '1099SA', "Distributions From HSA or MSA", SA_COLUMNS, SA_MAP,
+                     always=(('ts', 'ts'), ('payer_name', 'payer_name')),
+                     fields=SA_FIELDS),
+    'K1': cch_schema('K-1', 'K1', "K-1 Activities (Federal)", K1_COLUMNS, K1_MAP,
+                     always=(('entity_name', 'entity_name'), ('entity_ein', 'entity_ein'),
+                             ('partner_name', 'partner_name')),
+                     fields=K1_FIELDS),
+    'T': cch_schema('1098-T', '1098T', "Tuition Statement", T_COLUMNS, T_MAP,
+                    always=(('tsj', 'tsj'), ('school_name', 'school_name')),
+                    fields=T_FIELDS, checkboxes=T_CHECKBOXES),
+    'Q': cch_schema('1099-Q', '1099Q', "Distributions from QEPs", Q_COLUMNS, Q_MAP,
+                    always=(('tsj', 'tsj'), ('payer_name', 'payer_name')),
+                    fields=Q_FIELDS, checkboxes=Q_CHECKBOXES),
+}
+
+
+def generate_import(schema, data_list, output_path, client_id=None):
+    """
+    Generate a CCH-compatible Excel import file for one form type.
+
+    Args:
+        schema: Entry from CCH_SCHEMAS describing the worksheet
+        data_list: List of dicts from parse_source_docs.py
+        output_path: Where to save the Excel file
+        client_id: Optional CCH client ID string
+
+    Returns:
+        output_path, or None if there were no entries and no file was written
+    """
+    if not data_list:
+        return None
+
+    wb, ws = create_cch_workbook(schema['sheet'], schema['columns'], client_id)
+
+    always = schema['always']
+    fields = schema['fields']
+    checkboxes = schema['checkboxes']
+    fallbacks = schema['fallbacks']
+    hook = schema['hook']
+
+    # Data rows are copied from a blank template and filled sparsely;
+    # write-only sheets skip the None slots when streaming.
+    blank_row = [None] * schema['width']
+
+    # Write data rows starting at row 7
+    for number, entry in enumerate(data_list, 1):
+        row = blank_row.copy()
+        for key, idx in always:
+            row[idx] = entry.get(key, '')
+        fill_row(row, entry, fields, checkboxes, fallbacks)
+        if hook:
+            hook(row, entry, number)
+        ws.append(row)
+
+    save_workbook(wb, output_path)
+    logger.info("  Created: %s", output_path)
+    logger.info("    %d %s entries", len(data_list), schema['label'])
+    return output_path
+
+
 def generate_1099int_import(data_list, output_path, client_id=None):
     """
     Generate CCH-compatible Excel for 1099-INT import.
@@ -556,46 +1045,7 @@ def generate_1099int_import(data_list, output_path, client_id=None):
         output_path: Where to save the Excel file
         client_id: Optional CCH client ID string
     """
-    wb, ws = create_cch_workbook("Interest", INT_COLUMNS, client_id)
-
-    # Write data rows starting at row 7
-    for row_idx, entry in enumerate(data_list, 7):
-        # TSJ - leave blank for joint, or set T/S
-        ws.cell(row=row_idx, column=INT_MAP['tsj'], value="")
-
-        # Payer name
-        ws.cell(row=row_idx, column=INT_MAP['payer'],
-                value=entry.get('payer_name', ''))
-
-        # Box 1: Interest Income
-        interest = entry.get('box1_interest', 0)
-        if interest:
-            ws.cell(row=row_idx, column=INT_MAP['interest_income'], value=interest)
-
-        # Box 3: U.S. Savings Bonds
-        savings = entry.get('box3_savings_bond', 0)
-        if savings:
-            ws.cell(row=row_idx, column=INT_MAP['us_savings_bonds'], value=savings)
-
-        # Box 4: Federal Tax Withheld
-        fed_wh = entry.get('box4_fed_withholding', 0)
-        if fed_wh:
-            ws.cell(row=row_idx, column=INT_MAP['fed_withholding'], value=fed_wh)
-
-        # Box 8: Tax-Exempt Interest
-        tax_exempt = entry.get('box8_tax_exempt_interest', 0)
-        if tax_exempt:
-            ws.cell(row=row_idx, column=INT_MAP['tax_exempt_interest'], value=tax_exempt)
-
-        # EIN
-        ein = entry.get('payer_tin', '')
-        if ein:
-            ws.cell(row=row_idx, column=INT_MAP['ein'], value=ein)
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-INT entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['INT'], data_list, output_path, client_id)
 
 
 def generate_1099div_import(data_list, output_path, client_id=None):
@@ -615,63 +1065,7 @@ def generate_1099div_import(data_list, output_path, client_id=None):
             - box12_exempt_int_div: float
             - payer_tin: str (optional)
     """
-    wb, ws = create_cch_workbook("Dividends", DIV_COLUMNS, client_id)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=DIV_MAP['tsj'], value="")
-
-        ws.cell(row=row_idx, column=DIV_MAP['payer_name'],
-                value=entry.get('payer_name', ''))
-
-        # Box 1a: Ordinary Dividends
-        ord_div = entry.get('box1a_ordinary_dividends', 0)
-        if ord_div:
-            ws.cell(row=row_idx, column=DIV_MAP['ordinary_dividends'], value=ord_div)
-
-        # Box 1b: Qualified Dividends
-        qual_div = entry.get('box1b_qualified_dividends', 0)
-        if qual_div:
-            ws.cell(row=row_idx, column=DIV_MAP['qualified_dividends'], value=qual_div)
-
-        # Box 2a: Total Capital Gain Distribution
-        cap_gain = entry.get('box2a_total_cap_gain', 0)
-        if cap_gain:
-            ws.cell(row=row_idx, column=DIV_MAP['total_cap_gain_dist'], value=cap_gain)
-
-        # Box 3: Nondividend Distributions
-        nondiv = entry.get('box3_nondiv_dist', 0)
-        if nondiv:
-            ws.cell(row=row_idx, column=DIV_MAP['nondividend_dist'], value=nondiv)
-
-        # Box 4: Federal Tax Withheld
-        fed_wh = entry.get('box4_fed_withholding', 0)
-        if fed_wh:
-            ws.cell(row=row_idx, column=DIV_MAP['fed_withholding'], value=fed_wh)
-
-        # Box 5: Section 199A Dividends (column 75!)
-        sec199a = entry.get('box5_sec199a', 0)
-        if sec199a:
-            ws.cell(row=row_idx, column=DIV_MAP['section_199a_dividends'], value=sec199a)
-
-        # Box 7: Foreign Tax Paid
-        foreign = entry.get('box7_foreign_tax', 0)
-        if foreign:
-            ws.cell(row=row_idx, column=DIV_MAP['foreign_tax_paid'], value=foreign)
-
-        # Box 12: Exempt-Interest Dividends
-        exempt = entry.get('box12_exempt_int_div', 0)
-        if exempt:
-            ws.cell(row=row_idx, column=DIV_MAP['exempt_int_dividends'], value=exempt)
-
-        # EIN
-        ein = entry.get('payer_tin', '')
-        if ein:
-            ws.cell(row=row_idx, column=DIV_MAP['ein'], value=ein)
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-DIV entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['DIV'], data_list, output_path, client_id)
 
 
 def generate_ssa1099_import(data_list, output_path, client_id=None):
@@ -687,48 +1081,7 @@ def generate_ssa1099_import(data_list, output_path, client_id=None):
             - box5_net_benefits: float
             - box6_fed_withholding: float
     """
-    wb, ws = create_cch_workbook("Social Security Benefit Stmt", SSA_COLUMNS, client_id)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=SSA_MAP['tsj'], value="")
-
-        # Name (from description or dedicated field)
-        # Use placeholder if name is generic or missing
-        name = entry.get('beneficiary_name', entry.get('description', ''))
-        if not name or name == 'Social Security Benefits':
-            beneficiary_num = row_idx - 6  # 1-indexed
-            name = f"Beneficiary {beneficiary_num}"
-        ws.cell(row=row_idx, column=SSA_MAP['name'], value=name)
-
-        # Beneficiary SSN
-        ssn = entry.get('beneficiary_ssn', '')
-        if ssn:
-            ws.cell(row=row_idx, column=SSA_MAP['beneficiary_ssn'], value=ssn)
-
-        # Box 3: Benefits Paid
-        benefits_paid = entry.get('box3_benefits_paid', 0)
-        if benefits_paid:
-            ws.cell(row=row_idx, column=SSA_MAP['benefits_paid'], value=benefits_paid)
-
-        # Box 4: Benefits Repaid
-        repaid = entry.get('box4_benefits_repaid', 0)
-        if repaid:
-            ws.cell(row=row_idx, column=SSA_MAP['benefits_repaid'], value=repaid)
-
-        # Box 5: Net Benefits
-        net = entry.get('box5_net_benefits', 0)
-        if net:
-            ws.cell(row=row_idx, column=SSA_MAP['net_benefits'], value=net)
-
-        # Box 6: Federal Withholding
-        fed_wh = entry.get('box6_fed_withholding', 0)
-        if fed_wh:
-            ws.cell(row=row_idx, column=SSA_MAP['fed_withholding'], value=fed_wh)
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} SSA-1099 entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['SSA'], data_list, output_path, client_id)
 
 
 def generate_w2_import(data_list, output_path, client_id=None):
@@ -748,66 +1101,7 @@ def generate_w2_import(data_list, output_path, client_id=None):
             - box17_state_withholding: float
             - employer_ein: str (optional)
     """
-    wb, ws = create_cch_workbook("Wages and Salaries", W2_COLUMNS, client_id)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        # TS - T=Taxpayer, S=Spouse (leave blank or set based on filename)
-        ts = entry.get('ts', '')
-        ws.cell(row=row_idx, column=W2_MAP['ts'], value=ts)
-
-        # Employer Name
-        ws.cell(row=row_idx, column=W2_MAP['employer_name'],
-                value=entry.get('employer_name', ''))
-
-        # Box 1: Wages
-        wages = entry.get('box1_wages', 0)
-        if wages:
-            ws.cell(row=row_idx, column=W2_MAP['wages'], value=wages)
-
-        # Box 2: Federal Tax Withheld
-        fed_wh = entry.get('box2_fed_withholding', 0)
-        if fed_wh:
-            ws.cell(row=row_idx, column=W2_MAP['fed_withholding'], value=fed_wh)
-
-        # Box 3: Social Security Wages
-        ss_wages = entry.get('box3_ss_wages', 0)
-        if ss_wages:
-            ws.cell(row=row_idx, column=W2_MAP['ss_wages'], value=ss_wages)
-
-        # Box 4: Social Security Tax
-        ss_tax = entry.get('box4_ss_tax', 0)
-        if ss_tax:
-            ws.cell(row=row_idx, column=W2_MAP['ss_tax'], value=ss_tax)
-
-        # Box 5: Medicare Wages
-        med_wages = entry.get('box5_medicare_wages', 0)
-        if med_wages:
-            ws.cell(row=row_idx, column=W2_MAP['medicare_wages'], value=med_wages)
-
-        # Box 6: Medicare Tax
-        med_tax = entry.get('box6_medicare_tax', 0)
-        if med_tax:
-            ws.cell(row=row_idx, column=W2_MAP['medicare_tax'], value=med_tax)
-
-        # Employer EIN
-        ein = entry.get('employer_ein', '')
-        if ein:
-            ws.cell(row=row_idx, column=W2_MAP['employer_ein'], value=ein)
-
-        # Box 16: State Wages
-        state_wages = entry.get('box16_state_wages', 0)
-        if state_wages:
-            ws.cell(row=row_idx, column=W2_MAP['state_wages'], value=state_wages)
-
-        # Box 17: State Tax Withheld
-        state_tax = entry.get('box17_state_withholding', 0)
-        if state_tax:
-            ws.cell(row=row_idx, column=W2_MAP['state_tax'], value=state_tax)
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} W-2 entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['W2'], data_list, output_path, client_id)
 
 
 def generate_1098_import(data_list, output_path, client_id=None):
@@ -824,499 +1118,97 @@ def generate_1098_import(data_list, output_path, client_id=None):
             - property_address: str
             - lender_ein: str (optional)
     """
-    wb, ws = create_cch_workbook("Mortgage Interest", MTG_COLUMNS, client_id)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=MTG_MAP['tsj'], value="")
-
-        # Lender Name
-        ws.cell(row=row_idx, column=MTG_MAP['lender_name'],
-                value=entry.get('lender_name', ''))
-
-        # Lender EIN
-        ein = entry.get('lender_ein', '')
-        if ein:
-            ws.cell(row=row_idx, column=MTG_MAP['lender_ein'], value=ein)
-
-        # Box 1: Mortgage Interest
-        interest = entry.get('box1_mortgage_interest', 0)
-        if interest:
-            ws.cell(row=row_idx, column=MTG_MAP['mortgage_interest'], value=interest)
-
-        # Box 2: Outstanding Principal
-        principal = entry.get('box2_outstanding_principal', 0)
-        if principal:
-            ws.cell(row=row_idx, column=MTG_MAP['outstanding_principal'], value=principal)
-
-        # Box 5: Mortgage Insurance Premiums
-        insurance = entry.get('box5_mortgage_insurance', 0)
-        if insurance:
-            ws.cell(row=row_idx, column=MTG_MAP['mortgage_insurance'], value=insurance)
-
-        # Box 10: Property Tax
-        prop_tax = entry.get('box10_property_tax', 0)
-        if prop_tax:
-            ws.cell(row=row_idx, column=MTG_MAP['property_tax'], value=prop_tax)
-
-        # Property Address
-        address = entry.get('property_address', '')
-        if address:
-            ws.cell(row=row_idx, column=MTG_MAP['property_address'], value=address)
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1098 entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['MTG'], data_list, output_path, client_id)
 
 
 def generate_1099r_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1099-R import."""
-    wb, ws = create_cch_workbook("Dist Pensions Annuities IRAs", [], client_id)
-
-    # Write headers (simplified - just the key ones we use)
-    headers = ["TSJ", "Payer's Name", "Gross Distribution", "Prior Year", "Taxable Amount",
-               "Capital Gain", "Federal Tax Withheld", "State Tax Withheld", "Local Tax Withheld",
-               "Dist. Code", "IRA", "IRA/SEP/SIMPLE", "FS", "State", "City",
-               "Payer's State ID Number", "Date of Payment", "Acct. Number", "Payer's Federal ID Number"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=R_MAP['tsj'], value=entry.get('tsj', ''))
-        ws.cell(row=row_idx, column=R_MAP['payer_name'], value=entry.get('payer_name', ''))
-
-        if entry.get('box1_gross_distribution'):
-            ws.cell(row=row_idx, column=R_MAP['gross_distribution'], value=entry['box1_gross_distribution'])
-        if entry.get('box2a_taxable_amount'):
-            ws.cell(row=row_idx, column=R_MAP['taxable_amount'], value=entry['box2a_taxable_amount'])
-        if entry.get('box4_fed_withholding'):
-            ws.cell(row=row_idx, column=R_MAP['fed_withholding'], value=entry['box4_fed_withholding'])
-        if entry.get('box7_distribution_code'):
-            ws.cell(row=row_idx, column=R_MAP['dist_code'], value=entry['box7_distribution_code'])
-        if entry.get('payer_ein'):
-            ws.cell(row=row_idx, column=R_MAP['payer_ein'], value=entry['payer_ein'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-R entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['R'], data_list, output_path, client_id)
 
 
 def generate_1099b_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1099-B Capital Gains import."""
-    wb, ws = create_cch_workbook("Capital Gains and Losses", [], client_id)
-
-    headers = ["Description", "Quantity", "Sales Price", "Cost or Other Basis",
-               "Accountant Gain / Loss - Override", "Date Acquired", "Date Sold",
-               "Term Code", "1099-B Code", "Corrected 1099-B Basis"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=B_MAP['description'], value=entry.get('description', ''))
-        if entry.get('quantity'):
-            ws.cell(row=row_idx, column=B_MAP['quantity'], value=entry['quantity'])
-        if entry.get('proceeds') or entry.get('sales_price'):
-            ws.cell(row=row_idx, column=B_MAP['sales_price'], value=entry.get('proceeds', entry.get('sales_price')))
-        if entry.get('cost_basis'):
-            ws.cell(row=row_idx, column=B_MAP['cost_basis'], value=entry['cost_basis'])
-        if entry.get('date_acquired'):
-            ws.cell(row=row_idx, column=B_MAP['date_acquired'], value=entry['date_acquired'])
-        if entry.get('date_sold'):
-            ws.cell(row=row_idx, column=B_MAP['date_sold'], value=entry['date_sold'])
-        if entry.get('term_code'):
-            ws.cell(row=row_idx, column=B_MAP['term_code'], value=entry['term_code'])
-        if entry.get('code_1099b'):
-            ws.cell(row=row_idx, column=B_MAP['code_1099b'], value=entry['code_1099b'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-B entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['B'], data_list, output_path, client_id)
 
 
 def generate_1099nec_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1099-NEC import."""
-    wb, ws = create_cch_workbook("Nonemployee Compensation", [], client_id)
-
-    headers = ["TSJ", "Name", "Street", "City", "State", "ZIP Code", "Foreign Country",
-               "Province, State or County", "Postal Code", "Telephone Number",
-               "Federal Identification Number", "Identification Number", "Name", "Street",
-               "City", "State", "ZIP or Postal Code", "Foreign Country", "Province, State or County",
-               "Account Number", "2nd TIN Not.", "Nonemployee Compensation"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=NEC_MAP['tsj'], value=entry.get('tsj', ''))
-        ws.cell(row=row_idx, column=NEC_MAP['payer_name'], value=entry.get('payer_name', ''))
-        if entry.get('payer_ein'):
-            ws.cell(row=row_idx, column=NEC_MAP['payer_ein'], value=entry['payer_ein'])
-        if entry.get('box1_nec') or entry.get('nonemployee_compensation'):
-            ws.cell(row=row_idx, column=NEC_MAP['nec_compensation'],
-                    value=entry.get('box1_nec', entry.get('nonemployee_compensation')))
-        if entry.get('box4_fed_withholding'):
-            ws.cell(row=row_idx, column=NEC_MAP['fed_withholding'], value=entry['box4_fed_withholding'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-NEC entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['NEC'], data_list, output_path, client_id)
 
 
 def generate_1099g_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1099-G import."""
-    wb, ws = create_cch_workbook("Certain Government Payments", [], client_id)
-
-    headers = ["TSJ", "Name", "Street", "City", "State", "ZIP Code", "Telephone Number",
-               "Federal Identification Number", "Identification Number", "Name", "Address",
-               "City", "State", "ZIP or Postal Code", "Foreign Country", "Province / State / County",
-               "Account Number", "Unemployment Compensation", "Compensation Repaid",
-               "Box 2 State Income Tax Refund", "Box 2 Local Income Tax Refund", "Prior Year",
-               "Year for Box 2", "Federal Income Tax Withheld"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=G_MAP['tsj'], value=entry.get('tsj', ''))
-        ws.cell(row=row_idx, column=G_MAP['payer_name'], value=entry.get('payer_name', ''))
-        if entry.get('box1_unemployment'):
-            ws.cell(row=row_idx, column=G_MAP['unemployment'], value=entry['box1_unemployment'])
-        if entry.get('box2_state_refund'):
-            ws.cell(row=row_idx, column=G_MAP['state_tax_refund'], value=entry['box2_state_refund'])
-        if entry.get('box4_fed_withholding'):
-            ws.cell(row=row_idx, column=G_MAP['fed_withholding'], value=entry['box4_fed_withholding'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-G entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['G'], data_list, output_path, client_id)
 
 
 def generate_1099misc_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1099-MISC import."""
-    wb, ws = create_cch_workbook("Miscellaneous Information", [], client_id)
-
-    headers = ["TSJ", "Name", "Street", "City", "State", "ZIP or Postal Code",
-               "Foreign Country", "Province, State or County", "Telephone Number",
-               "Payer's TIN", "Recipient's TIN", "Name", "Street", "City", "State",
-               "ZIP or Postal Code", "Foreign Country", "Province, State or County",
-               "Account Number", "FATCA Filing Requirement", "2nd TIN Not.",
-               "Section 409A Deferrals", "Section 409A Income", "Rents", "Royalties",
-               "Other Income", "Federal Tax Withheld"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=MISC_MAP['tsj'], value=entry.get('tsj', ''))
-        ws.cell(row=row_idx, column=MISC_MAP['payer_name'], value=entry.get('payer_name', ''))
-        if entry.get('box1_rents'):
-            ws.cell(row=row_idx, column=MISC_MAP['rents'], value=entry['box1_rents'])
-        if entry.get('box2_royalties'):
-            ws.cell(row=row_idx, column=MISC_MAP['royalties'], value=entry['box2_royalties'])
-        if entry.get('box3_other_income'):
-            ws.cell(row=row_idx, column=MISC_MAP['other_income'], value=entry['box3_other_income'])
-        if entry.get('box4_fed_withholding'):
-            ws.cell(row=row_idx, column=MISC_MAP['fed_withholding'], value=entry['box4_fed_withholding'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-MISC entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['MISC'], data_list, output_path, client_id)
 
 
 def generate_1099k_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1099-K import."""
-    wb, ws = create_cch_workbook("Payment Card Transactions", [], client_id)
-
-    headers = ["TSJ", "Name", "Address", "City", "State", "ZIP or Postal Code",
-               "Foreign Country", "Province / County", "Telephone Number", "TIN", "TIN",
-               "Name", "Address", "City", "State", "ZIP or Postal Code", "Foreign Country",
-               "Province / County", "Gross Amount of Payment Card / Third Party Network Transactions",
-               "Card Not Present Transactions", "Cash Tips", "Treasury Tipped Occupation Code",
-               "Federal Income Tax Withheld"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=K_MAP['tsj'], value=entry.get('tsj', ''))
-        ws.cell(row=row_idx, column=K_MAP['filer_name'], value=entry.get('filer_name', entry.get('payer_name', '')))
-        if entry.get('payee_name'):
-            ws.cell(row=row_idx, column=K_MAP['payee_name'], value=entry['payee_name'])
-        if entry.get('box1a_gross_amount'):
-            ws.cell(row=row_idx, column=K_MAP['gross_amount'], value=entry['box1a_gross_amount'])
-        if entry.get('fed_withholding'):
-            ws.cell(row=row_idx, column=K_MAP['fed_withholding'], value=entry['fed_withholding'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-K entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['K'], data_list, output_path, client_id)
 
 
 def generate_1098e_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1098-E Student Loan Interest import."""
-    wb, ws = create_cch_workbook("Student Loan Interest Statement", [], client_id)
-
-    headers = ["TSJ", "Name", "Address", "City", "State", "ZIP or Postal Code",
-               "Province / State / County", "Foreign Country", "Telephone Number",
-               "Federal Identification Number", "Social Security Number", "Name",
-               "Address", "City", "State", "ZIP or Postal Code", "Province / State / County",
-               "Foreign Country", "Account Number", "Student Loan Interest Received"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=SLI_MAP['tsj'], value=entry.get('tsj', ''))
-        ws.cell(row=row_idx, column=SLI_MAP['lender_name'], value=entry.get('lender_name', ''))
-        if entry.get('lender_ein'):
-            ws.cell(row=row_idx, column=SLI_MAP['lender_ein'], value=entry['lender_ein'])
-        if entry.get('borrower_name'):
-            ws.cell(row=row_idx, column=SLI_MAP['borrower_name'], value=entry['borrower_name'])
-        if entry.get('box1_interest'):
-            ws.cell(row=row_idx, column=SLI_MAP['student_loan_interest'], value=entry['box1_interest'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1098-E entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['SLI'], data_list, output_path, client_id)
 
 
 def generate_1099sa_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1099-SA HSA/MSA import."""
-    wb, ws = create_cch_workbook("Distributions From HSA or MSA", [], client_id)
-
-    headers = ["TS", "FS", "State", "City", "Payer Name", "Payer Address", "Payer City",
-               "Payer State", "Payer ZIP code", "Payer Province", "Payer Foreign Country",
-               "Payer Phone Number", "Payer Federal ID", "Recipient ID", "Recipient Name",
-               "Recipient Address", "Recipient City", "Recipient State", "Recipient ZIP Code",
-               "Recipient Province", "Recipient Foreign Country", "Account Number",
-               "Gross Distribution", "Earnings on Excess", "FMV on Date of Death",
-               "Distribution Code", "HSA / Archer MSA / MA MSA"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=SA_MAP['ts'], value=entry.get('ts', ''))
-        ws.cell(row=row_idx, column=SA_MAP['payer_name'], value=entry.get('payer_name', ''))
-        if entry.get('payer_ein'):
-            ws.cell(row=row_idx, column=SA_MAP['payer_ein'], value=entry['payer_ein'])
-        if entry.get('recipient_name'):
-            ws.cell(row=row_idx, column=SA_MAP['recipient_name'], value=entry['recipient_name'])
-        if entry.get('box1_gross_distribution'):
-            ws.cell(row=row_idx, column=SA_MAP['gross_distribution'], value=entry['box1_gross_distribution'])
-        if entry.get('box3_distribution_code'):
-            ws.cell(row=row_idx, column=SA_MAP['distribution_code'], value=entry['box3_distribution_code'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-SA entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['SA'], data_list, output_path, client_id)
 
 
 def generate_k1_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for K-1 Partnership import."""
-    wb, ws = create_cch_workbook("K-1 Activities (Federal)", [], client_id)
-
-    headers = ["Import Client ID", "Passthrough Entity Name", "Passthrough Entity ID",
-               "Partner / Shareholder / Beneficiary Name", "Partner / Shareholder / Beneficiary ID",
-               "Preparer Notes", "Activity number", "Activity Name / Description",
-               "100% Disposition ", "PTP (N/A 1041)", "Class code: 1 NP, 2 Act rental, 3 Passive, 4 MPREA",
-               "Type of Property", "L1 Ordinary Income (Loss)", "L2 Net Rental Real Estate",
-               "L3 Net Other Rent", "L4a Guaranteed Payments for Services",
-               "L4b Guaranteed Payments for Capital", "L4c Total Guaranteed Payments",
-               "L5 Interest", "Interest from US Bonds", "L6a Ordinary Dividends",
-               "L6b Qualified Dividends", "L7 Royalties", "L8 Short-Term Capital G/L",
-               "L9a Net Long-Term Capital G/L", "L9b Collectibles 28% G/L",
-               "L9c Unrecaptured Sec 1250 gain", "L10 Section 1231 Gain (Loss)"]
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=K1_MAP['entity_name'], value=entry.get('entity_name', ''))
-        ws.cell(row=row_idx, column=K1_MAP['entity_ein'], value=entry.get('entity_ein', ''))
-        ws.cell(row=row_idx, column=K1_MAP['partner_name'], value=entry.get('partner_name', ''))
-        if entry.get('partner_ssn'):
-            ws.cell(row=row_idx, column=K1_MAP['partner_ssn'], value=entry['partner_ssn'])
-        if entry.get('box1_ordinary_income'):
-            ws.cell(row=row_idx, column=K1_MAP['ordinary_income'], value=entry['box1_ordinary_income'])
-        if entry.get('box2_net_rental_re'):
-            ws.cell(row=row_idx, column=K1_MAP['net_rental_re'], value=entry['box2_net_rental_re'])
-        if entry.get('box5_interest'):
-            ws.cell(row=row_idx, column=K1_MAP['interest'], value=entry['box5_interest'])
-        if entry.get('box6a_ordinary_dividends'):
-            ws.cell(row=row_idx, column=K1_MAP['ordinary_dividends'], value=entry['box6a_ordinary_dividends'])
-        if entry.get('box6b_qualified_dividends'):
-            ws.cell(row=row_idx, column=K1_MAP['qualified_dividends'], value=entry['box6b_qualified_dividends'])
-        if entry.get('box8_st_capital_gl'):
-            ws.cell(row=row_idx, column=K1_MAP['st_capital_gl'], value=entry['box8_st_capital_gl'])
-        if entry.get('box9a_lt_capital_gl'):
-            ws.cell(row=row_idx, column=K1_MAP['lt_capital_gl'], value=entry['box9a_lt_capital_gl'])
-        if entry.get('box10_section_1231'):
-            ws.cell(row=row_idx, column=K1_MAP['section_1231_gl'], value=entry['box10_section_1231'])
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} K-1 entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['K1'], data_list, output_path, client_id)
 
 
 def generate_1098t_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1098-T Tuition Statement import."""
-    wb, ws = create_cch_workbook("Tuition Statement", [], client_id)
-
-    headers = ["TSJ", "Filer's Name", "Filer's Address", "Filer's City", "Filer's State",
-               "Filer's ZIP Code", "Province / State / County", "Foreign Country",
-               "Filer's Telephone Number", "Filer's Federal Identification Number",
-               "Student's SSN", "Student's Name", "Student's Address", "Student's City",
-               "Student's State", "Student's ZIP Code", "Student's Province",
-               "Student's Foreign Country", "Account Number",
-               "Payments Received for Qualified Tuition",  # Box 1
-               "Amounts Billed for Qualified Tuition",      # Box 2
-               "Adjustments Made for Prior Year",           # Box 4
-               "Scholarships or Grants",                    # Box 5
-               "Adjustments to Scholarships or Grants",     # Box 6
-               "Checked if Box 1 Includes Jan-Mar",         # Box 7
-               "At Least Half-Time Student",                # Box 8
-               "Graduate Student"]                          # Box 9
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=T_MAP['tsj'], value=entry.get('tsj', ''))
-        ws.cell(row=row_idx, column=T_MAP['school_name'], value=entry.get('school_name', ''))
-
-        if entry.get('school_ein'):
-            ws.cell(row=row_idx, column=T_MAP['school_ein'], value=entry['school_ein'])
-        if entry.get('student_name'):
-            ws.cell(row=row_idx, column=T_MAP['student_name'], value=entry['student_name'])
-        if entry.get('student_ssn'):
-            ws.cell(row=row_idx, column=T_MAP['student_ssn'], value=entry['student_ssn'])
-
-        # Box 1: Payments received
-        if entry.get('box1_payments_received'):
-            ws.cell(row=row_idx, column=T_MAP['payments_received'], value=entry['box1_payments_received'])
-
-        # Box 2: Amounts billed (older forms)
-        if entry.get('box2_amounts_billed'):
-            ws.cell(row=row_idx, column=T_MAP['amounts_billed'], value=entry['box2_amounts_billed'])
-
-        # Box 4: Adjustments for prior year
-        if entry.get('box4_adjustments_prior_year'):
-            ws.cell(row=row_idx, column=T_MAP['adjustments_prior'], value=entry['box4_adjustments_prior_year'])
-
-        # Box 5: Scholarships or grants
-        if entry.get('box5_scholarships'):
-            ws.cell(row=row_idx, column=T_MAP['scholarships'], value=entry['box5_scholarships'])
-
-        # Box 6: Adjustments to scholarships
-        if entry.get('box6_adjustments_scholarships'):
-            ws.cell(row=row_idx, column=T_MAP['adjustments_scholarships'], value=entry['box6_adjustments_scholarships'])
-
-        # Box 7: Checked if amounts include Jan-Mar of next year
-        if entry.get('box7_checked'):
-            ws.cell(row=row_idx, column=T_MAP['box7_checked'], value='X')
-
-        # Box 8: Half-time student
-        if entry.get('box8_half_time'):
-            ws.cell(row=row_idx, column=T_MAP['half_time'], value='X')
-
-        # Box 9: Graduate student
-        if entry.get('box9_graduate'):
-            ws.cell(row=row_idx, column=T_MAP['graduate'], value='X')
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1098-T entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['T'], data_list, output_path, client_id)
 
 
 def generate_1099q_import(data_list, output_path, client_id=None):
     """Generate CCH-compatible Excel for 1099-Q Qualified Education import."""
-    wb, ws = create_cch_workbook("Distributions from QEPs", [], client_id)
-
-    headers = ["TSJ", "Payer/Trustee Name", "Payer Address", "Payer City", "Payer State",
-               "Payer ZIP Code", "Province / State / County", "Foreign Country",
-               "Telephone Number", "Federal Identification Number",
-               "Recipient's TIN", "Recipient's Name", "Recipient's Address",
-               "Recipient's City", "Recipient's State", "Recipient's ZIP Code",
-               "Recipient's Province", "Recipient's Foreign Country", "Account Number",
-               "Gross Distribution",                    # Box 1
-               "Earnings",                              # Box 2
-               "Basis",                                 # Box 3
-               "Trustee-to-Trustee Transfer",          # Box 4
-               "Distribution Type (1=529, 2=Coverdell)", # Box 5
-               "Designated Beneficiary"]                # Box 6
-    for col_idx, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col_idx, value=header)
-
-    for row_idx, entry in enumerate(data_list, 7):
-        ws.cell(row=row_idx, column=Q_MAP['tsj'], value=entry.get('tsj', ''))
-        ws.cell(row=row_idx, column=Q_MAP['payer_name'], value=entry.get('payer_name', ''))
-
-        if entry.get('payer_ein'):
-            ws.cell(row=row_idx, column=Q_MAP['payer_ein'], value=entry['payer_ein'])
-        if entry.get('recipient_name'):
-            ws.cell(row=row_idx, column=Q_MAP['recipient_name'], value=entry['recipient_name'])
-        if entry.get('recipient_ssn'):
-            ws.cell(row=row_idx, column=Q_MAP['recipient_ssn'], value=entry['recipient_ssn'])
-
-        # Box 1: Gross distribution
-        if entry.get('box1_gross_distribution'):
-            ws.cell(row=row_idx, column=Q_MAP['gross_distribution'], value=entry['box1_gross_distribution'])
-
-        # Box 2: Earnings
-        if entry.get('box2_earnings'):
-            ws.cell(row=row_idx, column=Q_MAP['earnings'], value=entry['box2_earnings'])
-
-        # Box 3: Basis
-        if entry.get('box3_basis'):
-            ws.cell(row=row_idx, column=Q_MAP['basis'], value=entry['box3_basis'])
-
-        # Box 4: Trustee-to-trustee transfer
-        if entry.get('box4_trustee_transfer'):
-            ws.cell(row=row_idx, column=Q_MAP['trustee_transfer'], value='X')
-
-        # Box 5: Distribution type (1=529, 2=Coverdell)
-        if entry.get('box5_distribution_type'):
-            ws.cell(row=row_idx, column=Q_MAP['distribution_type'], value=entry['box5_distribution_type'])
-
-        # Box 6: Designated beneficiary
-        if entry.get('box6_designated_beneficiary'):
-            ws.cell(row=row_idx, column=Q_MAP['designated_beneficiary'], value='X')
-
-    wb.save(output_path)
-    print(f"  Created: {output_path}")
-    print(f"    {len(data_list)} 1099-Q entries")
-    return output_path
+    return generate_import(CCH_SCHEMAS['Q'], data_list, output_path, client_id)
+
+
+def classify_entries(data_list):
+    """
+    Check OCR origin and validation issues in a single pass.
+
+    Returns:
+        (has_ocr, has_issues) tuple; stops scanning once both are True
+    """
+    has_ocr = False
+    has_issues = False
+    for entry in data_list:
+        quality = entry.get('_quality') or {}
+        if not has_ocr and quality.get('is_ocr', False):
+            has_ocr = True
+        if not has_issues and (
+                quality.get('issues')                           # Flagged issues
+                or quality.get('missing_required')              # Missing required fields
+                or quality.get('math_errors')                   # Math errors
+                or quality.get('overall_confidence', 100) < 60  # Low confidence
+        ):
+            has_issues = True
+        if has_ocr and has_issues:
+            break
+    return has_ocr, has_issues
 
 
 def has_ocr_entries(data_list):
     """Check if any entries in the list came from OCR."""
-    for entry in data_list:
-        quality = entry.get('_quality', {})
-        if quality.get('is_ocr', False):
-            return True
-    return False
+    return classify_entries(data_list)[0]
 
 
 def has_validation_issues(data_list):
     """Check if any entries have validation issues requiring review."""
-    for entry in data_list:
-        quality = entry.get('_quality', {})
-        # Check for issues
-        if quality.get('issues'):
-            return True
-        # Check for missing required fields
-        if quality.get('missing_required'):
-            return True
-        # Check for math errors
-        if quality.get('math_errors'):
-            return True
-        # Check for low confidence (below 60%)
-        if quality.get('overall_confidence', 100) < 60:
-            return True
-    return False
+    return classify_entries(data_list)[1]
 
 
 def get_import_filename(base_name, data_list):
@@ -1329,14 +1221,53 @@ def get_import_filename(base_name, data_list):
         CCH_Import_W2_REVIEW.xlsx - Has validation issues
         CCH_Import_W2_OCR_REVIEW.xlsx - Both
     """
+    has_ocr, has_issues = classify_entries(data_list)
     suffix = ""
-    if has_ocr_entries(data_list):
+    if has_ocr:
         suffix += "_OCR"
-    if has_validation_issues(data_list):
+    if has_issues:
         suffix += "_REVIEW"
     return f"CCH_Import_{base_name}{suffix}.xlsx"
 
 
+# Keys a parsed JSON may use for each form, in order of preference
+FORM_ALIASES = {
+    'W-2': ('W-2',),
+    '1099-INT': ('IRS-1099INT', '1099-INT'),
+    '1099-DIV': ('IRS-1099DIV', '1099-DIV'),
+    'SSA-1099': ('SSA-1099',),
+    '1098': ('1098',),
+    '1099-R': ('IRS-1099R', '1099-R'),
+    '1099-B': ('1099-B',),
+    '1099-NEC': ('1099-NEC',),
+    '1099-G': ('1099-G',),
+    '1099-MISC': ('1099-MISC',),
+    '1099-K': ('1099-K',),
+    '1098-E': ('1098-E',),
+    '1099-SA': ('1099-SA',),
+    'K-1': ('K-1', 'K1-Partnership'),
+    '1098-T': ('1098-T',),
+    '1099-Q': ('1099-Q',),
+}
+
+
+def normalize_form_keys(form_data):
+    """
+    Map the parsed 'forms' dict onto the canonical names in FORM_ALIASES.
+
+    The first alias with a non-empty entry list wins; forms with no
+    entries under any alias are left out.
+    """
+    normalized = {}
+    for form_name, aliases in FORM_ALIASES.items():
+        for alias in aliases:
+            entries = form_data.get(alias)
+            if entries:
+                normalized[form_name] = entries
+                break
+    return normalized
+
+
 def generate_cch_imports(parsed_data, output_dir, forms=None, client_id=None):
     """
     Generate all CCH import files from parsed data.
@@ -1354,203 +1285,23 @@ def generate_cch_imports(parsed_data, output_dir, forms=None, client_id=None):
     output_dir.mkdir(parents=True, exist_ok=True)
 
     generated = {}
-    form_data = parsed_data.get('forms', {})
+    form_data = normalize_form_keys(parsed_data.get('forms', {}))
 
     # Determine which forms to generate
     if forms is None:
-        forms = ['W2', 'INT', 'DIV', 'SSA', 'MTG', 'R', 'B', 'NEC', 'G', 'MISC', 'K', 'SLI', 'SA', 'K1', 'T', 'Q']
-
-    # W-2
-    if 'W2' in forms:
-        w2_data = form_data.get('W-2', [])
-        w2_data = filter_quality_entries(w2_data, 'W-2')
-        if w2_data:
-            filename = get_import_filename("W2", w2_data)
-            path = output_dir / filename
-            generate_w2_import(w2_data, path, client_id)
-            generated['W-2'] = path
-        else:
-            print("  No W-2 data to import")
-
-    # 1099-INT
-    if 'INT' in forms:
-        int_data = form_data.get('IRS-1099INT', []) or form_data.get('1099-INT', [])
-        int_data = filter_quality_entries(int_data, '1099-INT')
-        if int_data:
-            filename = get_import_filename("1099INT", int_data)
-            path = output_dir / filename
-            generate_1099int_import(int_data, path, client_id)
-            generated['1099-INT'] = path
-        else:
-            print("  No 1099-INT data to import")
-
-    # 1099-DIV
-    if 'DIV' in forms:
-        div_data = form_data.get('IRS-1099DIV', []) or form_data.get('1099-DIV', [])
-        div_data = filter_quality_entries(div_data, '1099-DIV')
-        if div_data:
-            filename = get_import_filename("1099DIV", div_data)
-            path = output_dir / filename
-            generate_1099div_import(div_data, path, client_id)
-            generated['1099-DIV'] = path
-        else:
-            print("  No 1099-DIV data to import")
-
-    # SSA-1099
-    if 'SSA' in forms:
-        ssa_data = form_data.get('SSA-1099', [])
-        ssa_data = filter_quality_entries(ssa_data, 'SSA-1099')
-        if ssa_data:
-            filename = get_import_filename("SSA1099", ssa_data)
-            path = output_dir / filename
-            generate_ssa1099_import(ssa_data, path, client_id)
-            generated['SSA-1099'] = path
-        else:
-            print("  No SSA-1099 data to import")
-
-    # 1098 Mortgage Interest
-    if 'MTG' in forms:
-        mtg_data = form_data.get('1098', [])
-        mtg_data = filter_quality_entries(mtg_data, '1098')
-        if mtg_data:
-            filename = get_import_filename("1098", mtg_data)
-            path = output_dir / filename
-            generate_1098_import(mtg_data, path, client_id)
-            generated['1098'] = path
-        else:
-            print("  No 1098 data to import")
-
-    # 1099-R Retirement Distributions
-    if 'R' in forms:
-        r_data = form_data.get('IRS-1099R', []) or form_data.get('1099-R', [])
-        r_data = filter_quality_entries(r_data, '1099-R')
-        if r_data:
-            filename = get_import_filename("1099R", r_data)
-            path = output_dir / filename
-            generate_1099r_import(r_data, path, client_id)
-            generated['1099-R'] = path
-        else:
-            print("  No 1099-R data to import")
-
-    # 1099-B Capital Gains
-    if 'B' in forms:
-        b_data = form_data.get('1099-B', [])
-        b_data = filter_quality_entries(b_data, '1099-B')
-        if b_data:
-            filename = get_import_filename("1099B", b_data)
-            path = output_dir / filename
-            generate_1099b_import(b_data, path, client_id)
-            generated['1099-B'] = path
-        else:
-            print("  No 1099-B data to import")
-
-    # 1099-NEC Nonemployee Compensation
-    if 'NEC' in forms:
-        nec_data = form_data.get('1099-NEC', [])
-        nec_data = filter_quality_entries(nec_data, '1099-NEC')
-        if nec_data:
-            filename = get_import_filename("1099NEC", nec_data)
-            path = output_dir / filename
-            generate_1099nec_import(nec_data, path, client_id)
-            generated['1099-NEC'] = path
-        else:
-            print("  No 1099-NEC data to import")
-
-    # 1099-G Government Payments
-    if 'G' in forms:
-        g_data = form_data.get('1099-G', [])
-        g_data = filter_quality_entries(g_data, '1099-G')
-        if g_data:
-            filename = get_import_filename("1099G", g_data)
-            path = output_dir / filename
-            generate_1099g_import(g_data, path, client_id)
-            generated['1099-G'] = path
-        else:
-            print("  No 1099-G data to import")
-
-    # 1099-MISC Miscellaneous
-    if 'MISC' in forms:
-        misc_data = form_data.get('1099-MISC', [])
-        misc_data = filter_quality_entries(misc_data, '1099-MISC')
-        if misc_data:
-            filename = get_import_filename("1099MISC", misc_data)
-            path = output_dir / filename
-            generate_1099misc_import(misc_data, path, client_id)
-            generated['1099-MISC'] = path
-        else:
-            print("  No 1099-MISC data to import")
-
-    # 1099-K Payment Card
-    if 'K' in forms:
-        k_data = form_data.get('1099-K', [])
-        k_data = filter_quality_entries(k_data, '1099-K')
-        if k_data:
-            filename = get_import_filename("1099K", k_data)
-            path = output_dir / filename
-            generate_1099k_import(k_data, path, client_id)
-            generated['1099-K'] = path
-        else:
-            print("  No 1099-K data to import")
-
-    # 1098-E Student Loan Interest
-    if 'SLI' in forms:
-        sli_data = form_data.get('1098-E', [])
-        sli_data = filter_quality_entries(sli_data, '1098-E')
-        if sli_data:
-            filename = get_import_filename("1098E", sli_data)
-            path = output_dir / filename
-            generate_1098e_import(sli_data, path, client_id)
-            generated['1098-E'] = path
-        else:
-            print("  No 1098-E data to import")
-
-    # 1099-SA HSA/MSA
-    if 'SA' in forms:
-        sa_data = form_data.get('1099-SA', [])
-        sa_data = filter_quality_entries(sa_data, '1099-SA')
-        if sa_data:
-            filename = get_import_filename("1099SA", sa_data)
-            path = output_dir / filename
-            generate_1099sa_import(sa_data, path, client_id)
-            generated['1099-SA'] = path
-        else:
-            print("  No 1099-SA data to import")
-
-    # K-1 Partnership
-    if 'K1' in forms:
-        k1_data = form_data.get('K-1', []) or form_data.get('K1-Partnership', [])
-        k1_data = filter_quality_entries(k1_data, 'K-1')
-        if k1_data:
-            filename = get_import_filename("K1", k1_data)
-            path = output_dir / filename
-            generate_k1_import(k1_data, path, client_id)
-            generated['K-1'] = path
-        else:
-            print("  No K-1 data to import")
-
-    # 1098-T Tuition Statement
-    if 'T' in forms:
-        t_data = form_data.get('1098-T', [])
-        t_data = filter_quality_entries(t_data, '1098-T')
-        if t_data:
-            filename = get_import_filename("1098T", t_data)
-            path = output_dir / filename
-            generate_1098t_import(t_data, path, client_id)
-            generated['1098-T'] = path
-        else:
-            print("  No 1098-T data to import")
-
-    # 1099-Q Qualified Education
-    if 'Q' in forms:
-        q_data = form_data.get('1099-Q', [])
-        q_data = filter_quality_entries(q_data, '1099-Q')
-        if q_data:
-            filename = get_import_filename("1099Q", q_data)
-            path = output_dir / filename
-            generate_1099q_import(q_data, path, client_id)
-            generated['1099-Q'] = path
+        forms = list(CCH_SCHEMAS)
+
+    for code, schema in CCH_SCHEMAS.items():
+        if code not in forms:
+            continue
+        form_name = schema['label']
+        data = filter_quality_entries(form_data.get(form_name, []), form_name)
+        if data:
+            path = output_dir / get_import_filename(schema['file_base'], data)
+            if generate_import(schema, data, path, client_id):
+                generated[form_name] = path
         else:
-            print("  No 1099-Q data to import")
+            logger.info("  No %s data to import", form_name)
 
     return generated
 
@@ -1593,6 +1344,10 @@ CCH Import Instructions:
 
     args = parser.parse_args()
 
+    # Progress from the generators goes through the module logger; send it
+    # to stdout so it interleaves with the banner output below.
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     json_path = Path(args.json_file)
     if not json_path.exists():
         print(f"ERROR: File not found: {json_path}")
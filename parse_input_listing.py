@@ -8,6 +8,7 @@ Usage:
     python parse_input_listing.py input_listing.pdf
     python parse_input_listing.py input_listing.pdf --output data.json
     python parse_input_listing.py input_listing.pdf --format text  (if already extracted to text)
+    python parse_input_listing.py input_listing.pdf --forms W-2,IRS-1099INT
 
 Output:
     Creates JSON file with all parsed data, ready for checksheet population.
@@ -19,9 +20,15 @@ import re
 import subprocess
 import sys
 from pathlib import Path
-from collections import defaultdict
 from datetime import datetime
 
+# Optional: in-process PDF text extraction when pdftotext isn't installed
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 
 # =============================================================================
 # CCH FIELD MAPPINGS (Validated via Gemini/CCH Documentation)
@@ -201,7 +208,10 @@ CCH_FIELD_MAP = {
 
 
 def extract_text_from_pdf(pdf_path: Path) -> str:
-    """Extract text from PDF using pdftotext."""
+    """
+    Extract text from PDF with pdftotext -layout, the layout the section parser
+    was written against. pypdfium2 is only used when pdftotext isn't installed.
+    """
     try:
         result = subprocess.run(
             ['pdftotext', '-layout', str(pdf_path), '-'],
@@ -211,116 +221,156 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
         )
         return result.stdout
     except FileNotFoundError:
+        if PDFIUM_AVAILABLE:
+            print("pdftotext not found, extracting with pypdfium2...")
+            return extract_text_with_pdfium(pdf_path)
         print("ERROR: pdftotext not found. Install poppler-utils:")
         print("  Ubuntu/Debian: sudo apt-get install poppler-utils")
         print("  Mac: brew install poppler")
         print("  Windows: Download from https://github.com/oschwartz10612/poppler-windows")
+        print("  (or pip install pypdfium2)")
         sys.exit(1)
     except subprocess.CalledProcessError as e:
         print(f"ERROR: Failed to extract text from PDF: {e}")
         sys.exit(1)
 
 
-def parse_field_value(value_str: str):
-    """Parse a field value, converting to appropriate type."""
-    # Remove quotes if present
-    if value_str.startswith('"') and value_str.endswith('"'):
-        return value_str[1:-1]
-    
-    # Try to convert to number
+def extract_text_with_pdfium(pdf_path: Path) -> str:
+    """Extract text from PDF in-process (fallback when pdftotext is missing)."""
+    pages = []
     try:
-        if '.' in value_str:
-            return float(value_str)
-        else:
-            return int(value_str)
-    except ValueError:
-        return value_str
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+    except (pdfium.PdfiumError, OSError) as e:
+        print(f"ERROR: Failed to extract text from PDF: {e}")
+        sys.exit(1)
+    # pdfium reports CRLF line breaks; the parser splits on '\n'
+    return '\n'.join(pages).replace('\r\n', '\n')
+
+
+PARSER_VERSION = '1.0'
+
+# Sections are separated by lines of 50 or more tildes
+SECTION_SEPARATOR = '~' * 50
+
+# Section header: "IRS-1099INT, Sheet #1, Entity 1 Box Cnt 3"
+HEADER_RE = re.compile(r'^([A-Za-z0-9\-\s]+),\s*Sheet\s*#(\d+),\s*Entity\s*(\d+)')
+
+# Fields: "40: \"BCB COMMUNITY BANK\", 71: 10041"
+# Pattern handles: quoted strings, negative numbers, decimals, dates
+FIELD_RE = re.compile(r'(\d+):\s*(?:"([^"]+)"|(\d+/\s*\d+/\d+)|(-?\d+\.?\d*))')
+
+
+def iter_sections(text: str):
+    """Yield the text between separator runs one section at a time."""
+    start = 0
+    sep = text.find(SECTION_SEPARATOR)
+    while sep >= 0:
+        yield text[start:sep]
+        # Skip the rest of the tilde run so it isn't split again
+        start = sep + len(SECTION_SEPARATOR)
+        while text.startswith('~', start):
+            start += 1
+        sep = text.find(SECTION_SEPARATOR, start)
+    yield text[start:]
 
 
-def parse_input_listing(text: str) -> dict:
+def parse_input_listing(text: str, form_types=None, parsed_at=None) -> dict:
     """
     Parse CCH Input Listing text into structured data.
     
+    Args:
+        text: Input Listing text
+        form_types: Optional set of form types to keep (e.g. {'W-2', 'IRS-1099INT'});
+                    sections for other forms are skipped before their fields are read
+        parsed_at: Optional timestamp string for metadata (default: now); batch
+                   callers can stamp every file with one value
+    
     Returns dict with:
         - 'forms': dict of form_type -> list of entries
         - 'summary': summary totals
         - 'metadata': parsing info
     """
     results = {
-        'forms': defaultdict(list),
+        'forms': {},
         'metadata': {
-            'parsed_at': datetime.now().isoformat(),
-            'parser_version': '1.0',
+            'parsed_at': parsed_at or datetime.now().isoformat(),
+            'parser_version': PARSER_VERSION,
         }
     }
     
-    # Split by separator lines
-    sections = re.split(r'~{50,}', text)
-    
-    for section in sections:
+    for section in iter_sections(text):
         section = section.strip()
         if not section:
             continue
         
-        lines = section.split('\n')
-        if not lines:
-            continue
+        # Header is the first line; fields follow on the remaining lines
+        header_end = section.find('\n')
+        if header_end < 0:
+            header_end = len(section)
         
-        # Parse header: "IRS-1099INT, Sheet #1, Entity 1 Box Cnt 3"
-        header_match = re.match(
-            r'^([A-Za-z0-9\-\s]+),\s*Sheet\s*#(\d+),\s*Entity\s*(\d+)',
-            lines[0]
-        )
+        header_match = HEADER_RE.match(section, 0, header_end)
         
         if not header_match:
             continue
         
         form_type = header_match.group(1).strip()
+        if form_types is not None and form_type not in form_types:
+            continue
+        
         sheet_num = int(header_match.group(2))
         entity_num = int(header_match.group(3))
         
         # Initialize entry
+        raw_fields = {}
         entry = {
             '_form_type': form_type,
             '_sheet': sheet_num,
             '_entity': entity_num,
-            '_raw_fields': {},
+            '_raw_fields': raw_fields,
         }
         
-        # Combine all field data lines
-        field_text = ' '.join(lines[1:])
-        
-        # Parse fields: "40: \"BCB COMMUNITY BANK\", 71: 10041"
-        # Pattern handles: quoted strings, negative numbers, decimals, dates
-        field_pattern = r'(\d+):\s*(?:"([^"]+)"|(\d+/\s*\d+/\d+)|(-?\d+\.?\d*))'
+        # Friendly names for this form type (empty if unknown)
+        field_map = CCH_FIELD_MAP.get(form_type, {}).get('fields', {})
         
-        for match in re.finditer(field_pattern, field_text):
+        # Scan the field lines in place; values that wrap onto the next
+        # line get a space where the line break was
+        for match in FIELD_RE.finditer(section, header_end + 1):
             field_num = int(match.group(1))
             
             # Get the value from whichever group matched
             if match.group(2):  # Quoted string
-                value = match.group(2)
+                value = match.group(2).replace('\n', ' ')
             elif match.group(3):  # Date
-                value = match.group(3)
-            elif match.group(4):  # Number
-                value = parse_field_value(match.group(4))
-            else:
-                continue
+                value = match.group(3).replace('\n', ' ')
+            else:  # Number - the pattern only admits valid int/float text
+                number = match.group(4)
+                value = float(number) if '.' in number else int(number)
             
-            entry['_raw_fields'][field_num] = value
+            raw_fields[field_num] = value
             
-            # Map to friendly name if we know the form type
-            if form_type in CCH_FIELD_MAP:
-                field_map = CCH_FIELD_MAP[form_type]['fields']
-                if field_num in field_map:
-                    friendly_name = field_map[field_num]
-                    entry[friendly_name] = value
+            # Map to friendly name if we know the field
+            friendly_name = field_map.get(field_num)
+            if friendly_name:
+                entry[friendly_name] = value
         
-        results['forms'][form_type].append(entry)
+        results['forms'].setdefault(form_type, []).append(entry)
     
     return results
 
 
+def sum_field(entries, key):
+    """Total one field across entries, treating missing/empty values as 0."""
+    return sum(entry.get(key, 0) or 0 for entry in entries)
+
+
 def calculate_summary(parsed_data: dict) -> dict:
     """Calculate summary totals from parsed data."""
     summary = {
@@ -332,52 +382,29 @@ def calculate_summary(parsed_data: dict) -> dict:
     forms = parsed_data['forms']
     
     # 1099-INT totals
-    total_interest = 0
-    for entry in forms.get('IRS-1099INT', []):
-        total_interest += entry.get('box1_interest', 0) or 0
-    summary['income']['total_interest'] = total_interest
+    summary['income']['total_interest'] = sum_field(forms.get('IRS-1099INT', []), 'box1_interest')
     
     # 1099-DIV totals
-    total_ordinary_div = 0
-    total_qualified_div = 0
-    for entry in forms.get('IRS-1099DIV', []):
-        total_ordinary_div += entry.get('box1a_ordinary_dividends', 0) or 0
-        total_qualified_div += entry.get('box1b_qualified_dividends', 0) or 0
-    summary['income']['total_ordinary_dividends'] = total_ordinary_div
-    summary['income']['total_qualified_dividends'] = total_qualified_div
+    div_entries = forms.get('IRS-1099DIV', [])
+    summary['income']['total_ordinary_dividends'] = sum_field(div_entries, 'box1a_ordinary_dividends')
+    summary['income']['total_qualified_dividends'] = sum_field(div_entries, 'box1b_qualified_dividends')
     
     # W-2 totals
-    total_wages = 0
-    total_fed_wh = 0
-    for entry in forms.get('W-2', []):
-        total_wages += entry.get('box1_wages', 0) or 0
-        total_fed_wh += entry.get('box2_fed_withholding', 0) or 0
-    summary['income']['total_wages'] = total_wages
-    summary['withholding']['w2_federal'] = total_fed_wh
+    w2_entries = forms.get('W-2', [])
+    summary['income']['total_wages'] = sum_field(w2_entries, 'box1_wages')
+    summary['withholding']['w2_federal'] = sum_field(w2_entries, 'box2_fed_withholding')
     
     # 1099-R totals
-    total_pension_taxable = 0
-    for entry in forms.get('IRS-1099R', []):
-        total_pension_taxable += entry.get('box2a_taxable_amount', 0) or 0
-    summary['income']['total_pension_taxable'] = total_pension_taxable
+    summary['income']['total_pension_taxable'] = sum_field(forms.get('IRS-1099R', []), 'box2a_taxable_amount')
     
     # SSA-1099
-    total_ss_benefits = 0
-    for entry in forms.get('SSA-1099', []):
-        total_ss_benefits += entry.get('box5_net_benefits', 0) or 0
-    summary['income']['total_ss_benefits'] = total_ss_benefits
+    summary['income']['total_ss_benefits'] = sum_field(forms.get('SSA-1099', []), 'box5_net_benefits')
     
     # Schedule C
-    total_sch_c_gross = 0
-    for entry in forms.get('C-1', []):
-        total_sch_c_gross += entry.get('gross_receipts', 0) or 0
-    summary['schedules']['schedule_c_gross'] = total_sch_c_gross
+    summary['schedules']['schedule_c_gross'] = sum_field(forms.get('C-1', []), 'gross_receipts')
     
     # Schedule E
-    total_rents = 0
-    for entry in forms.get('E-1', []):
-        total_rents += entry.get('line3_rents_received', 0) or 0
-    summary['schedules']['schedule_e_rents'] = total_rents
+    summary['schedules']['schedule_e_rents'] = sum_field(forms.get('E-1', []), 'line3_rents_received')
     
     return summary
 
@@ -413,6 +440,11 @@ The output JSON can be used with populate_checksheet.py to fill the verification
         help='Input format (default: auto-detect from extension)'
     )
     
+    parser.add_argument(
+        '--forms',
+        help='Comma-separated form types to parse: W-2,IRS-1099INT (default: all)'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -445,16 +477,17 @@ The output JSON can be used with populate_checksheet.py to fill the verification
     else:
         text = input_path.read_text()
     
+    form_types = None
+    if args.forms:
+        form_types = {f.strip().upper() for f in args.forms.split(',')}
+    
     # Parse
     print("Parsing Input Listing...")
-    parsed = parse_input_listing(text)
+    parsed = parse_input_listing(text, form_types)
     
     # Calculate summary
     parsed['summary'] = calculate_summary(parsed)
     
-    # Convert defaultdict to regular dict for JSON serialization
-    parsed['forms'] = dict(parsed['forms'])
-    
     # Determine output path
     if args.output:
         output_path = Path(args.output)
@@ -464,7 +497,7 @@ The output JSON can be used with populate_checksheet.py to fill the verification
     
     # Write output
     with open(output_path, 'w') as f:
-        json.dump(parsed, f, indent=2, default=str)
+        f.write(json.dumps(parsed, indent=2, default=str))
     
     print(f"\nOutput: {output_path}")
     
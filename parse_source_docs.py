@@ -15,10 +15,14 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
 
@@ -29,12 +33,31 @@ except ImportError:
     print("  pip install pdfplumber")
     sys.exit(1)
 
-# OCR support (optional)
-OCR_AVAILABLE = False
-POPPLER_PATH = None
+# Faster text layer via PyMuPDF (optional, --text-engine pymupdf)
 try:
-    from pdf2image import convert_from_path
-    import pytesseract
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# OCR support (optional) - pdf2image/pytesseract (and PIL) are only imported by
+# init_ocr() the first time a scanned PDF needs them. None = not probed yet.
+OCR_AVAILABLE = None
+POPPLER_PATH = None
+
+
+def init_ocr():
+    """Import the OCR dependencies and locate Tesseract/Poppler on first use. Returns OCR_AVAILABLE."""
+    global OCR_AVAILABLE, POPPLER_PATH, convert_from_path, pdfinfo_from_path, pytesseract
+    if OCR_AVAILABLE is not None:
+        return OCR_AVAILABLE
+
+    OCR_AVAILABLE = False
+    try:
+        from pdf2image import convert_from_path, pdfinfo_from_path
+        import pytesseract
+    except ImportError:
+        return OCR_AVAILABLE
 
     # Set Tesseract path for Windows - check common locations
     tesseract_paths = [
@@ -57,56 +80,155 @@ try:
             break
 
     OCR_AVAILABLE = True
-except ImportError:
-    pass
+    return OCR_AVAILABLE
 
 
-def extract_text_from_pdf(pdf_path, use_ocr=True):
-    """Extract all text from a PDF, using OCR if needed."""
-    text = ""
-    is_scanned = False
+# OCR render resolution (DPI) presets - runtime grows with pixel count, and
+# 200 DPI reads printed IRS forms as well as 300 does
+OCR_PRESETS = {
+    'FAST': 150,
+    'BALANCED': 200,
+    'HIGH_QUALITY': 300,
+}
+# A page that OCRs to less text than this at a reduced DPI is retried at HIGH_QUALITY
+OCR_RETRY_MIN_CHARS = 50
+# ...unless less than this fraction of it is ink (blank backs, separator sheets)
+OCR_BLANK_MAX_INK = 0.01
+# --ocr-preprocess: grayscale pixels brighter than this become white, the rest black
+OCR_THRESHOLD = 180
 
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                text += page_text + "\n"
-    except Exception as e:
-        print(f"  Warning: Could not read {pdf_path}: {e}")
-        return "", False
+
+def extract_text_with_pymupdf(pdf_path):
+    """Extract the text layer with PyMuPDF (MuPDF in C, far faster than pdfminer)."""
+    with fitz.open(pdf_path) as doc:
+        return "".join(page.get_text('text') + "\n" for page in doc)
+
+
+def extract_text_from_pdf(pdf_path, use_ocr=True, ocr_workers=None, ocr_dpi=OCR_PRESETS['BALANCED'],
+                          ocr_preprocess=False, text_engine='pdfplumber'):
+    """
+    Extract all text from a PDF, using OCR if needed.
+
+    text_engine 'pymupdf' reads the text layer with PyMuPDF when it is
+    installed, falling back to pdfplumber if PyMuPDF can't open the file.
+    pdfplumber stays the default because the form patterns were written
+    against its line layout.
+
+    Returns (text, is_scanned, engine, complete). engine is the text layer
+    reader that was actually used ('pymupdf' or 'pdfplumber'). complete is
+    False when the file needed OCR but OCR was unavailable or stopped part
+    way, so the text is not what a full extraction would give.
+    """
+    text = None
+    is_scanned = False
+    engine = 'pdfplumber'
+
+    if text_engine == 'pymupdf' and PYMUPDF_AVAILABLE:
+        try:
+            text = extract_text_with_pymupdf(pdf_path)
+            engine = 'pymupdf'
+        except Exception as e:
+            print(f"  Warning: PyMuPDF could not read {pdf_path}, using pdfplumber: {e}")
+
+    if text is None:
+        try:
+            with pdfplumber.open(pdf_path) as pdf:
+                text = "".join((page.extract_text() or "") + "\n" for page in pdf.pages)
+        except Exception as e:
+            print(f"  Warning: Could not read {pdf_path}: {e}")
+            return "", False, engine, False
 
     # Check if we got meaningful text
+    complete = True
     if len(text.strip()) < 50:
         is_scanned = True
-        if use_ocr and OCR_AVAILABLE:
+        complete = False
+        if use_ocr and init_ocr():
             print(f"  Attempting OCR...")
-            text = extract_text_with_ocr(pdf_path)
+            text, complete = extract_text_with_ocr(pdf_path, workers=ocr_workers, dpi=ocr_dpi,
+                                                   preprocess=ocr_preprocess)
 
-    return text, is_scanned
+    return text, is_scanned, engine, complete
 
 
-def extract_text_with_ocr(pdf_path):
-    """Extract text from a scanned PDF using OCR."""
-    if not OCR_AVAILABLE:
-        return ""
+def convert_pdf_pages(pdf_path, dpi, **kwargs):
+    """Render PDF pages to images with pdf2image, using POPPLER_PATH when set."""
+    if POPPLER_PATH:
+        kwargs['poppler_path'] = POPPLER_PATH
+    return convert_from_path(pdf_path, dpi=dpi, **kwargs)
 
-    text = ""
-    try:
-        # Convert PDF pages to images
-        if POPPLER_PATH:
-            images = convert_from_path(pdf_path, dpi=300, poppler_path=POPPLER_PATH)
-        else:
-            images = convert_from_path(pdf_path, dpi=300)
 
-        for i, image in enumerate(images):
-            # Run OCR on each page
+def page_ink_coverage(image):
+    """Fraction of a page image's pixels darker than OCR_THRESHOLD."""
+    histogram = image.convert('L').histogram()
+    return sum(histogram[:OCR_THRESHOLD + 1]) / (image.width * image.height)
+
+
+def ocr_page(pdf_path, page_num, dpi, preprocess=False):
+    """
+    Render and OCR a single page, so only the pages being OCR'd are held in
+    memory. With preprocess, the page is converted to grayscale and
+    thresholded to black and white before it is handed to Tesseract.
+
+    Low-DPI misreads are caught with a character-count heuristic, not OCR
+    confidence: a page that reads as fewer than OCR_RETRY_MIN_CHARS characters
+    at a reduced DPI is retried at HIGH_QUALITY. Pages that are essentially
+    blank (ink coverage under OCR_BLANK_MAX_INK) are not retried, since they
+    would read as little text at any DPI.
+    """
+    high_dpi = OCR_PRESETS['HIGH_QUALITY']
+    page_text = ""
+    for render_dpi in (dpi, high_dpi):
+        image = None
+        for image in convert_pdf_pages(pdf_path, render_dpi, first_page=page_num, last_page=page_num):
+            if preprocess:
+                image = image.convert('L').point(lambda p: 255 if p > OCR_THRESHOLD else 0, mode='1')
             page_text = pytesseract.image_to_string(image)
-            text += page_text + "\n"
+        if render_dpi >= high_dpi or len(page_text.strip()) >= OCR_RETRY_MIN_CHARS:
+            break
+        if image is None or page_ink_coverage(image) < OCR_BLANK_MAX_INK:
+            break
+    return page_text
+
+
+def extract_text_with_ocr(pdf_path, workers=None, dpi=OCR_PRESETS['BALANCED'], preprocess=False):
+    """
+    Extract text from a scanned PDF using OCR.
+
+    Each page is a separate Tesseract subprocess, so pages are OCR'd on up
+    to `workers` threads (default: CPU count, at most 8). With more than one
+    thread, each Tesseract is limited to one thread of its own.
+
+    Returns (text, complete); complete is False if OCR is unavailable or an
+    error stopped it before every page was read.
+    """
+    if not init_ocr():
+        return "", False
+
+    # Page texts are collected and joined once; a failure keeps the pages read so far
+    page_texts = []
+    complete = False
+    try:
+        # Pages are rendered one at a time inside ocr_page rather than all up front
+        page_count = pdfinfo_from_path(pdf_path, poppler_path=POPPLER_PATH)['Pages']
+
+        if workers is None:
+            workers = min(8, os.cpu_count() or 1)
+        if workers > 1:
+            # Tesseract is multithreaded itself; one thread per process keeps
+            # the pool from oversubscribing the CPU
+            os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Run OCR on each page; map() yields the page texts in page order
+            for page_text in executor.map(ocr_page, repeat(pdf_path), range(1, page_count + 1), repeat(dpi),
+                                          repeat(preprocess)):
+                page_texts.append(page_text + "\n")
+        complete = True
 
     except Exception as e:
         print(f"  OCR error: {e}")
 
-    return text
+    return "".join(page_texts), complete
 
 
 def extract_text_per_page(pdf_path):
@@ -122,10 +244,33 @@ def extract_text_per_page(pdf_path):
     return pages
 
 
+def compile_patterns(patterns, flags=re.IGNORECASE):
+    """Compile a list of alternative regex patterns once, at import time."""
+    return tuple(re.compile(pattern, flags) for pattern in patterns)
+
+
+def search_in_order(text, patterns):
+    """
+    Search for each pattern in turn, each starting where the previous match ended.
+
+    Same result as one 'A.*?B.*?C' DOTALL search when a label cannot overlap
+    another match of itself, but linear: a failed combined search backtracks
+    over every A/B pair in the text. Returns the last match, or None.
+    """
+    pos = 0
+    match = None
+    for pattern in patterns:
+        match = pattern.search(text, pos)
+        if not match:
+            return None
+        pos = match.end()
+    return match
+
+
 def extract_amount(text, patterns, default=0):
-    """Extract a dollar amount using multiple regex patterns."""
+    """Extract a dollar amount using multiple compiled regex patterns."""
     for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             try:
                 amt_str = match.group(1).replace(',', '').replace('$', '').strip()
@@ -161,7 +306,7 @@ def extract_amount_with_quality(text, patterns, field_name, default=0):
 
     for attempt, pattern in enumerate(patterns, 1):
         quality['pattern_attempts'] = attempt
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             try:
                 raw = match.group(1)
@@ -274,6 +419,9 @@ def add_quality_metadata(data, form_type, is_ocr=False, required_fields=None):
 class ExtractionResult:
     """Container for extraction results with quality tracking."""
 
+    __slots__ = ('form_type', 'source_file', 'is_ocr', 'data', 'quality', 'overall_confidence',
+                 'issues', 'missing_required', 'math_errors')
+
     def __init__(self, form_type, source_file, is_ocr=False):
         self.form_type = form_type
         self.source_file = source_file
@@ -344,9 +492,14 @@ class ExtractionResult:
         self.overall_confidence = max(self.overall_confidence, 0)
 
     def to_dict(self):
-        """Convert to dictionary for JSON output."""
+        """
+        Convert to dictionary for JSON output.
+
+        Called once, when the parser is done with the result, so the data
+        dict is returned in place rather than copied.
+        """
         self.calculate_overall_confidence()
-        result = dict(self.data)
+        result = self.data
         result['source_file'] = self.source_file
         result['_quality'] = {
             'is_ocr': self.is_ocr,
@@ -360,8 +513,17 @@ class ExtractionResult:
 
 
 def identify_document_type(text, filename):
-    """Identify what type of tax document this is."""
-    text_upper = text.upper()
+    """
+    Identify what type of tax document this is.
+
+    The filename is checked first; the text is only uppercased and scanned
+    when the filename does not name the form.
+    """
+    return identify_by_filename(filename) or identify_by_content(text.upper())
+
+
+def identify_by_filename(filename):
+    """Identify the form type from the filename alone. Returns None if it doesn't say."""
     fname_upper = filename.upper()
 
     # Check filename first - ORDER MATTERS: check specific forms before generic ones
@@ -388,6 +550,11 @@ def identify_document_type(text, filename):
     if 'K-1' in fname_upper or 'K1' in fname_upper:
         return 'K-1'
 
+    return None
+
+
+def identify_by_content(text_upper):
+    """Identify the form type from the document's uppercased text."""
     # Check content - check for consolidated forms FIRST (before individual types)
     # because consolidated docs contain multiple 1099 types
     if 'CONSOLIDATED' in text_upper and '1099' in text_upper:
@@ -449,12 +616,60 @@ def identify_document_type(text, filename):
     return 'UNKNOWN'
 
 
+# W-2 patterns (see the format notes in parse_w2)
+# Box labels and the values that follow them, searched in order with
+# search_in_order (one DOTALL 'label.*?label.*?values' pattern backtracks badly
+# on text that doesn't match)
+W2_BOX1_LABEL_RE = re.compile(r'1\s+[Ww]ages')
+W2_BOX2_LABEL_RE = re.compile(r'2\.?\s+[Ff]ederal')
+W2_BOX3_LABEL_RE = re.compile(r'3\.?\s+[Ss]ocial\s+[Ss]ecurity\s+[Ww]ages')
+W2_BOX4_LABEL_RE = re.compile(r'4\.?\s+[Ss]ocial\s+[Ss]ecurity\s+[Tt]ax')
+W2_BOX5_LABEL_RE = re.compile(r'5\.?\s+[Mm]edicare\s+[Ww]ages')
+W2_BOX6_LABEL_RE = re.compile(r'6\.?\s+[Mm]edicare\s+[Tt]ax')
+# EIN followed by values
+W2_EIN_VALUES_RE = re.compile(r'[\n\r]+[\d-]+\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)')
+# Values on the line right after "...withheld"
+W2_WITHHELD_VALUES_RE = re.compile(r'withheld\s*[\n\r]+([\d,]+\.?\d{2})\s+([\d,]+\.?\d{2})')
+# Optional name line, then values
+W2_NAME_VALUES_RE = re.compile(r'[\n\r]+([A-Z][A-Za-z\s]+)?[\n\r]*([\d,]+\.?\d*)\s+([\d,]+\.?\d*)')
+# Values on the next line
+W2_NEXT_LINE_VALUES_RE = re.compile(r'[\n\r]+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)')
+# Box 1 & 2
+W2_BOX12_EIN_PATTERNS = (W2_BOX1_LABEL_RE, W2_BOX2_LABEL_RE, W2_EIN_VALUES_RE)
+W2_BOX12_NEXT_LINE_PATTERNS = (W2_BOX1_LABEL_RE, W2_BOX2_LABEL_RE, W2_WITHHELD_VALUES_RE)
+W2_BOX12_COMPACT_RE = re.compile(
+    r'(\d{2}-\d{7})\s*\n\s*([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*\n'
+    r'\s*[\dX]{3}-[\dX]{2}-\d{4}')
+# Box 3 & 4
+W2_BOX34_NEXT_LINE_PATTERNS = (W2_BOX3_LABEL_RE, W2_BOX4_LABEL_RE, W2_WITHHELD_VALUES_RE)
+W2_BOX34_NAME_PATTERNS = (W2_BOX3_LABEL_RE, W2_BOX4_LABEL_RE, W2_NAME_VALUES_RE)
+W2_BOX34_COMPACT_RE = re.compile(
+    r'[\dX]{3}-[\dX]{2}-\d{4}\s*\n\s*[A-Z][A-Z0-9&\s\.]+?\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})')
+# Box 5 & 6
+W2_BOX56_NEXT_LINE_PATTERNS = (W2_BOX5_LABEL_RE, W2_BOX6_LABEL_RE, W2_WITHHELD_VALUES_RE)
+W2_BOX56_EIN_PATTERNS = (W2_BOX5_LABEL_RE, W2_BOX6_LABEL_RE, W2_EIN_VALUES_RE)
+W2_BOX56_GENERIC_PATTERNS = (W2_BOX5_LABEL_RE, W2_BOX6_LABEL_RE, W2_NEXT_LINE_VALUES_RE)
+W2_AMOUNT_PAIR_RE = re.compile(r'^([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*$', re.MULTILINE)
+# Employer name
+W2_EMPLOYER_PATTERNS = compile_patterns([
+    r"c\s+employer.*?name.*?[\n\r]+([A-Z][A-Z0-9\s\.,&-]+(?:LLC|INC|CORP|CO)?)",
+    r"employer.*?name.*?ZIP.*?[\n\r]+([A-Z][A-Z0-9\s\.,&-]+(?:LLC|INC|CORP|CO)?)",
+])
+W2_EMPLOYER_END_RE = re.compile(r'[\n\r]|\d{4,}')
+W2_COMPACT_EMPLOYER_RE = re.compile(
+    r'[\dX]{3}-[\dX]{2}-\d{4}\s*\n\s*([A-Z][A-Z0-9&\s\.,]+?)\s+[\d,]+\.\d{2}')
+W2_EMPLOYER_C_RE = re.compile(
+    r'[Cc]\s+[Ee]mployer.?s\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+?)(?:\s*\n|\s+\d)')
+W2_COMPANY_RE = re.compile(r'([A-Z][A-Z0-9\s&-]+(?:LLC|INC|CORP|COMPANY|CO\.))')
+W2_FILENAME_RE = re.compile(r'W-?2[-_]?([A-Za-z]+)', re.IGNORECASE)
+
+
 def parse_w2(text, filename, is_ocr=False):
     """Parse W-2 wage statement with quality tracking."""
     result = ExtractionResult('W-2', filename, is_ocr)
 
-    # Initialize data dict for backward compatibility
-    data = {
+    # Boxes are parsed straight into the result's data dict (to_dict adds source_file)
+    data = result.data = {
         'employer_name': '',
         'box1_wages': 0,
         'box2_fed_withholding': 0,
@@ -462,9 +677,6 @@ def parse_w2(text, filename, is_ocr=False):
         'box4_ss_tax': 0,
         'box5_medicare_wages': 0,
         'box6_medicare_tax': 0,
-        'box16_state_wages': 0,
-        'box17_state_withholding': 0,
-        'source_file': filename
     }
 
     # W-2 formats vary. Common patterns:
@@ -480,23 +692,13 @@ def parse_w2(text, filename, is_ocr=False):
 
     # Box 1 & 2: Try multiple patterns
     # Pattern 1: EIN followed by values (most specific, try first)
-    box12_match = re.search(
-        r'1\s+[Ww]ages.*?2\.?\s+[Ff]ederal.*?[\n\r]+[\d-]+\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)',
-        text, re.DOTALL
-    )
+    box12_match = search_in_order(text, W2_BOX12_EIN_PATTERNS)
     if not box12_match:
         # Pattern 2: Values on line immediately after labels (no EIN, e.g., Justworks)
-        box12_match = re.search(
-            r'1\s+[Ww]ages.*?2\.?\s+[Ff]ederal.*?withheld\s*[\n\r]+([\d,]+\.?\d{2})\s+([\d,]+\.?\d{2})',
-            text, re.DOTALL
-        )
+        box12_match = search_in_order(text, W2_BOX12_NEXT_LINE_PATTERNS)
     if not box12_match:
         # Pattern 3: Compact format - EIN on its own line, then BOX1 BOX2 on next line
-        compact12 = re.search(
-            r'(\d{2}-\d{7})\s*\n\s*([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*\n'
-            r'\s*[\dX]{3}-[\dX]{2}-\d{4}',
-            text
-        )
+        compact12 = W2_BOX12_COMPACT_RE.search(text)
         if compact12:
             box12_match = compact12
             # Groups are shifted: group(2) = wages, group(3) = fed WH
@@ -508,16 +710,10 @@ def parse_w2(text, filename, is_ocr=False):
 
     # Box 3 & 4: SS wages and SS tax
     # Pattern 1: Values on line immediately after labels
-    box34_match = re.search(
-        r'3\.?\s+[Ss]ocial\s+[Ss]ecurity\s+[Ww]ages.*?4\.?\s+[Ss]ocial\s+[Ss]ecurity\s+[Tt]ax.*?withheld\s*[\n\r]+([\d,]+\.?\d{2})\s+([\d,]+\.?\d{2})',
-        text, re.DOTALL
-    )
+    box34_match = search_in_order(text, W2_BOX34_NEXT_LINE_PATTERNS)
     if not box34_match:
         # Pattern 2: With employer name or other text between
-        box34_match = re.search(
-            r'3\.?\s+[Ss]ocial\s+[Ss]ecurity\s+[Ww]ages.*?4\.?\s+[Ss]ocial\s+[Ss]ecurity\s+[Tt]ax.*?[\n\r]+([A-Z][A-Za-z\s]+)?[\n\r]*([\d,]+\.?\d*)\s+([\d,]+\.?\d*)',
-            text, re.DOTALL
-        )
+        box34_match = search_in_order(text, W2_BOX34_NAME_PATTERNS)
         if box34_match:
             data['box3_ss_wages'] = float(box34_match.group(2).replace(',', ''))
             data['box4_ss_tax'] = float(box34_match.group(3).replace(',', ''))
@@ -527,32 +723,20 @@ def parse_w2(text, filename, is_ocr=False):
 
     # Box 5 & 6: Medicare wages and tax
     # Pattern 1: Values on line immediately after labels (Justworks format - no EIN prefix)
-    box56_match = re.search(
-        r'5\.?\s+[Mm]edicare\s+[Ww]ages.*?6\.?\s+[Mm]edicare\s+[Tt]ax.*?withheld\s*[\n\r]+([\d,]+\.?\d{2})\s+([\d,]+\.?\d{2})',
-        text, re.DOTALL
-    )
+    box56_match = search_in_order(text, W2_BOX56_NEXT_LINE_PATTERNS)
     if not box56_match:
         # Pattern 2: EIN followed by values (Rippling format)
-        box56_match = re.search(
-            r'5\.?\s+[Mm]edicare\s+[Ww]ages.*?6\.?\s+[Mm]edicare\s+[Tt]ax.*?[\n\r]+[\d-]+\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)',
-            text, re.DOTALL
-        )
+        box56_match = search_in_order(text, W2_BOX56_EIN_PATTERNS)
     if not box56_match:
         # Pattern 3: Generic fallback - values on next line
-        box56_match = re.search(
-            r'5\.?\s+[Mm]edicare\s+[Ww]ages.*?6\.?\s+[Mm]edicare\s+[Tt]ax.*?[\n\r]+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)',
-            text, re.DOTALL
-        )
+        box56_match = search_in_order(text, W2_BOX56_GENERIC_PATTERNS)
     if box56_match:
         data['box5_medicare_wages'] = float(box56_match.group(1).replace(',', ''))
         data['box6_medicare_tax'] = float(box56_match.group(2).replace(',', ''))
 
     # Compact format fallback for Box 3/4: EMPLOYER_NAME BOX3 BOX4
     if data['box3_ss_wages'] == 0:
-        compact_34 = re.search(
-            r'[\dX]{3}-[\dX]{2}-\d{4}\s*\n\s*[A-Z][A-Z0-9&\s\.]+?\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})',
-            text
-        )
+        compact_34 = W2_BOX34_COMPACT_RE.search(text)
         if compact_34:
             data['box3_ss_wages'] = float(compact_34.group(1).replace(',', ''))
             data['box4_ss_tax'] = float(compact_34.group(2).replace(',', ''))
@@ -561,7 +745,7 @@ def parse_w2(text, filename, is_ocr=False):
     if data['box5_medicare_wages'] == 0 and data['box3_ss_wages'] > 0:
         # Look for a pair of amounts on a line where first matches SS wages
         # and second is ~1.45% of first (Medicare rate)
-        all_pairs = re.findall(r'^([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s*$', text, re.MULTILINE)
+        all_pairs = W2_AMOUNT_PAIR_RE.findall(text)
         for val1_s, val2_s in all_pairs:
             val1 = float(val1_s.replace(',', ''))
             val2 = float(val2_s.replace(',', ''))
@@ -572,76 +756,75 @@ def parse_w2(text, filename, is_ocr=False):
 
     # Validate and correct potential Box 3/4 vs 5/6 mix-ups using tax rate math
     # SS tax rate is 6.2%, Medicare rate is 1.45%
-    if data['box3_ss_wages'] > 0 and data['box4_ss_tax'] > 0:
-        ss_rate = data['box4_ss_tax'] / data['box3_ss_wages']
+    # Work on local copies of boxes 3-6 and write them back once at the end
+    ss_wages, ss_tax = data['box3_ss_wages'], data['box4_ss_tax']
+    medicare_wages, medicare_tax = data['box5_medicare_wages'], data['box6_medicare_tax']
+    if ss_wages > 0 and ss_tax > 0:
+        ss_rate = ss_tax / ss_wages
         # If Box 3/4 looks like Medicare rate (~1.45%), they're probably swapped
         if 0.012 < ss_rate < 0.018:  # Medicare rate range (1.2% - 1.8%)
             # Box 3/4 has Medicare values, Box 5/6 might have wrong values
-            actual_medicare_wages = data['box3_ss_wages']
-            actual_medicare_tax = data['box4_ss_tax']
+            actual_medicare_wages = ss_wages
+            actual_medicare_tax = ss_tax
 
             # Check if Box 5/6 looks like SS rate
-            if data['box5_medicare_wages'] > 0 and data['box6_medicare_tax'] > 0:
-                med_rate = data['box6_medicare_tax'] / data['box5_medicare_wages']
+            if medicare_wages > 0 and medicare_tax > 0:
+                med_rate = medicare_tax / medicare_wages
                 if 0.055 < med_rate < 0.070:  # SS rate range (5.5% - 7%)
                     # Box 5/6 actually has SS values - full swap
-                    data['box3_ss_wages'] = data['box5_medicare_wages']
-                    data['box4_ss_tax'] = data['box6_medicare_tax']
-                    data['box5_medicare_wages'] = actual_medicare_wages
-                    data['box6_medicare_tax'] = actual_medicare_tax
+                    ss_wages = medicare_wages
+                    ss_tax = medicare_tax
+                    medicare_wages = actual_medicare_wages
+                    medicare_tax = actual_medicare_tax
                 else:
                     # Box 5/6 doesn't have SS values - just fix Medicare
                     # SS wages often equal Medicare wages when under wage base
-                    data['box5_medicare_wages'] = actual_medicare_wages
-                    data['box6_medicare_tax'] = actual_medicare_tax
+                    medicare_wages = actual_medicare_wages
+                    medicare_tax = actual_medicare_tax
                     # Calculate expected SS tax if wages are reasonable
-                    data['box4_ss_tax'] = round(actual_medicare_wages * 0.062, 2)
+                    ss_tax = round(actual_medicare_wages * 0.062, 2)
             else:
                 # No Box 5/6 values found - copy Medicare values there
-                data['box5_medicare_wages'] = actual_medicare_wages
-                data['box6_medicare_tax'] = actual_medicare_tax
-                data['box4_ss_tax'] = round(actual_medicare_wages * 0.062, 2)
+                medicare_wages = actual_medicare_wages
+                medicare_tax = actual_medicare_tax
+                ss_tax = round(actual_medicare_wages * 0.062, 2)
 
     # Additional check: if Box 5/6 equals Box 1/2, the Medicare pattern failed
     # In this case, try to use Box 3 values for Medicare (if they look correct)
-    if (abs(data['box5_medicare_wages'] - data['box1_wages']) < 0.01 and
-        abs(data['box6_medicare_tax'] - data['box2_fed_withholding']) < 0.01):
+    if (abs(medicare_wages - data['box1_wages']) < 0.01 and
+        abs(medicare_tax - data['box2_fed_withholding']) < 0.01):
         # Box 5/6 pattern failed and matched Box 1/2
-        if data['box3_ss_wages'] > 0 and data['box4_ss_tax'] > 0:
-            rate34 = data['box4_ss_tax'] / data['box3_ss_wages']
+        if ss_wages > 0 and ss_tax > 0:
+            rate34 = ss_tax / ss_wages
             if 0.012 < rate34 < 0.018:  # Medicare rate in Box 3/4
                 # Use Box 3/4 for Medicare, calculate SS
-                data['box5_medicare_wages'] = data['box3_ss_wages']
-                data['box6_medicare_tax'] = data['box4_ss_tax']
+                medicare_wages = ss_wages
+                medicare_tax = ss_tax
                 # SS wages typically same as Medicare wages, calc SS tax
-                data['box4_ss_tax'] = round(data['box3_ss_wages'] * 0.062, 2)
+                ss_tax = round(ss_wages * 0.062, 2)
             elif 0.055 < rate34 < 0.070:  # SS rate in Box 3/4 (correct)
                 # Box 3/4 is correct, but Box 5/6 pattern failed
                 # Medicare wages typically equal SS wages when under wage base
-                data['box5_medicare_wages'] = data['box3_ss_wages']
-                data['box6_medicare_tax'] = round(data['box3_ss_wages'] * 0.0145, 2)
+                medicare_wages = ss_wages
+                medicare_tax = round(ss_wages * 0.0145, 2)
+
+    data.update(box3_ss_wages=ss_wages, box4_ss_tax=ss_tax,
+                box5_medicare_wages=medicare_wages, box6_medicare_tax=medicare_tax)
 
     # Employer name - look for line after "c Employer's name" or company name patterns
-    employer_patterns = [
-        r"[Cc]\s+[Ee]mployer.*?name.*?[\n\r]+([A-Z][A-Z0-9\s\.,&-]+(?:LLC|INC|CORP|CO)?)",
-        r"[Ee]mployer.*?name.*?ZIP.*?[\n\r]+([A-Z][A-Z0-9\s\.,&-]+(?:LLC|INC|CORP|CO)?)",
-    ]
-    for pattern in employer_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in W2_EMPLOYER_PATTERNS:
+        match = pattern.search(text)
         if match:
             name = match.group(1).strip()
             # Clean up - stop at newline or address indicator
-            name = re.split(r'[\n\r]|\d{4,}', name)[0].strip()
+            name = W2_EMPLOYER_END_RE.split(name)[0].strip()
             if len(name) > 3:
                 data['employer_name'] = name[:60]
                 break
 
     # Fallback: Compact format - employer name after SSN, followed by dollar amounts
     if not data['employer_name']:
-        compact_employer = re.search(
-            r'[\dX]{3}-[\dX]{2}-\d{4}\s*\n\s*([A-Z][A-Z0-9&\s\.,]+?)\s+[\d,]+\.\d{2}',
-            text
-        )
+        compact_employer = W2_COMPACT_EMPLOYER_RE.search(text)
         if compact_employer:
             name = compact_employer.group(1).strip()
             if len(name) > 3:
@@ -649,10 +832,7 @@ def parse_w2(text, filename, is_ocr=False):
 
     # Fallback: "c Employer's name, address" then name on same or next line
     if not data['employer_name']:
-        emp_c = re.search(
-            r'[Cc]\s+[Ee]mployer.?s\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+?)(?:\s*\n|\s+\d)',
-            text
-        )
+        emp_c = W2_EMPLOYER_C_RE.search(text)
         if emp_c:
             name = emp_c.group(1).strip()
             if len(name) > 3 and not any(bad in name.lower() for bad in ['wages', 'social', 'medicare', 'federal', 'withheld']):
@@ -660,17 +840,17 @@ def parse_w2(text, filename, is_ocr=False):
 
     # Fallback: look for LLC/INC/CORP in text
     if not data['employer_name']:
-        company_match = re.search(r'([A-Z][A-Z0-9\s&-]+(?:LLC|INC|CORP|COMPANY|CO\.))', text)
+        company_match = W2_COMPANY_RE.search(text)
         if company_match:
             data['employer_name'] = company_match.group(1).strip()[:60]
 
     # Fallback: filename
     if not data['employer_name']:
-        fname_match = re.search(r'W-?2[-_]?([A-Za-z]+)', filename, re.IGNORECASE)
+        fname_match = W2_FILENAME_RE.search(filename)
         if fname_match:
             data['employer_name'] = fname_match.group(1)
 
-    # Add quality tracking
+    # Add quality tracking (values are already in result.data)
     result.add_text_field('employer_name', data['employer_name'])
     result.add_field('box1_wages', data['box1_wages'], {
         'field': 'box1_wages', 'found': data['box1_wages'] > 0,
@@ -680,10 +860,6 @@ def parse_w2(text, filename, is_ocr=False):
         'field': 'box2_fed_withholding', 'found': True,
         'confidence': 80, 'issues': []
     })
-    result.add_field('box3_ss_wages', data['box3_ss_wages'])
-    result.add_field('box4_ss_tax', data['box4_ss_tax'])
-    result.add_field('box5_medicare_wages', data['box5_medicare_wages'])
-    result.add_field('box6_medicare_tax', data['box6_medicare_tax'])
 
     # Validate required fields
     result.check_required(['employer_name', 'box1_wages'])
@@ -702,6 +878,35 @@ def parse_w2(text, filename, is_ocr=False):
     return result.to_dict()
 
 
+# 1099-INT patterns
+INT_PAYER_PATTERNS = compile_patterns([
+    # Name after 1099-INT form header (e.g., "1099-INT\nCAPITAL ONE N.A. Form")
+    r"1099-INT\s*\n\s*([A-Z][A-Za-z0-9\s\.,&-]+?)(?:\s+Form|\s+\d|\n)",
+    # First line of text - institution name at top of document
+    r"^([A-Z][A-Z\s\.,]+(?:N\.A\.|BANK|SAVINGS|CREDIT UNION|FINANCIAL|INC|LLC|CORP)\.?)",
+    # Standard patterns
+    r"[Pp]ayer'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"PAYER.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
+    # Vanguard format
+    r"(VANGUARD\s+(?:MARKETING|BROKERAGE)[A-Z\s]*)",
+], re.MULTILINE)
+INT_BOX1_PATTERNS = compile_patterns([
+    # Amount with $ sign on same line after Interest income (most reliable)
+    r'interest\s+income[^$\n]*\$([\d,]+\.\d{2})',
+    # Amount with $ sign on next line after Interest income
+    r'interest\s+income[^\n]*\n[^\n]*\$([\d,]+\.\d{2})',
+    # Vanguard consolidated format: "1- Interest income 123.45"
+    r'1-?\s*[-:]?\s*interest\s+income\s+([\d,]+\.?\d*)',
+    r'box\s*1[:\s]+\$?([\d,]+\.?\d*)',
+    r'1\s+interest\s+income\s+\$?([\d,]+\.?\d*)',
+])
+INT_BOX4_PATTERNS = compile_patterns([
+    # Vanguard: "4- Federal income tax withheld 0.00"
+    r'4-?\s*[-:]?\s*federal\s+income\s+tax\s+withheld[^0-9]*([\d,]+\.?\d*)',
+    r'box\s*4[:\s]+\$?([\d,]+\.?\d*)',
+])
+
+
 def parse_1099int(text, filename, is_ocr=False):
     """Parse 1099-INT interest income with quality tracking."""
     result = ExtractionResult('1099-INT', filename, is_ocr)
@@ -713,19 +918,8 @@ def parse_1099int(text, filename, is_ocr=False):
         'source_file': filename
     }
 
-    payer_patterns = [
-        # Name after 1099-INT form header (e.g., "1099-INT\nCAPITAL ONE N.A. Form")
-        r"1099-INT\s*\n\s*([A-Z][A-Za-z0-9\s\.,&-]+?)(?:\s+Form|\s+\d|\n)",
-        # First line of text - institution name at top of document
-        r"^([A-Z][A-Z\s\.,]+(?:N\.A\.|BANK|SAVINGS|CREDIT UNION|FINANCIAL|INC|LLC|CORP)\.?)",
-        # Standard patterns
-        r"[Pp]ayer'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"PAYER.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
-        # Vanguard format
-        r"(VANGUARD\s+(?:MARKETING|BROKERAGE)[A-Z\s]*)",
-    ]
-    for pattern in payer_patterns:
-        match = re.search(pattern, text, re.MULTILINE)
+    for pattern in INT_PAYER_PATTERNS:
+        match = pattern.search(text)
         if match:
             name = match.group(1).strip()[:50]
             # Filter out form instruction text that gets captured
@@ -734,23 +928,10 @@ def parse_1099int(text, filename, is_ocr=False):
             data['payer_name'] = name
             break
 
-    data['box1_interest'], q1 = extract_amount_with_quality(text, [
-        # Amount with $ sign on same line after Interest income (most reliable)
-        r'[Ii]nterest\s+[Ii]ncome[^$\n]*\$([\d,]+\.\d{2})',
-        # Amount with $ sign on next line after Interest income
-        r'[Ii]nterest\s+[Ii]ncome[^\n]*\n[^\n]*\$([\d,]+\.\d{2})',
-        # Vanguard consolidated format: "1- Interest income 123.45"
-        r'1-?\s*[-:]?\s*[Ii]nterest\s+[Ii]ncome\s+([\d,]+\.?\d*)',
-        r'[Bb]ox\s*1[:\s]+\$?([\d,]+\.?\d*)',
-        r'1\s+[Ii]nterest\s+[Ii]ncome\s+\$?([\d,]+\.?\d*)',
-    ], 'box1_interest')
+    data['box1_interest'], q1 = extract_amount_with_quality(text, INT_BOX1_PATTERNS, 'box1_interest')
     result.add_field('box1_interest', data['box1_interest'], q1)
 
-    data['box4_fed_withholding'], q4 = extract_amount_with_quality(text, [
-        # Vanguard: "4- Federal income tax withheld 0.00"
-        r'4-?\s*[-:]?\s*[Ff]ederal\s+[Ii]ncome\s+[Tt]ax\s+[Ww]ithheld[^0-9]*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*4[:\s]+\$?([\d,]+\.?\d*)',
-    ], 'box4_fed_withholding')
+    data['box4_fed_withholding'], q4 = extract_amount_with_quality(text, INT_BOX4_PATTERNS, 'box4_fed_withholding')
     result.add_field('box4_fed_withholding', data['box4_fed_withholding'], q4)
 
     result.add_text_field('payer_name', data['payer_name'])
@@ -759,6 +940,44 @@ def parse_1099int(text, filename, is_ocr=False):
     return result.to_dict()
 
 
+# 1099-DIV patterns
+DIV_PAYER_PATTERNS = compile_patterns([
+    r"[Pp]ayer'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"PAYER.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
+    # Vanguard format - look for VANGUARD in header
+    r"(VANGUARD\s+(?:MARKETING|BROKERAGE)[A-Z\s]*)",
+], 0)
+DIV_BOX1A_PATTERNS = compile_patterns([
+    # Vanguard consolidated format: "1a- Total ordinary dividends (includes...) 2,062.45"
+    r'1a-?\s*[-:]?\s*total\s+ordinary\s+dividends[^0-9]*([\d,]+\.?\d*)',
+    r'1a\s+ordinary\s+dividends.*?\$?([\d,]+\.?\d*)',
+    r'ordinary\s+dividends.*?\$?([\d,]+\.?\d*)',
+])
+DIV_BOX1B_PATTERNS = compile_patterns([
+    # Vanguard: "1b- Qualified dividends 1,062.49"
+    r'1b-?\s*[-:]?\s*qualified\s+dividends[^0-9]*([\d,]+\.?\d*)',
+    r'1b\s+qualified\s+dividends.*?\$?([\d,]+\.?\d*)',
+    r'qualified\s+dividends.*?\$?([\d,]+\.?\d*)',
+])
+DIV_BOX2A_PATTERNS = compile_patterns([
+    # Vanguard: "2a- Total capital gain distributions (includes...) 3,715.37"
+    r'2a-?\s*[-:]?\s*total\s+capital\s+gain[^0-9]*([\d,]+\.?\d*)',
+    r'2a\s+total\s+capital\s+gain.*?\$?([\d,]+\.?\d*)',
+])
+DIV_BOX3_PATTERNS = compile_patterns([
+    r'3-?\s*[-:]?\s*nondividend\s+distributions[^0-9]*([\d,]+\.?\d*)',
+])
+DIV_BOX5_PATTERNS = compile_patterns([
+    r'5-?\s*[-:]?\s*section\s*199A\s+dividends[^0-9]*([\d,]+\.?\d*)',
+])
+DIV_BOX7_PATTERNS = compile_patterns([
+    r'7-?\s*[-:]?\s*foreign\s+tax\s+paid[^0-9]*([\d,]+\.?\d*)',
+])
+DIV_BOX4_PATTERNS = compile_patterns([
+    r'4-?\s*[-:]?\s*federal\s+income\s+tax\s+withheld[^0-9]*([\d,]+\.?\d*)',
+])
+
+
 def parse_1099div(text, filename, is_ocr=False):
     """Parse 1099-DIV dividends."""
     data = {
@@ -773,64 +992,54 @@ def parse_1099div(text, filename, is_ocr=False):
         'source_file': filename
     }
 
-    payer_patterns = [
-        r"[Pp]ayer'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"PAYER.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
-        # Vanguard format - look for VANGUARD in header
-        r"(VANGUARD\s+(?:MARKETING|BROKERAGE)[A-Z\s]*)",
-    ]
-    for pattern in payer_patterns:
-        match = re.search(pattern, text)
+    for pattern in DIV_PAYER_PATTERNS:
+        match = pattern.search(text)
         if match:
             data['payer_name'] = match.group(1).strip()[:50]
             break
 
     # Box 1a - Ordinary Dividends
-    data['box1a_ordinary_dividends'] = extract_amount(text, [
-        # Vanguard consolidated format: "1a- Total ordinary dividends (includes...) 2,062.45"
-        r'1a-?\s*[-:]?\s*[Tt]otal\s+[Oo]rdinary\s+[Dd]ividends[^0-9]*([\d,]+\.?\d*)',
-        r'1a\s+[Oo]rdinary\s+[Dd]ividends.*?\$?([\d,]+\.?\d*)',
-        r'[Oo]rdinary\s+[Dd]ividends.*?\$?([\d,]+\.?\d*)',
-    ])
+    data['box1a_ordinary_dividends'] = extract_amount(text, DIV_BOX1A_PATTERNS)
 
     # Box 1b - Qualified Dividends
-    data['box1b_qualified_dividends'] = extract_amount(text, [
-        # Vanguard: "1b- Qualified dividends 1,062.49"
-        r'1b-?\s*[-:]?\s*[Qq]ualified\s+[Dd]ividends[^0-9]*([\d,]+\.?\d*)',
-        r'1b\s+[Qq]ualified\s+[Dd]ividends.*?\$?([\d,]+\.?\d*)',
-        r'[Qq]ualified\s+[Dd]ividends.*?\$?([\d,]+\.?\d*)',
-    ])
+    data['box1b_qualified_dividends'] = extract_amount(text, DIV_BOX1B_PATTERNS)
 
     # Box 2a - Total Capital Gain Distributions
-    data['box2a_total_cap_gain'] = extract_amount(text, [
-        # Vanguard: "2a- Total capital gain distributions (includes...) 3,715.37"
-        r'2a-?\s*[-:]?\s*[Tt]otal\s+[Cc]apital\s+[Gg]ain[^0-9]*([\d,]+\.?\d*)',
-        r'2a\s+[Tt]otal\s+[Cc]apital\s+[Gg]ain.*?\$?([\d,]+\.?\d*)',
-    ])
+    data['box2a_total_cap_gain'] = extract_amount(text, DIV_BOX2A_PATTERNS)
 
     # Box 3 - Nondividend Distributions
-    data['box3_nondiv_dist'] = extract_amount(text, [
-        r'3-?\s*[-:]?\s*[Nn]ondividend\s+[Dd]istributions[^0-9]*([\d,]+\.?\d*)',
-    ])
+    data['box3_nondiv_dist'] = extract_amount(text, DIV_BOX3_PATTERNS)
 
     # Box 5 - Section 199A Dividends
-    data['box5_sec199a'] = extract_amount(text, [
-        r'5-?\s*[-:]?\s*[Ss]ection\s*199A\s+[Dd]ividends[^0-9]*([\d,]+\.?\d*)',
-    ])
+    data['box5_sec199a'] = extract_amount(text, DIV_BOX5_PATTERNS)
 
     # Box 7 - Foreign Tax Paid
-    data['box7_foreign_tax'] = extract_amount(text, [
-        r'7-?\s*[-:]?\s*[Ff]oreign\s+[Tt]ax\s+[Pp]aid[^0-9]*([\d,]+\.?\d*)',
-    ])
+    data['box7_foreign_tax'] = extract_amount(text, DIV_BOX7_PATTERNS)
 
     # Box 4 - Federal Withholding
-    data['box4_fed_withholding'] = extract_amount(text, [
-        r'4-?\s*[-:]?\s*[Ff]ederal\s+[Ii]ncome\s+[Tt]ax\s+[Ww]ithheld[^0-9]*([\d,]+\.?\d*)',
-    ])
+    data['box4_fed_withholding'] = extract_amount(text, DIV_BOX4_PATTERNS)
 
     return data
 
 
+# 1099-R patterns
+R_PAYER_PATTERNS = compile_patterns([
+    r"[Pp]ayer'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"PAYER.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
+], 0)
+R_BOX1_PATTERNS = compile_patterns([
+    r'1\s+gross\s+distribution.*?\$?([\d,]+\.?\d*)',
+    r'gross\s+distribution.*?\$?([\d,]+\.?\d*)',
+])
+R_BOX2A_PATTERNS = compile_patterns([
+    r'2a\s+taxable\s+amount.*?\$?([\d,]+\.?\d*)',
+])
+R_BOX4_PATTERNS = compile_patterns([
+    r'4\s+federal.*?withheld.*?\$?([\d,]+\.?\d*)',
+])
+R_DISTRIBUTION_CODE_RE = re.compile(r'7\s+[Dd]istribution\s+[Cc]ode.*?([0-9A-Z]{1,2})')
+
+
 def parse_1099r(text, filename):
     """Parse 1099-R retirement distributions."""
     data = {
@@ -842,36 +1051,43 @@ def parse_1099r(text, filename):
         'source_file': filename
     }
 
-    payer_patterns = [
-        r"[Pp]ayer'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"PAYER.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
-    ]
-    for pattern in payer_patterns:
-        match = re.search(pattern, text)
+    for pattern in R_PAYER_PATTERNS:
+        match = pattern.search(text)
         if match:
             data['payer_name'] = match.group(1).strip()[:50]
             break
 
-    data['box1_gross_distribution'] = extract_amount(text, [
-        r'1\s+[Gg]ross\s+[Dd]istribution.*?\$?([\d,]+\.?\d*)',
-        r'[Gg]ross\s+[Dd]istribution.*?\$?([\d,]+\.?\d*)',
-    ])
+    data['box1_gross_distribution'] = extract_amount(text, R_BOX1_PATTERNS)
 
-    data['box2a_taxable_amount'] = extract_amount(text, [
-        r'2a\s+[Tt]axable\s+[Aa]mount.*?\$?([\d,]+\.?\d*)',
-    ])
+    data['box2a_taxable_amount'] = extract_amount(text, R_BOX2A_PATTERNS)
 
-    data['box4_fed_withholding'] = extract_amount(text, [
-        r'4\s+[Ff]ederal.*?withheld.*?\$?([\d,]+\.?\d*)',
-    ])
+    data['box4_fed_withholding'] = extract_amount(text, R_BOX4_PATTERNS)
 
-    code_match = re.search(r'7\s+[Dd]istribution\s+[Cc]ode.*?([0-9A-Z]{1,2})', text)
+    code_match = R_DISTRIBUTION_CODE_RE.search(text)
     if code_match:
         data['box7_distribution_code'] = code_match.group(1)
 
     return data
 
 
+# SSA-1099 amount patterns
+SSA_BOX3_PATTERNS = compile_patterns([
+    r'box\s*3.*?benefits\s+paid.*?\$([\d,]+\.?\d*)',
+    r'benefits\s+paid\s+in\s+\d{4}\s*\$([\d,]+\.?\d*)',
+    r'box\s*3[.\s]+benefits.*?\$([\d,]+\.?\d*)',
+    r'\$([\d,]+\.?\d*)\s*\n.*?DESCRIPTION\s+OF\s+AMOUNT',
+])
+SSA_BOX5_PATTERNS = compile_patterns([
+    r'box\s*5.*?net\s+benefits.*?\$([\d,]+\.?\d*)',
+    r'net\s+benefits\s+for\s+\d{4}.*?\$([\d,]+\.?\d*)',
+    r'benefits\s+for\s+\d{4}\s*\$([\d,]+\.?\d*)',
+])
+SSA_BOX6_PATTERNS = compile_patterns([
+    r'box\s*6.*?withheld.*?\$([\d,]+\.?\d*)',
+    r'federal.*?withheld.*?\$([\d,]+\.?\d*)',
+])
+
+
 def parse_ssa1099(text, filename):
     """Parse SSA-1099 Social Security benefits."""
     data = {
@@ -883,33 +1099,52 @@ def parse_ssa1099(text, filename):
     }
 
     # Box 3: Benefits Paid - look for dollar amount after "Box 3" or "Benefits Paid"
-    data['box3_benefits_paid'] = extract_amount(text, [
-        r'[Bb]ox\s*3.*?[Bb]enefits\s+[Pp]aid.*?\$([\d,]+\.?\d*)',
-        r'[Bb]enefits\s+[Pp]aid\s+in\s+\d{4}\s*\$([\d,]+\.?\d*)',
-        r'[Bb]ox\s*3[.\s]+[Bb]enefits.*?\$([\d,]+\.?\d*)',
-        r'\$([\d,]+\.?\d*)\s*\n.*?DESCRIPTION\s+OF\s+AMOUNT',
-    ])
+    data['box3_benefits_paid'] = extract_amount(text, SSA_BOX3_PATTERNS)
 
     # Box 5: Net Benefits - often same as Box 3 if no repayments
-    data['box5_net_benefits'] = extract_amount(text, [
-        r'[Bb]ox\s*5.*?[Nn]et\s+[Bb]enefits.*?\$([\d,]+\.?\d*)',
-        r'[Nn]et\s+[Bb]enefits\s+for\s+\d{4}.*?\$([\d,]+\.?\d*)',
-        r'[Bb]enefits\s+for\s+\d{4}\s*\$([\d,]+\.?\d*)',
-    ])
+    data['box5_net_benefits'] = extract_amount(text, SSA_BOX5_PATTERNS)
 
     # If Box 5 not found but Box 3 was, use Box 3 (common when no repayments)
     if data['box5_net_benefits'] == 0 and data['box3_benefits_paid'] > 0:
         data['box5_net_benefits'] = data['box3_benefits_paid']
 
     # Box 6: Voluntary Federal Withholding
-    data['box6_fed_withholding'] = extract_amount(text, [
-        r'[Bb]ox\s*6.*?[Ww]ithheld.*?\$([\d,]+\.?\d*)',
-        r'[Ff]ederal.*?[Ww]ithheld.*?\$([\d,]+\.?\d*)',
-    ])
+    data['box6_fed_withholding'] = extract_amount(text, SSA_BOX6_PATTERNS)
 
     return data
 
 
+# 1098 patterns
+MTG_BOX1_PATTERNS = compile_patterns([
+    r'1mortgageinterest[a-z\(\)/\*]+\n\$([\d,]+\.\d{2})',  # Run-on text then newline
+    r'\$([\d,]+\.\d{2})\s*\nRECIPIENT',  # Amount before RECIPIENT'S TIN
+    r'1\s*mortgage\s*interest.*?\n\$\s*([\d,]+\.\d{2})',
+    r'mortgage\s*interest\s*received.*?\$\s*([\d,]+\.\d{2})',
+    r'mortgage\s*interest.*?\$([\d,]+\.\d{2})',
+])
+MTG_BOX2_PATTERNS = compile_patterns([
+    r'2\s*outstanding\s*mortgage.*?\$\s*([\d,]+\.\d{2})',
+    r'outstanding\s*mortgage\s*\n?\s*principal\s*\$\s*([\d,]+\.\d{2})',
+    r'\$\s*([\d,]+\.\d{2})\s*\n.*?mortgage\s*origination',
+])
+MTG_BOX5_PATTERNS = compile_patterns([
+    r'5\s*mortgage\s*insurance.*?\$\s*([\d,]+\.\d{2})',
+])
+MTG_BOX10_PATTERNS = compile_patterns([
+    r'10\s*other.*?\$\s*([\d,]+\.\d{2})',
+    r'real\s*estate\s*tax.*?\$\s*([\d,]+\.\d{2})',
+])
+MTG_LENDER_PATTERNS = compile_patterns([
+    r"(FIFTH\s+THIRD\s+BANK[,\s]*N\.?A\.?)",
+    r"([A-Z]+\s+THIRD\s+BANK[,\s]*N\.?A\.?)",
+    r"^([A-Z][A-Z\s]+BANK[,\s]+N\.A\.)",
+    r"([A-Z]+\s+[A-Z]+\s+BANK,?\s*N\.?A\.?)",
+    r"([A-Z][A-Z\s]+(?:BANK|MORTGAGE|CREDIT UNION)[A-Za-z\s\.,]*)",
+], re.MULTILINE)
+MTG_ADDRESS_RE = re.compile(
+    r'(\d+\s+[A-Z]+\s+[A-Z]+\s+(?:BLVD|DR|ST|AVE|RD|LN|CT|WAY|HWY)[A-Za-z0-9\s,]*(?:FL|CA|NY|NJ|TX)\s*\d{5})')
+
+
 def parse_1098(text, filename):
     """Parse 1098 Mortgage Interest Statement."""
     data = {
@@ -924,15 +1159,8 @@ def parse_1098(text, filename):
 
     # Lender name - look for bank names at start of document (first few lines)
     # The format shows "FIFTH THIRD BANK, N.A." at the top
-    lender_patterns = [
-        r"(FIFTH\s+THIRD\s+BANK[,\s]*N\.?A\.?)",
-        r"([A-Z]+\s+THIRD\s+BANK[,\s]*N\.?A\.?)",
-        r"^([A-Z][A-Z\s]+BANK[,\s]+N\.A\.)",
-        r"([A-Z]+\s+[A-Z]+\s+BANK,?\s*N\.?A\.?)",
-        r"([A-Z][A-Z\s]+(?:BANK|MORTGAGE|CREDIT UNION)[A-Za-z\s\.,]*)",
-    ]
-    for pattern in lender_patterns:
-        match = re.search(pattern, text, re.MULTILINE)
+    for pattern in MTG_LENDER_PATTERNS:
+        match = pattern.search(text)
         if match:
             name = match.group(1).strip().split('\n')[0]
             # Filter out bad matches
@@ -942,42 +1170,47 @@ def parse_1098(text, filename):
 
     # Box 1: Mortgage interest - format shows "1Mortgageinterestreceivedfrompayer(s)/borrower(s)*"
     # followed by newline then "$6,871.22"
-    box1_patterns = [
-        r'1[Mm]ortgageinterest[a-z\(\)/\*]+\n\$([\d,]+\.\d{2})',  # Run-on text then newline
-        r'\$([\d,]+\.\d{2})\s*\nRECIPIENT',  # Amount before RECIPIENT'S TIN
-        r'1\s*[Mm]ortgage\s*[Ii]nterest.*?\n\$\s*([\d,]+\.\d{2})',
-        r'[Mm]ortgage\s*[Ii]nterest\s*[Rr]eceived.*?\$\s*([\d,]+\.\d{2})',
-        r'[Mm]ortgage\s*[Ii]nterest.*?\$([\d,]+\.\d{2})',
-    ]
-    data['box1_mortgage_interest'] = extract_amount(text, box1_patterns)
+    data['box1_mortgage_interest'] = extract_amount(text, MTG_BOX1_PATTERNS)
 
     # Box 2: Outstanding mortgage principal
-    box2_patterns = [
-        r'2\s*[Oo]utstanding\s*[Mm]ortgage.*?\$\s*([\d,]+\.\d{2})',
-        r'[Oo]utstanding\s*mortgage\s*\n?\s*principal\s*\$\s*([\d,]+\.\d{2})',
-        r'\$\s*([\d,]+\.\d{2})\s*\n.*?[Mm]ortgage\s*origination',
-    ]
-    data['box2_outstanding_principal'] = extract_amount(text, box2_patterns)
+    data['box2_outstanding_principal'] = extract_amount(text, MTG_BOX2_PATTERNS)
 
     # Box 5: Mortgage insurance premiums
-    data['box5_mortgage_insurance'] = extract_amount(text, [
-        r'5\s*[Mm]ortgage\s*[Ii]nsurance.*?\$\s*([\d,]+\.\d{2})',
-    ])
+    data['box5_mortgage_insurance'] = extract_amount(text, MTG_BOX5_PATTERNS)
 
     # Box 10: Real estate/property tax
-    data['box10_property_tax'] = extract_amount(text, [
-        r'10\s*[Oo]ther.*?\$\s*([\d,]+\.\d{2})',
-        r'[Rr]eal\s*[Ee]state\s*[Tt]ax.*?\$\s*([\d,]+\.\d{2})',
-    ])
+    data['box10_property_tax'] = extract_amount(text, MTG_BOX10_PATTERNS)
 
     # Property address from Box 8
-    addr_match = re.search(r'(\d+\s+[A-Z]+\s+[A-Z]+\s+(?:BLVD|DR|ST|AVE|RD|LN|CT|WAY|HWY)[A-Za-z0-9\s,]*(?:FL|CA|NY|NJ|TX)\s*\d{5})', text)
+    addr_match = MTG_ADDRESS_RE.search(text)
     if addr_match:
         data['property_address'] = addr_match.group(1).strip()[:80]
 
     return data
 
 
+# Property tax patterns
+PROPERTY_TAX_AD_VALOREM_PATTERNS = compile_patterns([
+    r'\$([\d,]+\.\d{2})\s*\n?Paid\s*By',  # Amount before "Paid By"
+    r'\$([\d,]+\.\d{2})\s*\nPaid',  # Amount before "Paid"
+    r'TOTAL\s+MILLAGE\s+AD\s+VALOREM\s*TAXES\s*\n[^\$]*\$([\d,]+\.\d{2})',
+    r'AD\s*VALOREM\s*TAXES\s*\$?\s*([\d,]+\.?\d*)',
+    r'ADVALOREMTAXES[^\$]*\$([\d,]+\.\d{2})',
+])
+PROPERTY_TAX_TOTAL_PATTERNS = compile_patterns([
+    r'COMBINEDTAXES[^\$]*\$([\d,]+\.\d{2})',
+    r'COMBINED\s*TAXES[^\$]*\$\s*([\d,]+\.?\d*)',
+    r'TOTAL.*?TAXES.*?\$\s*([\d,]+\.?\d*)',
+])
+PROPERTY_TAX_COUNTY_RE = re.compile(r'([A-Z]+)\s+(?:COUNTY|CO)\b')
+PROPERTY_TAX_PARCEL_PATTERNS = compile_patterns([
+    r'PARCEL\s+ACCOUNT\s+NUMBER[^\n]*\n([A-Z]?\d+[-\d]+)',
+    r'([R]\d{6}-\d+)',
+], 0)
+PROPERTY_TAX_TAXABLE_VALUE_RE = re.compile(r'TAXABLE\s+VALUE[^\d]*([\d,]+)')
+PROPERTY_TAX_ADDRESS_RE = re.compile(r'(\d+\s+[A-Z]+\s+[A-Z]+\s+(?:BLVD|DR|ST|AVE|RD|LN|CT|WAY|HWY|MEMORIAL))')
+
+
 def parse_property_tax(text, filename):
     """Parse property tax bill."""
     data = {
@@ -991,57 +1224,74 @@ def parse_property_tax(text, filename):
     }
 
     # County name
-    county_match = re.search(r'([A-Z]+)\s+(?:COUNTY|CO)\b', text)
+    county_match = PROPERTY_TAX_COUNTY_RE.search(text)
     if county_match:
         data['county'] = county_match.group(1) + ' COUNTY'
 
     # Parcel number - format like "R092527-305700010720"
-    parcel_patterns = [
-        r'PARCEL\s+ACCOUNT\s+NUMBER[^\n]*\n([A-Z]?\d+[-\d]+)',
-        r'([R]\d{6}-\d+)',
-    ]
-    for pattern in parcel_patterns:
-        match = re.search(pattern, text)
+    for pattern in PROPERTY_TAX_PARCEL_PATTERNS:
+        match = pattern.search(text)
         if match:
             data['parcel_number'] = match.group(1)
             break
 
     # Ad valorem taxes - look for dollar amounts near "AD VALOREM" or "Paid By"
     # The Osceola format shows "$5,087.58" followed by "Paid By"
-    ad_valorem_patterns = [
-        r'\$([\d,]+\.\d{2})\s*\n?Paid\s*By',  # Amount before "Paid By"
-        r'\$([\d,]+\.\d{2})\s*\nPaid',  # Amount before "Paid"
-        r'TOTAL\s+MILLAGE\s+AD\s+VALOREM\s*TAXES\s*\n[^\$]*\$([\d,]+\.\d{2})',
-        r'AD\s*VALOREM\s*TAXES\s*\$?\s*([\d,]+\.?\d*)',
-        r'ADVALOREMTAXES[^\$]*\$([\d,]+\.\d{2})',
-    ]
-    data['ad_valorem_taxes'] = extract_amount(text, ad_valorem_patterns)
+    data['ad_valorem_taxes'] = extract_amount(text, PROPERTY_TAX_AD_VALOREM_PATTERNS)
 
     # Combined/total taxes - look for amount near COMBINED TAXES
-    total_patterns = [
-        r'COMBINEDTAXES[^\$]*\$([\d,]+\.\d{2})',
-        r'COMBINED\s*TAXES[^\$]*\$\s*([\d,]+\.?\d*)',
-        r'TOTAL.*?TAXES.*?\$\s*([\d,]+\.?\d*)',
-    ]
-    data['total_taxes'] = extract_amount(text, total_patterns)
+    data['total_taxes'] = extract_amount(text, PROPERTY_TAX_TOTAL_PATTERNS)
 
     # If no ad valorem found but total found, use total
     if data['ad_valorem_taxes'] == 0 and data['total_taxes'] > 0:
         data['ad_valorem_taxes'] = data['total_taxes']
 
     # Taxable value
-    value_match = re.search(r'TAXABLE\s+VALUE[^\d]*([\d,]+)', text)
+    value_match = PROPERTY_TAX_TAXABLE_VALUE_RE.search(text)
     if value_match:
         data['taxable_value'] = float(value_match.group(1).replace(',', ''))
 
     # Property address - look for street address pattern
-    addr_match = re.search(r'(\d+\s+[A-Z]+\s+[A-Z]+\s+(?:BLVD|DR|ST|AVE|RD|LN|CT|WAY|HWY|MEMORIAL))', text)
+    addr_match = PROPERTY_TAX_ADDRESS_RE.search(text)
     if addr_match:
         data['property_address'] = addr_match.group(1)
 
     return data
 
 
+# 1098-T patterns
+T_BOX1_PATTERNS = compile_patterns([
+    r'1\s*payments\s+received.*?\$?\s*([\d,]+\.?\d*)',
+    r'box\s*1[:\s]+\$?([\d,]+\.?\d*)',
+    r'payments\s+received\s+for\s+qualified.*?\$?\s*([\d,]+\.?\d*)',
+])
+T_BOX2_PATTERNS = compile_patterns([
+    r'2\s*amounts\s+billed.*?\$?\s*([\d,]+\.?\d*)',
+    r'box\s*2[:\s]+\$?([\d,]+\.?\d*)',
+])
+T_BOX4_PATTERNS = compile_patterns([
+    r'4\s*adjustments\s+made.*?prior.*?\$?\s*([\d,]+\.?\d*)',
+    r'box\s*4[:\s]+\$?([\d,]+\.?\d*)',
+])
+T_BOX5_PATTERNS = compile_patterns([
+    r'5\s*scholarships\s+or\s+grants.*?\$?\s*([\d,]+\.?\d*)',
+    r'box\s*5[:\s]+\$?([\d,]+\.?\d*)',
+    r'scholarships.*?grants.*?\$?\s*([\d,]+\.?\d*)',
+])
+T_BOX6_PATTERNS = compile_patterns([
+    r'6\s*adjustments.*?scholarships.*?\$?\s*([\d,]+\.?\d*)',
+    r'box\s*6[:\s]+\$?([\d,]+\.?\d*)',
+])
+T_SCHOOL_PATTERNS = compile_patterns([
+    r"FILER'?S?\s+(?:name|NAME)[:\s]*\n?\s*([A-Z][A-Za-z0-9\s\.,&-]+(?:UNIVERSITY|COLLEGE|INSTITUTE|SCHOOL))",
+    r"([A-Z][A-Za-z\s]+(?:UNIVERSITY|COLLEGE|INSTITUTE|SCHOOL)[A-Za-z\s]*)",
+    r"^([A-Z][A-Z\s]+(?:UNIVERSITY|COLLEGE))",
+], re.MULTILINE)
+T_BOX7_RE = re.compile(r'[Bb]ox\s*7.*?[Xx✓]|7\s*[Xx✓]')
+T_BOX8_RE = re.compile(r'[Bb]ox\s*8.*?[Xx✓]|[Hh]alf.?[Tt]ime.*?[Xx✓]')
+T_BOX9_RE = re.compile(r'[Bb]ox\s*9.*?[Xx✓]|[Gg]raduate.*?[Xx✓]')
+
+
 def parse_1098t(text, filename, is_ocr=False):
     """Parse 1098-T Tuition Statement."""
     result = ExtractionResult('1098-T', filename, is_ocr)
@@ -1059,13 +1309,8 @@ def parse_1098t(text, filename, is_ocr=False):
     }
 
     # School/Institution name - look at top of form
-    school_patterns = [
-        r"FILER'?S?\s+(?:name|NAME)[:\s]*\n?\s*([A-Z][A-Za-z0-9\s\.,&-]+(?:UNIVERSITY|COLLEGE|INSTITUTE|SCHOOL))",
-        r"([A-Z][A-Za-z\s]+(?:UNIVERSITY|COLLEGE|INSTITUTE|SCHOOL)[A-Za-z\s]*)",
-        r"^([A-Z][A-Z\s]+(?:UNIVERSITY|COLLEGE))",
-    ]
-    for pattern in school_patterns:
-        match = re.search(pattern, text, re.MULTILINE)
+    for pattern in T_SCHOOL_PATTERNS:
+        match = pattern.search(text)
         if match:
             name = match.group(1).strip().split('\n')[0]
             if len(name) > 5:
@@ -1073,44 +1318,27 @@ def parse_1098t(text, filename, is_ocr=False):
                 break
 
     # Box 1: Payments received for qualified tuition
-    data['box1_payments_received'], q1 = extract_amount_with_quality(text, [
-        r'1\s*[Pp]ayments\s+[Rr]eceived.*?\$?\s*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*1[:\s]+\$?([\d,]+\.?\d*)',
-        r'[Pp]ayments\s+[Rr]eceived\s+for\s+[Qq]ualified.*?\$?\s*([\d,]+\.?\d*)',
-    ], 'box1_payments_received')
+    data['box1_payments_received'], q1 = extract_amount_with_quality(text, T_BOX1_PATTERNS, 'box1_payments_received')
     result.add_field('box1_payments_received', data['box1_payments_received'], q1)
 
     # Box 2: Amounts billed (older forms used this instead of Box 1)
-    data['box2_amounts_billed'], q2 = extract_amount_with_quality(text, [
-        r'2\s*[Aa]mounts\s+[Bb]illed.*?\$?\s*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*2[:\s]+\$?([\d,]+\.?\d*)',
-    ], 'box2_amounts_billed')
+    data['box2_amounts_billed'], q2 = extract_amount_with_quality(text, T_BOX2_PATTERNS, 'box2_amounts_billed')
     result.add_field('box2_amounts_billed', data['box2_amounts_billed'], q2)
 
     # Box 4: Adjustments made for a prior year
-    data['box4_adjustments_prior_year'] = extract_amount(text, [
-        r'4\s*[Aa]djustments\s+[Mm]ade.*?[Pp]rior.*?\$?\s*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*4[:\s]+\$?([\d,]+\.?\d*)',
-    ])
+    data['box4_adjustments_prior_year'] = extract_amount(text, T_BOX4_PATTERNS)
 
     # Box 5: Scholarships or grants
-    data['box5_scholarships'], q5 = extract_amount_with_quality(text, [
-        r'5\s*[Ss]cholarships\s+[Oo]r\s+[Gg]rants.*?\$?\s*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*5[:\s]+\$?([\d,]+\.?\d*)',
-        r'[Ss]cholarships.*?[Gg]rants.*?\$?\s*([\d,]+\.?\d*)',
-    ], 'box5_scholarships')
+    data['box5_scholarships'], q5 = extract_amount_with_quality(text, T_BOX5_PATTERNS, 'box5_scholarships')
     result.add_field('box5_scholarships', data['box5_scholarships'], q5)
 
     # Box 6: Adjustments to scholarships
-    data['box6_adjustments_scholarships'] = extract_amount(text, [
-        r'6\s*[Aa]djustments.*?[Ss]cholarships.*?\$?\s*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*6[:\s]+\$?([\d,]+\.?\d*)',
-    ])
+    data['box6_adjustments_scholarships'] = extract_amount(text, T_BOX6_PATTERNS)
 
     # Box 7, 8, 9 are checkboxes
-    data['box7_checked'] = bool(re.search(r'[Bb]ox\s*7.*?[Xx✓]|7\s*[Xx✓]', text))
-    data['box8_half_time'] = bool(re.search(r'[Bb]ox\s*8.*?[Xx✓]|[Hh]alf.?[Tt]ime.*?[Xx✓]', text))
-    data['box9_graduate'] = bool(re.search(r'[Bb]ox\s*9.*?[Xx✓]|[Gg]raduate.*?[Xx✓]', text))
+    data['box7_checked'] = bool(T_BOX7_RE.search(text))
+    data['box8_half_time'] = bool(T_BOX8_RE.search(text))
+    data['box9_graduate'] = bool(T_BOX9_RE.search(text))
 
     result.add_text_field('school_name', data['school_name'])
     result.check_required(['school_name'])
@@ -1118,6 +1346,31 @@ def parse_1098t(text, filename, is_ocr=False):
     return result.to_dict()
 
 
+# 1099-Q patterns
+Q_BOX1_PATTERNS = compile_patterns([
+    r'1\s*gross\s+distribution.*?\$?\s*([\d,]+\.?\d*)',
+    r'box\s*1[:\s]+\$?([\d,]+\.?\d*)',
+    r'gross\s+distribution[^$\d]*([\d,]+\.?\d*)',
+])
+Q_BOX2_PATTERNS = compile_patterns([
+    r'2\s*earnings.*?\$?\s*([\d,]+\.?\d*)',
+    r'box\s*2[:\s]+\$?([\d,]+\.?\d*)',
+])
+Q_BOX3_PATTERNS = compile_patterns([
+    r'3\s*basis.*?\$?\s*([\d,]+\.?\d*)',
+    r'box\s*3[:\s]+\$?([\d,]+\.?\d*)',
+])
+Q_PAYER_PATTERNS = compile_patterns([
+    r"[Pp]ayer'?s?/[Tt]rustee'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"PAYER.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"TRUSTEE.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"(FIDELITY|VANGUARD|SCHWAB|AMERICAN FUNDS|T\. ROWE PRICE|TIAA)[A-Z\s]*",
+], 0)
+Q_BOX4_RE = re.compile(r'[Bb]ox\s*4.*?[Xx✓]|[Tt]rustee.*?[Tt]ransfer.*?[Xx✓]')
+Q_BOX5_RE = re.compile(r'[Bb]ox\s*5.*?([12])|[Pp]rivate|[Ss]tate')
+Q_BOX6_RE = re.compile(r'[Bb]ox\s*6.*?[Xx✓]')
+
+
 def parse_1099q(text, filename, is_ocr=False):
     """Parse 1099-Q Payments From Qualified Education Programs."""
     result = ExtractionResult('1099-Q', filename, is_ocr)
@@ -1133,55 +1386,41 @@ def parse_1099q(text, filename, is_ocr=False):
     }
 
     # Payer/Trustee name
-    payer_patterns = [
-        r"[Pp]ayer'?s?/[Tt]rustee'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"PAYER.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"TRUSTEE.*?\n([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"(FIDELITY|VANGUARD|SCHWAB|AMERICAN FUNDS|T\. ROWE PRICE|TIAA)[A-Z\s]*",
-    ]
-    for pattern in payer_patterns:
-        match = re.search(pattern, text)
+    for pattern in Q_PAYER_PATTERNS:
+        match = pattern.search(text)
         if match:
             data['payer_name'] = match.group(1).strip()[:50]
             break
 
     # Box 1: Gross distribution
-    data['box1_gross_distribution'], q1 = extract_amount_with_quality(text, [
-        r'1\s*[Gg]ross\s+[Dd]istribution.*?\$?\s*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*1[:\s]+\$?([\d,]+\.?\d*)',
-        r'[Gg]ross\s+[Dd]istribution[^$\d]*([\d,]+\.?\d*)',
-    ], 'box1_gross_distribution')
+    data['box1_gross_distribution'], q1 = extract_amount_with_quality(text, Q_BOX1_PATTERNS, 'box1_gross_distribution')
     result.add_field('box1_gross_distribution', data['box1_gross_distribution'], q1)
 
     # Box 2: Earnings
-    data['box2_earnings'], q2 = extract_amount_with_quality(text, [
-        r'2\s*[Ee]arnings.*?\$?\s*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*2[:\s]+\$?([\d,]+\.?\d*)',
-    ], 'box2_earnings')
+    data['box2_earnings'], q2 = extract_amount_with_quality(text, Q_BOX2_PATTERNS, 'box2_earnings')
     result.add_field('box2_earnings', data['box2_earnings'], q2)
 
     # Box 3: Basis
-    data['box3_basis'], q3 = extract_amount_with_quality(text, [
-        r'3\s*[Bb]asis.*?\$?\s*([\d,]+\.?\d*)',
-        r'[Bb]ox\s*3[:\s]+\$?([\d,]+\.?\d*)',
-    ], 'box3_basis')
+    data['box3_basis'], q3 = extract_amount_with_quality(text, Q_BOX3_PATTERNS, 'box3_basis')
     result.add_field('box3_basis', data['box3_basis'], q3)
 
     # Box 4: Trustee-to-trustee transfer (checkbox)
-    data['box4_trustee_transfer'] = bool(re.search(r'[Bb]ox\s*4.*?[Xx✓]|[Tt]rustee.*?[Tt]ransfer.*?[Xx✓]', text))
+    data['box4_trustee_transfer'] = bool(Q_BOX4_RE.search(text))
 
     # Box 5: Type of account (1=529, 2=Coverdell ESA)
-    type_match = re.search(r'[Bb]ox\s*5.*?([12])|[Pp]rivate|[Ss]tate', text)
+    type_match = Q_BOX5_RE.search(text)
     if type_match:
         if type_match.group(1):
             data['box5_distribution_type'] = type_match.group(1)
-        elif 'PRIVATE' in text.upper() or 'COVERDELL' in text.upper():
-            data['box5_distribution_type'] = '2'
         else:
-            data['box5_distribution_type'] = '1'
+            text_upper = text.upper()
+            if 'PRIVATE' in text_upper or 'COVERDELL' in text_upper:
+                data['box5_distribution_type'] = '2'
+            else:
+                data['box5_distribution_type'] = '1'
 
     # Box 6: Designated beneficiary (checkbox)
-    data['box6_designated_beneficiary'] = bool(re.search(r'[Bb]ox\s*6.*?[Xx✓]', text))
+    data['box6_designated_beneficiary'] = bool(Q_BOX6_RE.search(text))
 
     result.add_text_field('payer_name', data['payer_name'])
     result.check_required(['payer_name', 'box1_gross_distribution'])
@@ -1189,6 +1428,53 @@ def parse_1099q(text, filename, is_ocr=False):
     return result.to_dict()
 
 
+# K-1 patterns
+K1_BOX1_PATTERNS = compile_patterns([
+    r'1\s+ordinary\s+business\s+income.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
+    r'box\s*1[:\s]+\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
+    r'ordinary\s+income.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
+])
+K1_BOX2_PATTERNS = compile_patterns([
+    r'2\s+net\s+rental\s+real\s+estate.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
+])
+K1_BOX4_PATTERNS = compile_patterns([
+    r'4\s+guaranteed\s+payments.*?\$?\s*([\d,]+\.?\d*)',
+])
+K1_BOX5_PATTERNS = compile_patterns([
+    r'5\s+interest\s+income.*?\$?\s*([\d,]+\.?\d*)',
+])
+K1_BOX6A_PATTERNS = compile_patterns([
+    r'6a\s+ordinary\s+dividends.*?\$?\s*([\d,]+\.?\d*)',
+])
+K1_BOX6B_PATTERNS = compile_patterns([
+    r'6b\s+qualified\s+dividends.*?\$?\s*([\d,]+\.?\d*)',
+])
+K1_BOX8_PATTERNS = compile_patterns([
+    r'8\s+net\s+short.*?capital\s+gain.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
+])
+K1_BOX9A_PATTERNS = compile_patterns([
+    r'9a\s+net\s+long.*?capital\s+gain.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
+])
+K1_BOX10_PATTERNS = compile_patterns([
+    r'10\s+net\s+section\s*1231\s+gain.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
+])
+K1_BOX19_PATTERNS = compile_patterns([
+    r'19\s+distributions.*?\$?\s*([\d,]+\.?\d*)',
+])
+K1_ENTITY_PATTERNS = compile_patterns([
+    r"[Pp]artnership'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"[Cc]orporation'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"[Ee]state'?s?\s+or\s+[Tt]rust'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
+    r"Part\s+I[^\n]*\n([A-Z][A-Za-z0-9\s\.,&-]+(?:LLC|LP|LLP|INC|CORP)?)",
+], 0)
+K1_EIN_RE = re.compile(r'[Ee]mployer.*?[Ii]dentification.*?(\d{2}-\d{7})')
+K1_PARTNER_PATTERNS = compile_patterns([
+    r"[Pp]artner'?s?\s+name.*?\n\s*([A-Z][A-Za-z\s,]+)",
+    r"[Ss]hareholder'?s?\s+name.*?\n\s*([A-Z][A-Za-z\s,]+)",
+    r"[Bb]eneficiary'?s?\s+name.*?\n\s*([A-Z][A-Za-z\s,]+)",
+], 0)
+
+
 def parse_k1(text, filename, is_ocr=False):
     """Parse Schedule K-1 (Form 1065/1120S/1041)."""
     result = ExtractionResult('K-1', filename, is_ocr)
@@ -1220,95 +1506,63 @@ def parse_k1(text, filename, is_ocr=False):
     }
 
     # Determine K-1 type
-    if 'FORM 1065' in text.upper() or "PARTNER'S SHARE" in text.upper():
+    text_upper = text.upper()
+    if 'FORM 1065' in text_upper or "PARTNER'S SHARE" in text_upper:
         data['k1_type'] = '1065'
-    elif 'FORM 1120S' in text.upper() or 'FORM 1120-S' in text.upper() or "SHAREHOLDER'S SHARE" in text.upper():
+    elif 'FORM 1120S' in text_upper or 'FORM 1120-S' in text_upper or "SHAREHOLDER'S SHARE" in text_upper:
         data['k1_type'] = '1120S'
-    elif 'FORM 1041' in text.upper() or "BENEFICIARY'S SHARE" in text.upper():
+    elif 'FORM 1041' in text_upper or "BENEFICIARY'S SHARE" in text_upper:
         data['k1_type'] = '1041'
 
     # Entity name (partnership/S-corp/trust name)
-    entity_patterns = [
-        r"[Pp]artnership'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"[Cc]orporation'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"[Ee]state'?s?\s+or\s+[Tt]rust'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)",
-        r"Part\s+I[^\n]*\n([A-Z][A-Za-z0-9\s\.,&-]+(?:LLC|LP|LLP|INC|CORP)?)",
-    ]
-    for pattern in entity_patterns:
-        match = re.search(pattern, text)
+    for pattern in K1_ENTITY_PATTERNS:
+        match = pattern.search(text)
         if match:
             data['entity_name'] = match.group(1).strip()[:60]
             break
 
     # Entity EIN
-    ein_match = re.search(r'[Ee]mployer.*?[Ii]dentification.*?(\d{2}-\d{7})', text)
+    ein_match = K1_EIN_RE.search(text)
     if ein_match:
         data['entity_ein'] = ein_match.group(1)
 
     # Partner/Shareholder name
-    partner_patterns = [
-        r"[Pp]artner'?s?\s+name.*?\n\s*([A-Z][A-Za-z\s,]+)",
-        r"[Ss]hareholder'?s?\s+name.*?\n\s*([A-Z][A-Za-z\s,]+)",
-        r"[Bb]eneficiary'?s?\s+name.*?\n\s*([A-Z][A-Za-z\s,]+)",
-    ]
-    for pattern in partner_patterns:
-        match = re.search(pattern, text)
+    for pattern in K1_PARTNER_PATTERNS:
+        match = pattern.search(text)
         if match:
             data['partner_name'] = match.group(1).strip()[:60]
             break
 
     # Box 1: Ordinary business income (loss)
-    data['box1_ordinary_income'], q1 = extract_amount_with_quality(text, [
-        r'1\s+[Oo]rdinary\s+[Bb]usiness\s+[Ii]ncome.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
-        r'[Bb]ox\s*1[:\s]+\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
-        r'[Oo]rdinary\s+[Ii]ncome.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
-    ], 'box1_ordinary_income')
+    data['box1_ordinary_income'], q1 = extract_amount_with_quality(text, K1_BOX1_PATTERNS, 'box1_ordinary_income')
     result.add_field('box1_ordinary_income', data['box1_ordinary_income'], q1)
 
     # Box 2: Net rental real estate income
-    data['box2_net_rental_income'] = extract_amount(text, [
-        r'2\s+[Nn]et\s+[Rr]ental\s+[Rr]eal\s+[Ee]state.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
-    ])
+    data['box2_net_rental_income'] = extract_amount(text, K1_BOX2_PATTERNS)
 
     # Box 4: Guaranteed payments
-    data['box4_guaranteed_payments'] = extract_amount(text, [
-        r'4\s+[Gg]uaranteed\s+[Pp]ayments.*?\$?\s*([\d,]+\.?\d*)',
-    ])
+    data['box4_guaranteed_payments'] = extract_amount(text, K1_BOX4_PATTERNS)
 
     # Box 5: Interest income
-    data['box5_interest_income'] = extract_amount(text, [
-        r'5\s+[Ii]nterest\s+[Ii]ncome.*?\$?\s*([\d,]+\.?\d*)',
-    ])
+    data['box5_interest_income'] = extract_amount(text, K1_BOX5_PATTERNS)
 
     # Box 6a: Ordinary dividends
-    data['box6a_ordinary_dividends'] = extract_amount(text, [
-        r'6a\s+[Oo]rdinary\s+[Dd]ividends.*?\$?\s*([\d,]+\.?\d*)',
-    ])
+    data['box6a_ordinary_dividends'] = extract_amount(text, K1_BOX6A_PATTERNS)
 
     # Box 6b: Qualified dividends
-    data['box6b_qualified_dividends'] = extract_amount(text, [
-        r'6b\s+[Qq]ualified\s+[Dd]ividends.*?\$?\s*([\d,]+\.?\d*)',
-    ])
+    data['box6b_qualified_dividends'] = extract_amount(text, K1_BOX6B_PATTERNS)
 
     # Box 8: Net short-term capital gain
-    data['box8_net_st_cap_gain'] = extract_amount(text, [
-        r'8\s+[Nn]et\s+[Ss]hort.*?[Cc]apital\s+[Gg]ain.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
-    ])
+    data['box8_net_st_cap_gain'] = extract_amount(text, K1_BOX8_PATTERNS)
 
     # Box 9a: Net long-term capital gain
-    data['box9a_net_lt_cap_gain'] = extract_amount(text, [
-        r'9a\s+[Nn]et\s+[Ll]ong.*?[Cc]apital\s+[Gg]ain.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
-    ])
+    data['box9a_net_lt_cap_gain'] = extract_amount(text, K1_BOX9A_PATTERNS)
 
     # Box 10: Net section 1231 gain
-    data['box10_net_1231_gain'] = extract_amount(text, [
-        r'10\s+[Nn]et\s+[Ss]ection\s*1231\s+[Gg]ain.*?\(?\$?\s*(-?[\d,]+\.?\d*)\)?',
-    ])
+    data['box10_net_1231_gain'] = extract_amount(text, K1_BOX10_PATTERNS)
 
     # Box 19: Distributions
-    data['box19_distributions'] = extract_amount(text, [
-        r'19\s+[Dd]istributions.*?\$?\s*([\d,]+\.?\d*)',
-    ])
+    data['box19_distributions'] = extract_amount(text, K1_BOX19_PATTERNS)
 
     result.add_text_field('entity_name', data['entity_name'])
     result.add_text_field('k1_type', data['k1_type'])
@@ -1317,23 +1571,56 @@ def parse_k1(text, filename, is_ocr=False):
     return result.to_dict()
 
 
+CONSOLIDATED_HEADER_RE = re.compile(r'1099-(DIV|INT)?', re.IGNORECASE)
+
+
+def split_consolidated(text):
+    """
+    Split a consolidated 1099 into its 1099-DIV and 1099-INT sections in one pass.
+
+    Each section runs from the first header for that form up to the next
+    "1099-" header for any other form, or to the end of the text (before a
+    final newline). Returns {'DIV': str, 'INT': str} for the forms present.
+    """
+    sections = {}
+    starts = {}
+    open_form = None
+    for match in CONSOLIDATED_HEADER_RE.finditer(text):
+        form = (match.group(1) or '').upper()
+        if open_form and form != open_form:
+            sections[open_form] = text[starts[open_form]:match.start()]
+            open_form = None
+        if form and form not in starts:
+            starts[form] = match.start()
+            open_form = form
+    if open_form:
+        end = len(text) - 1 if text.endswith('\n') else len(text)
+        sections[open_form] = text[starts[open_form]:end]
+    return sections
+
+
+CONSOLIDATED_PAYER_PATTERNS = compile_patterns([
+    r"(VANGUARD\s+(?:MARKETING|BROKERAGE)[A-Z\s]*)",
+    r"(FIDELITY\s+INVESTMENTS[A-Z\s]*)",
+    r"([A-Z][A-Za-z]+\s+(?:BANK|INVESTMENTS|SECURITIES|BROKERAGE|FINANCIAL))",
+], 0)
+
+
 def parse_consolidated_1099(text, filename):
     """Parse consolidated 1099 (contains multiple 1099 types like Vanguard/Fidelity)."""
     results = {'1099-INT': [], '1099-DIV': [], '1099-B': []}
 
     # Extract payer name
     payer_name = ''
-    payer_patterns = [
-        r"(VANGUARD\s+(?:MARKETING|BROKERAGE)[A-Z\s]*)",
-        r"(FIDELITY\s+INVESTMENTS[A-Z\s]*)",
-        r"([A-Z][A-Za-z]+\s+(?:BANK|INVESTMENTS|SECURITIES|BROKERAGE|FINANCIAL))",
-    ]
-    for pattern in payer_patterns:
-        match = re.search(pattern, text)
+    for pattern in CONSOLIDATED_PAYER_PATTERNS:
+        match = pattern.search(text)
         if match:
             payer_name = match.group(1).strip()[:50]
             break
 
+    # Section slices for the traditional consolidated format, found in one pass
+    sections = split_consolidated(text)
+
     # For Vanguard-style documents, the whole page may contain multiple sections
     # Try to extract DIV data from entire text first (Vanguard format)
     div_data = parse_1099div(text, filename)
@@ -1343,9 +1630,8 @@ def parse_consolidated_1099(text, filename):
         results['1099-DIV'].append(div_data)
     else:
         # Try section-based extraction (traditional consolidated format)
-        div_section = re.search(r'1099-DIV.*?(?=1099-(?!DIV)|$)', text, re.DOTALL | re.IGNORECASE)
-        if div_section:
-            div_data = parse_1099div(div_section.group(0), filename)
+        if 'DIV' in sections:
+            div_data = parse_1099div(sections['DIV'], filename)
             div_data['payer_name'] = payer_name or div_data.get('payer_name', '')
             if div_data['box1a_ordinary_dividends'] > 0:
                 results['1099-DIV'].append(div_data)
@@ -1358,9 +1644,8 @@ def parse_consolidated_1099(text, filename):
         results['1099-INT'].append(int_data)
     else:
         # Try section-based extraction
-        int_section = re.search(r'1099-INT.*?(?=1099-(?!INT)|$)', text, re.DOTALL | re.IGNORECASE)
-        if int_section:
-            int_data = parse_1099int(int_section.group(0), filename)
+        if 'INT' in sections:
+            int_data = parse_1099int(sections['INT'], filename)
             int_data['payer_name'] = payer_name or int_data.get('payer_name', '')
             if int_data['box1_interest'] > 0:
                 results['1099-INT'].append(int_data)
@@ -1368,6 +1653,21 @@ def parse_consolidated_1099(text, filename):
     return results
 
 
+# Multi-form PDF patterns (per-page 1099-G, 1099-NEC and W-2 checks)
+MULTI_EIN_RE = re.compile(r'(\d{2}-\d{7})')
+MULTI_G_AMOUNT_RE = re.compile(r'[Uu]nemployment\s+compensation\s*\n?\s*\$?\s*([\d,]+\.?\d{2})')
+MULTI_G_AMOUNT_BEFORE_FORM_RE = re.compile(r'\$\s*([\d,]+\.\d{2}).*?1099-G', re.DOTALL)
+MULTI_G_PAYER_RE = re.compile(r'^([A-Z][A-Z\s]+(?:DEPARTMENT|LABOR|EMPLOYMENT))', re.MULTILINE)
+MULTI_NEC_AMOUNT_RE = re.compile(r'[Nn]onemployee\s+[Cc]ompensation.*?\$\s*([\d,]+\.?\d{2})', re.DOTALL)
+MULTI_NEC_AMOUNT_NEXT_LINE_RE = re.compile(r'[Nn]onemployee\s+[Cc]ompensation\s*\n\s*([\d,]+\.\d{2})')
+MULTI_NEC_AMOUNT_SAME_LINE_RE = re.compile(r'1\s+[Nn]onemployee\s+[Cc]ompensation\s+([\d,]+\.?\d{2})')
+MULTI_NEC_PAYER_RE = re.compile(r"[Pp]ayer'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)")
+MULTI_NEC_PAYER_COMPANY_RE = re.compile(r'^([A-Z][A-Za-z0-9\s\.,&-]+(?:LLC|INC|CORP|DBA\s+\w+))', re.MULTILINE)
+MULTI_AMOUNT_PAIR_RE = re.compile(r'[\d,]+\.\d{2}\s+[\d,]+\.\d{2}')
+MULTI_COMPACT_W2_RE = re.compile(r'\d{2}-\d{7}\s*\n\s*[\d,]+\.\d{2}\s+[\d,]+\.\d{2}')
+MULTI_AMOUNT_RE = re.compile(r'\d+\.\d{2}')
+
+
 def parse_multi_form_pdf(pdf_path, filename):
     """
     Parse a PDF containing multiple tax forms (e.g., 'all W2' documents).
@@ -1388,7 +1688,7 @@ def parse_multi_form_pdf(pdf_path, filename):
         text_upper = text.upper()
 
         # Find EIN on this page
-        ein_match = re.search(r'(\d{2}-\d{7})', text)
+        ein_match = MULTI_EIN_RE.search(text)
         ein = ein_match.group(1) if ein_match else None
 
         # Check for 1099-G (unemployment) - check first since it's distinctive
@@ -1397,12 +1697,12 @@ def parse_multi_form_pdf(pdf_path, filename):
                 continue
             if ein:
                 seen_g_eins.add(ein)
-            amt_match = re.search(r'[Uu]nemployment\s+compensation\s*\n?\s*\$?\s*([\d,]+\.?\d{2})', text)
+            amt_match = MULTI_G_AMOUNT_RE.search(text)
             if not amt_match:
-                amt_match = re.search(r'\$\s*([\d,]+\.\d{2}).*?1099-G', text, re.DOTALL)
+                amt_match = MULTI_G_AMOUNT_BEFORE_FORM_RE.search(text)
             if amt_match:
                 payer = ''
-                payer_match = re.search(r'^([A-Z][A-Z\s]+(?:DEPARTMENT|LABOR|EMPLOYMENT))', text, re.MULTILINE)
+                payer_match = MULTI_G_PAYER_RE.search(text)
                 if payer_match:
                     payer = payer_match.group(1).strip()[:50]
                 g_data = {
@@ -1420,18 +1720,18 @@ def parse_multi_form_pdf(pdf_path, filename):
             if ein and ein in seen_nec_eins:
                 continue
             # Extract amount - try with $, then without
-            nec_match = re.search(r'[Nn]onemployee\s+[Cc]ompensation.*?\$\s*([\d,]+\.?\d{2})', text, re.DOTALL)
+            nec_match = MULTI_NEC_AMOUNT_RE.search(text)
             if not nec_match:
-                nec_match = re.search(r'[Nn]onemployee\s+[Cc]ompensation\s*\n\s*([\d,]+\.\d{2})', text)
+                nec_match = MULTI_NEC_AMOUNT_NEXT_LINE_RE.search(text)
             if not nec_match:
-                nec_match = re.search(r'1\s+[Nn]onemployee\s+[Cc]ompensation\s+([\d,]+\.?\d{2})', text)
+                nec_match = MULTI_NEC_AMOUNT_SAME_LINE_RE.search(text)
             if nec_match:
                 if ein:
                     seen_nec_eins.add(ein)
                 payer = ''
-                payer_match = re.search(r"[Pp]ayer'?s?\s+name.*?\n\s*([A-Z][A-Za-z0-9\s\.,&-]+)", text)
+                payer_match = MULTI_NEC_PAYER_RE.search(text)
                 if not payer_match:
-                    payer_match = re.search(r'^([A-Z][A-Za-z0-9\s\.,&-]+(?:LLC|INC|CORP|DBA\s+\w+))', text, re.MULTILINE)
+                    payer_match = MULTI_NEC_PAYER_COMPANY_RE.search(text)
                 if payer_match:
                     payer = payer_match.group(1).strip()[:50]
                 nec_data = {
@@ -1446,13 +1746,11 @@ def parse_multi_form_pdf(pdf_path, filename):
         # Check for W-2 indicators
         is_w2 = ('WAGE AND TAX' in text_upper or 'FORM W-2' in text_upper or
                   'WAGES, TIPS' in text_upper or 'W-2 WAGE' in text_upper or
-                  ('EMPLOYER' in text_upper and re.search(r'[\d,]+\.\d{2}\s+[\d,]+\.\d{2}', text)))
+                  ('EMPLOYER' in text_upper and MULTI_AMOUNT_PAIR_RE.search(text)))
 
         # Compact W-2 detection: EIN line followed by two dollar amounts (wages + fed withholding)
         if not is_w2 and ein:
-            has_compact_w2 = bool(re.search(
-                r'\d{2}-\d{7}\s*\n\s*[\d,]+\.\d{2}\s+[\d,]+\.\d{2}',
-                text))
+            has_compact_w2 = bool(MULTI_COMPACT_W2_RE.search(text))
             is_w2 = has_compact_w2
 
         if is_w2 and ein:
@@ -1465,7 +1763,7 @@ def parse_multi_form_pdf(pdf_path, filename):
                 # Sanity check: reject entries where employer name contains dollar amounts
                 # (indicates earnings summary page, not actual W-2)
                 emp_name = data.get('employer_name', '')
-                if re.search(r'\d+\.\d{2}', emp_name):
+                if MULTI_AMOUNT_RE.search(emp_name):
                     print(f"    Skipped pg{page_num}: earnings summary (not a W-2)")
                     continue
                 results.append(('W-2', data))
@@ -1475,8 +1773,52 @@ def parse_multi_form_pdf(pdf_path, filename):
     return results
 
 
-def parse_folder(folder_path):
-    """Parse all PDFs in a folder and return structured data."""
+# --cache: extracted text per PDF, kept in the client folder next to the PDFs
+TEXT_CACHE_NAME = '.parse_cache.json'
+
+
+def text_cache_key(pdf_path, ocr_dpi, ocr_preprocess, text_engine):
+    """Key a PDF's extracted text by its content hash and the extraction options."""
+    digest = hashlib.blake2b(pdf_path.read_bytes()).hexdigest()
+    return f"{digest}:{text_engine}:{ocr_dpi}:{int(ocr_preprocess)}"
+
+
+def load_text_cache(folder):
+    """Load the folder's extracted-text cache, or {} if it is missing or unreadable."""
+    try:
+        with open(folder / TEXT_CACHE_NAME) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_text_cache(folder, cache):
+    """Write the folder's extracted-text cache."""
+    try:
+        with open(folder / TEXT_CACHE_NAME, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"  Warning: Could not write {TEXT_CACHE_NAME}: {e}")
+
+
+def parse_folder(folder_path, max_workers=None, ocr_workers=None, ocr_quality='BALANCED',
+                 ocr_preprocess=False, text_engine='pdfplumber', use_cache=False):
+    """
+    Parse all PDFs in a folder and return structured data.
+
+    Text extraction (pdfplumber and OCR) runs in up to max_workers worker
+    processes (default: CPU count); 0 or 1 extracts each file in this process.
+    ocr_workers, ocr_quality (an OCR_PRESETS key) and ocr_preprocess are
+    passed through to extract_text_with_ocr, and text_engine to
+    extract_text_from_pdf. With several worker processes, ocr_workers
+    defaults to the CPUs left per process, so the OCR threads of all the
+    processes together don't exceed the CPU count.
+
+    use_cache reuses text extracted on an earlier run for PDFs whose content
+    and extraction options are unchanged (stored in TEXT_CACHE_NAME in the
+    folder), so only new or changed files are read and OCR'd again. Parsing
+    always reruns on the cached text.
+    """
     folder = Path(folder_path)
 
     if not folder.exists():
@@ -1505,19 +1847,69 @@ def parse_folder(folder_path):
         }
     }
 
-    # Get unique PDF files (case-insensitive), excluding generated review files
-    pdf_files = list(set(folder.glob('*.pdf')) | set(folder.glob('*.PDF')))
-    # Exclude document_review.pdf files (generated combined PDFs)
-    pdf_files = [f for f in pdf_files if 'document_review' not in f.name.lower()]
+    # Get PDF files (case-insensitive suffix) in one directory listing, excluding
+    # document_review.pdf files (generated combined PDFs)
+    with os.scandir(folder) as entries:
+        pdf_files = [Path(entry.path) for entry in entries
+                     if entry.name.lower().endswith('.pdf') and 'document_review' not in entry.name.lower()
+                     and entry.is_file()]
     print(f"Found {len(pdf_files)} PDF files in {folder}")
 
-    for pdf_path in pdf_files:
+    # Extraction dominates the run time; parsing and reporting stay in this
+    # process so results are collected and printed in file order
+    ocr_dpi = OCR_PRESETS[ocr_quality]
+    cache = {}
+    to_extract = pdf_files
+    if use_cache:
+        # Key on the reader that will actually run, not just the one requested
+        cache_engine = 'pymupdf' if text_engine == 'pymupdf' and PYMUPDF_AVAILABLE else 'pdfplumber'
+        cache_keys = [text_cache_key(pdf_path, ocr_dpi, ocr_preprocess, cache_engine) for pdf_path in pdf_files]
+        old_cache = load_text_cache(folder)
+        # Keep only entries for files still in the folder
+        cache = {key: old_cache[key] for key in cache_keys if key in old_cache}
+        to_extract = [pdf_path for pdf_path, key in zip(pdf_files, cache_keys) if key not in cache]
+        if cache:
+            print(f"Reusing cached text for {len(pdf_files) - len(to_extract)} unchanged files")
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(to_extract))
+    if max_workers > 1 and ocr_workers is None:
+        # Each process OCRs on its own thread pool; split the CPUs between them
+        ocr_workers = max(1, (os.cpu_count() or 1) // max_workers)
+    extract = partial(extract_text_from_pdf, ocr_workers=ocr_workers, ocr_dpi=ocr_dpi,
+                      ocr_preprocess=ocr_preprocess, text_engine=text_engine)
+    if max_workers > 1:
+        # Inherited by the worker processes' Tesseract calls (see extract_text_with_ocr)
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+        print(f"Extracting text with {max_workers} worker processes...")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            extracted = list(executor.map(extract, to_extract))
+    else:
+        extracted = map(extract, to_extract)
+
+    if use_cache:
+        fresh = dict(zip(to_extract, extracted))
+        extracted = []
+        for pdf_path, key in zip(pdf_files, cache_keys):
+            if pdf_path in fresh:
+                text, is_scanned, engine, complete = fresh[pdf_path]
+                # Only full extractions are cached: empty text, scans that weren't (fully)
+                # OCR'd and pdfplumber text from a file PyMuPDF failed to read are
+                # extracted again next run (e.g. once OCR is installed)
+                if text.strip() and complete and engine == cache_engine:
+                    cache[key] = {'text': text, 'is_scanned': is_scanned}
+            else:
+                text, is_scanned, engine, complete = cache[key]['text'], cache[key]['is_scanned'], cache_engine, True
+            extracted.append((text, is_scanned, engine, complete))
+        save_text_cache(folder, cache)
+
+    for pdf_path, (text, is_scanned, *_) in zip(pdf_files, extracted):
         filename = pdf_path.name
         print(f"\nProcessing: {filename}")
 
-        text, is_scanned = extract_text_from_pdf(pdf_path)
         if not text.strip():
-            reason = "OCR failed to extract text" if OCR_AVAILABLE else "Scanned document (no OCR)"
+            reason = "OCR failed to extract text" if init_ocr() else "Scanned document (no OCR)"
             print(f"  Skipped: {reason}")
             results['metadata']['files_skipped'] += 1
             results['metadata']['skipped_files'].append({'file': filename, 'reason': reason})
@@ -1683,6 +2075,19 @@ Examples:
     parser.add_argument('--checksheet', '-c', help='Run populate_checksheet.py with this template')
     parser.add_argument('--column', choices=['cch', 'source'], default='source',
                         help='Which column to fill (default: source)')
+    parser.add_argument('--max-workers', type=int,
+                        help='Worker processes for PDF text extraction (default: CPU count, 0 or 1 = no pool)')
+    parser.add_argument('--ocr-workers', type=int,
+                        help='Threads for OCR of scanned pages, per worker process (default: CPU count, '
+                             'at most 8, divided among the --max-workers processes)')
+    parser.add_argument('--ocr-quality', choices=list(OCR_PRESETS), default='BALANCED',
+                        help='OCR resolution: FAST (150 DPI), BALANCED (200), HIGH_QUALITY (300) (default: BALANCED)')
+    parser.add_argument('--ocr-preprocess', action='store_true',
+                        help='Grayscale and threshold scanned pages before OCR (faster on clean scans)')
+    parser.add_argument('--text-engine', choices=['pdfplumber', 'pymupdf'], default='pdfplumber',
+                        help='PDF text layer reader (default: pdfplumber; pymupdf is faster, pip install pymupdf)')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Reuse text extracted on earlier runs for unchanged PDFs (saved as {TEXT_CACHE_NAME} in the folder)')
 
     args = parser.parse_args()
     folder_path = Path(args.folder)
@@ -1693,7 +2098,14 @@ Examples:
     print(f"Folder: {folder_path}")
     print()
 
-    results = parse_folder(folder_path)
+    if args.text_engine == 'pymupdf' and not PYMUPDF_AVAILABLE:
+        print("WARNING: PyMuPDF not found, using pdfplumber. Install it:")
+        print("  pip install pymupdf")
+        print()
+
+    results = parse_folder(folder_path, max_workers=args.max_workers, ocr_workers=args.ocr_workers,
+                           ocr_quality=args.ocr_quality, ocr_preprocess=args.ocr_preprocess,
+                           text_engine=args.text_engine, use_cache=args.cache)
     if not results:
         sys.exit(1)
 
@@ -1734,23 +2146,32 @@ Examples:
         print("POPULATING CHECKSHEET")
         print("=" * 60)
 
-        script_dir = Path(__file__).parent
-        populate_script = script_dir / 'populate_checksheet.py'
+        # Fill from the results already in memory instead of starting
+        # populate_checksheet.py and re-reading the JSON
+        try:
+            from populate_checksheet import populate_checksheet, load_workbook
+        except ImportError as e:
+            print(f"ERROR: Could not import populate_checksheet.py: {e}")
+            sys.exit(1)
 
-        if not populate_script.exists():
-            print(f"ERROR: populate_checksheet.py not found at {populate_script}")
+        checksheet_path = Path(args.checksheet)
+        if not checksheet_path.exists():
+            print(f"ERROR: Checksheet not found: {checksheet_path}")
             sys.exit(1)
 
-        import subprocess
-        cmd = [
-            sys.executable,
-            str(populate_script),
-            str(output_path),
-            '--checksheet', args.checksheet,
-            '--column', args.column
-        ]
-        print(f"Running: {' '.join(cmd)}")
-        subprocess.run(cmd)
+        print(f"Loading checksheet: {checksheet_path}")
+        workbook = load_workbook(checksheet_path)
+
+        print(f"Filling '{args.column}' column...")
+        counts = populate_checksheet(workbook, results, args.column)
+
+        checksheet_output = output_path.with_suffix('.xlsx')
+        checksheet_output = checksheet_output.with_stem(output_path.stem.replace('_parsed', '') + '_checksheet')
+        workbook.save(checksheet_output)
+
+        print(f"\nOutput: {checksheet_output}")
+        for form_type, count in counts.items():
+            print(f"  {form_type}: {count} entries")
 
 
 if __name__ == '__main__':
@@ -15,11 +15,17 @@ Usage:
     python populate_cch_checksheet.py parsed_data.json --checksheet "C:\\Tax\\CCH_1040_Checksheet.xlsx"
     python populate_cch_checksheet.py parsed_data.json --mode source  (fill source columns B-F)
     python populate_cch_checksheet.py parsed_data.json --mode cch     (fill CCH column H)
+    python populate_cch_checksheet.py client1.json client2.json ...   (several clients in parallel)
 """
 
 import argparse
+import glob
+import io
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 import os
@@ -27,6 +33,7 @@ import os
 try:
     from openpyxl import load_workbook
     from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import column_index_from_string
 except ImportError:
     print("ERROR: openpyxl not found. Install with: pip install openpyxl")
     sys.exit(1)
@@ -201,10 +208,30 @@ SCHEDULE_A_SHEET = {
 }
 
 
-def safe_write(ws, cell_ref, value, fill=None):
-    """Write to cell safely, handling merged cells. Optionally apply fill color."""
+# Audit log columns per form type: (key value field, payer/employer field, payer default)
+AUDIT_LOG_FIELDS = {
+    'W-2': ('box1_wages', 'employer_name', ''),
+    'IRS-1099INT': ('box1_interest', 'payer_name', ''),
+    '1099-INT': ('box1_interest', 'payer_name', ''),
+    'IRS-1099DIV': ('box1a_ordinary_dividends', 'payer_name', ''),
+    '1099-DIV': ('box1a_ordinary_dividends', 'payer_name', ''),
+    'IRS-1099R': ('box1_gross_distribution', 'payer_name', ''),
+    '1099-R': ('box1_gross_distribution', 'payer_name', ''),
+    'SSA-1099': ('box5_net_benefits', 'description', 'Social Security'),
+    '1098': ('box1_mortgage_interest', 'lender_name', ''),
+    'PROPERTY-TAX': ('ad_valorem_taxes', 'county', ''),
+}
+
+
+def safe_write(ws, row, col, value, fill=None):
+    """
+    Write to cell safely, handling merged cells. Optionally apply fill color.
+
+    The cell is looked up with ws.cell(row, column) rather than ws['B6'], which
+    parses the coordinate string on every call.
+    """
     try:
-        cell = ws[cell_ref]
+        cell = ws.cell(row=row, column=column_index_from_string(col))
         if hasattr(cell, 'value'):
             cell.value = value
             if fill is not None:
@@ -268,11 +295,11 @@ def clear_income_sheet(ws):
     for section in sections:
         # Clear header row names (B-F)
         for col in ['B', 'C', 'D', 'E', 'F']:
-            safe_write(ws, f"{col}{section['name_row']}", None)
+            safe_write(ws, section['name_row'], col, None)
         # Clear data rows (B-F)
         for row in section['data_rows']:
             for col in ['B', 'C', 'D', 'E', 'F']:
-                safe_write(ws, f"{col}{row}", None)
+                safe_write(ws, row, col, None)
 
 
 def update_audit_sheet(workbook, parsed_data, mode):
@@ -287,72 +314,56 @@ def update_audit_sheet(workbook, parsed_data, mode):
     client_name = Path(folder).parent.name if folder else 'Unknown'
 
     # Update header info
-    safe_write(ws, 'A1', f"Client: {client_name}")
-    safe_write(ws, 'A2', f"Processed: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    safe_write(ws, 'A3', f"Mode: {mode.upper()}")
+    safe_write(ws, 1, 'A', f"Client: {client_name}")
+    safe_write(ws, 2, 'A', f"Processed: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    safe_write(ws, 3, 'A', f"Mode: {mode.upper()}")
 
     # Color Legend
-    ws['E1'] = "COLOR LEGEND:"
-    ws['E1'].font = Font(bold=True)
-    safe_write(ws, 'E2', "Manual Entry", FILL_MANUAL)
-    safe_write(ws, 'F2', "Can't upload to CCH - manual entry required")
-    safe_write(ws, 'E3', "OCR Data", FILL_OCR)
-    safe_write(ws, 'F3', "Extracted via OCR - verify accuracy")
-    safe_write(ws, 'E4', "Issue Found", FILL_ISSUE)
-    safe_write(ws, 'F4', "Validation issue or low confidence")
-    safe_write(ws, 'E5', "Partial Data", FILL_PARTIAL)
-    safe_write(ws, 'F5', "Some required fields missing")
+    legend = ws.cell(row=1, column=5, value="COLOR LEGEND:")
+    legend.font = Font(bold=True)
+    safe_write(ws, 2, 'E', "Manual Entry", FILL_MANUAL)
+    safe_write(ws, 2, 'F', "Can't upload to CCH - manual entry required")
+    safe_write(ws, 3, 'E', "OCR Data", FILL_OCR)
+    safe_write(ws, 3, 'F', "Extracted via OCR - verify accuracy")
+    safe_write(ws, 4, 'E', "Issue Found", FILL_ISSUE)
+    safe_write(ws, 4, 'F', "Validation issue or low confidence")
+    safe_write(ws, 5, 'E', "Partial Data", FILL_PARTIAL)
+    safe_write(ws, 5, 'F', "Some required fields missing")
 
     # Find starting row for extraction log (after any existing content)
     log_start = 5
 
-    safe_write(ws, 'A' + str(log_start), "EXTRACTION LOG")
-    safe_write(ws, 'A' + str(log_start + 1), "Form Type")
-    safe_write(ws, 'B' + str(log_start + 1), "Source File")
-    safe_write(ws, 'C' + str(log_start + 1), "Key Value")
-    safe_write(ws, 'D' + str(log_start + 1), "Payer/Employer")
+    safe_write(ws, log_start, 'A', "EXTRACTION LOG")
+    safe_write(ws, log_start + 1, 'A', "Form Type")
+    safe_write(ws, log_start + 1, 'B', "Source File")
+    safe_write(ws, log_start + 1, 'C', "Key Value")
+    safe_write(ws, log_start + 1, 'D', "Payer/Employer")
 
     row = log_start + 2
     forms = parsed_data.get('forms', {})
 
     for form_type, entries in forms.items():
         for entry in entries:
-            safe_write(ws, f'A{row}', form_type)
-            safe_write(ws, f'B{row}', entry.get('source_file', ''))
+            safe_write(ws, row, 'A', form_type)
+            safe_write(ws, row, 'B', entry.get('source_file', ''))
 
             # Get key value based on form type
-            if form_type == 'W-2':
-                key_val = entry.get('box1_wages', 0)
-                payer = entry.get('employer_name', '')
-            elif form_type in ['IRS-1099INT', '1099-INT']:
-                key_val = entry.get('box1_interest', 0)
-                payer = entry.get('payer_name', '')
-            elif form_type in ['IRS-1099DIV', '1099-DIV']:
-                key_val = entry.get('box1a_ordinary_dividends', 0)
-                payer = entry.get('payer_name', '')
-            elif form_type in ['IRS-1099R', '1099-R']:
-                key_val = entry.get('box1_gross_distribution', 0)
-                payer = entry.get('payer_name', '')
-            elif form_type == 'SSA-1099':
-                key_val = entry.get('box5_net_benefits', 0)
-                payer = entry.get('description', 'Social Security')
-            elif form_type == '1098':
-                key_val = entry.get('box1_mortgage_interest', 0)
-                payer = entry.get('lender_name', '')
-            elif form_type == 'PROPERTY-TAX':
-                key_val = entry.get('ad_valorem_taxes', 0)
-                payer = entry.get('county', '')
+            log_fields = AUDIT_LOG_FIELDS.get(form_type)
+            if log_fields:
+                key_field, payer_field, payer_default = log_fields
+                key_val = entry.get(key_field, 0)
+                payer = entry.get(payer_field, payer_default)
             else:
                 key_val = ''
                 payer = ''
 
-            safe_write(ws, f'C{row}', f"${key_val:,.2f}" if isinstance(key_val, (int, float)) else key_val)
-            safe_write(ws, f'D{row}', payer)
+            safe_write(ws, row, 'C', f"${key_val:,.2f}" if isinstance(key_val, (int, float)) else key_val)
+            safe_write(ws, row, 'D', payer)
             row += 1
 
     # Summary
     row += 1
-    safe_write(ws, f'A{row}', f"Total forms extracted: {sum(len(e) for e in forms.values())}")
+    safe_write(ws, row, 'A', f"Total forms extracted: {sum(len(e) for e in forms.values())}")
 
 
 def format_amount(value):
@@ -371,6 +382,14 @@ def format_amount(value):
 # Minimum confidence threshold for populating values
 MIN_CONFIDENCE_THRESHOLD = 60
 
+# Form labels that show up in payer/employer names when the name was mis-parsed
+GARBAGE_NAME_PATTERNS = ('zip', '1099', 'box ', 'federal', 'withheld', 'income tax',
+                         'postal code', 'telephone', 'payer', 'recipient', 'form w-2',
+                         'fed.', 'medicare', 'social security', 'wages', 'w-2 box')
+
+# Box 1 interest amounts that are really a tax year picked up from the form
+TAX_YEAR_AMOUNTS = frozenset({2023, 2024, 2025, 2026})
+
 
 def should_skip_entry(item):
     """
@@ -392,16 +411,13 @@ def should_skip_entry(item):
     # Skip if payer/employer name looks like garbage (form labels, etc.)
     name = item.get('employer_name', '') or item.get('payer_name', '') or ''
     name_lower = name.lower()
-    garbage_patterns = ['zip', '1099', 'box ', 'federal', 'withheld', 'income tax',
-                        'postal code', 'telephone', 'payer', 'recipient', 'form w-2',
-                        'fed.', 'medicare', 'social security', 'wages', 'w-2 box']
-    for pattern in garbage_patterns:
+    for pattern in GARBAGE_NAME_PATTERNS:
         if pattern in name_lower:
             return True, f"Invalid name (contains '{pattern}')"
 
     # Skip if interest amount looks like a tax year
     interest = item.get('box1_interest', 0)
-    if interest in [2023, 2024, 2025, 2026]:
+    if interest in TAX_YEAR_AMOUNTS:
         return True, f"Interest amount looks like year ({int(interest)})"
 
     return False, None
@@ -447,7 +463,7 @@ def populate_w2_source(ws, w2_data, mapping):
 
         # Write employer name in header row
         employer = w2.get('employer_name', f'Employer {idx+1}')
-        safe_write(ws, f"{col}{mapping['name_row']}", employer, fill)
+        safe_write(ws, mapping['name_row'], col, employer, fill)
 
         # Write box values (skip fields with quality issues)
         for field, row in mapping['rows'].items():
@@ -455,7 +471,7 @@ def populate_w2_source(ws, w2_data, mapping):
                 continue
             value = format_amount(w2.get(field, 0))
             if value:
-                safe_write(ws, f"{col}{row}", value, fill)
+                safe_write(ws, row, col, value, fill)
 
         count += 1
     if skipped:
@@ -482,7 +498,7 @@ def populate_1099_source(ws, data_list, mapping, form_type):
 
         # Write payer name in header row
         payer = item.get('payer_name', f'Payer {idx+1}')
-        safe_write(ws, f"{col}{mapping['name_row']}", payer, fill)
+        safe_write(ws, mapping['name_row'], col, payer, fill)
 
         # Write box values (skip fields with quality issues)
         for field, row in mapping['rows'].items():
@@ -490,7 +506,7 @@ def populate_1099_source(ws, data_list, mapping, form_type):
                 continue
             value = format_amount(item.get(field, 0))
             if value:
-                safe_write(ws, f"{col}{row}", value, fill)
+                safe_write(ws, row, col, value, fill)
 
         count += 1
     if skipped:
@@ -517,14 +533,14 @@ def populate_ssa_source(ws, ssa_data, mapping):
 
         # SSA typically just has one entry per person
         name = item.get('description', 'Social Security')
-        safe_write(ws, f"{col}{mapping['name_row']}", name, fill)
+        safe_write(ws, mapping['name_row'], col, name, fill)
 
         for field, row in mapping['rows'].items():
             if should_skip_field(item, field):
                 continue
             value = format_amount(item.get(field, 0))
             if value:
-                safe_write(ws, f"{col}{row}", value, fill)
+                safe_write(ws, row, col, value, fill)
 
         count += 1
     if skipped:
@@ -539,7 +555,7 @@ def populate_cch_column(ws, totals, form_type, mapping):
     for field, row in mapping['rows'].items():
         value = format_amount(totals.get(field, 0))
         if value:
-            safe_write(ws, f"{col}{row}", value)
+            safe_write(ws, row, col, value)
 
 
 def populate_schedule_a(workbook, parsed_data, mode='source'):
@@ -571,13 +587,13 @@ def populate_schedule_a(workbook, parsed_data, mode='source'):
         total_insurance = sum(f.get('box5_mortgage_insurance', 0) for f in forms['1098'])
 
         if total_interest > 0:
-            safe_write(ws, f"{col}{mapping['rows']['box1_mortgage_interest']}", round(total_interest), fill)
+            safe_write(ws, mapping['rows']['box1_mortgage_interest'], col, round(total_interest), fill)
             counts['1098'] = len(forms['1098'])
             fill_msg = " [OCR]" if fill == FILL_OCR else " [ISSUE]" if fill == FILL_ISSUE else ""
             print(f"  1098 Mortgage Interest: ${total_interest:,.2f}{fill_msg}")
 
         if total_insurance > 0:
-            safe_write(ws, f"{col}{mapping['rows']['box5_mortgage_insurance']}", round(total_insurance), fill)
+            safe_write(ws, mapping['rows']['box5_mortgage_insurance'], col, round(total_insurance), fill)
 
     # Property Tax - ALWAYS yellow (manual entry - can't upload to CCH)
     if 'PROPERTY-TAX' in forms and forms['PROPERTY-TAX']:
@@ -598,7 +614,7 @@ def populate_schedule_a(workbook, parsed_data, mode='source'):
         total_property_tax = sum(f.get('ad_valorem_taxes', 0) for f in forms['PROPERTY-TAX'])
 
         if total_property_tax > 0:
-            safe_write(ws, f"{col}{mapping['rows']['ad_valorem_taxes']}", round(total_property_tax), fill)
+            safe_write(ws, mapping['rows']['ad_valorem_taxes'], col, round(total_property_tax), fill)
             counts['PROPERTY-TAX'] = len(forms['PROPERTY-TAX'])
             fill_msg = " [MANUAL ENTRY]" if fill == FILL_MANUAL else " [OCR]" if fill == FILL_OCR else " [ISSUE]" if fill == FILL_ISSUE else ""
             print(f"  Property Tax: ${total_property_tax:,.2f}{fill_msg}")
@@ -635,13 +651,13 @@ def populate_k1_sheet(workbook, parsed_data, mode='source'):
         fill = get_quality_fill(entry, 'K-1')
 
         # Write entity name in header row
-        safe_write(ws, f"{col}{K1_SHEET['entity_name_row']}", entity_name[:25], fill)
+        safe_write(ws, K1_SHEET['entity_name_row'], col, entity_name[:25], fill)
 
         # Write each K-1 line item
         for field, row in K1_SHEET['rows'].items():
             value = entry.get(field, 0)
             if value and value != 0:
-                safe_write(ws, f"{col}{row}", value, fill)
+                safe_write(ws, row, col, value, fill)
 
     counts['K-1'] = len(k1_data)
     fill_msg = " [MANUAL ENTRY]"  # K-1s always need manual entry
@@ -730,6 +746,64 @@ def populate_checksheet(workbook, parsed_data, mode='source'):
     return counts
 
 
+def populate_file(json_path, checksheet_path, mode='source', output_path=None):
+    """
+    Populate one parsed JSON file into a copy of the checksheet template.
+
+    Returns (output_path, counts). The default output is
+    client_name_year_checksheet.xlsx in the JSON's client folder.
+    """
+    # Load data
+    print(f"Loading: {json_path}")
+    with open(json_path) as f:
+        parsed_data = json.load(f)
+
+    # Load checksheet
+    print(f"Loading checksheet: {checksheet_path}")
+    workbook = load_workbook(checksheet_path)
+
+    # Populate
+    print(f"\nPopulating {mode.upper()} columns...")
+    counts = populate_checksheet(workbook, parsed_data, mode)
+
+    # Determine output path - save as client_name_year_checksheet.xlsx in client folder
+    if not output_path:
+        # Get client name and year from folder structure
+        # JSON is in L:\ClientName\2025\2025_parsed.json
+        client_folder = json_path.parent  # L:\ClientName\2025
+        year = client_folder.name  # 2025
+        client_name = client_folder.parent.name  # ClientName
+
+        # Clean up client name for filename (replace spaces with underscores)
+        client_name_clean = client_name.replace(' ', '_')
+
+        output_filename = f"{client_name_clean}_{year}_checksheet.xlsx"
+        output_path = client_folder / output_filename
+
+    # Save
+    workbook.save(output_path)
+
+    return output_path, counts
+
+
+def populate_file_quietly(json_path, checksheet_path, mode='source'):
+    """
+    Run populate_file with its progress output captured, for batch runs.
+
+    Returns (output_path, counts, log, error) so the batch driver can print
+    each client's log in order instead of interleaved. A failure (bad JSON,
+    unreadable template, save error) is returned as the error message rather
+    than raised, so one client can't stop the rest of the batch.
+    """
+    log = io.StringIO()
+    with redirect_stdout(log):
+        try:
+            output_path, counts = populate_file(json_path, checksheet_path, mode)
+        except Exception as e:
+            return None, None, log.getvalue(), f"{type(e).__name__}: {e}"
+    return output_path, counts, log.getvalue(), None
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Populate CCH 1040 Checksheet from parsed tax documents',
@@ -740,6 +814,7 @@ Examples:
   python populate_cch_checksheet.py parsed_data.json --checksheet "C:\\Tax\\Checksheet.xlsx"
   python populate_cch_checksheet.py parsed_data.json --mode source
   python populate_cch_checksheet.py parsed_data.json --mode cch
+  python populate_cch_checksheet.py "L:\\Client A\\2025\\2025_parsed.json" "L:\\Client B\\2025\\2025_parsed.json"
 
 Modes:
   source - Fill columns B-F with source document data (default)
@@ -747,19 +822,31 @@ Modes:
         """
     )
 
-    parser.add_argument('json_file', help='Parsed data JSON file')
+    parser.add_argument('json_file', nargs='+',
+                        help='Parsed data JSON file(s) or wildcard; several clients are populated in parallel')
     parser.add_argument('--checksheet', '-c',
                         default=r'C:\Tax\CCH_1040_Checksheet_current.xlsx',
                         help='Checksheet template file')
     parser.add_argument('--output', '-o', help='Output file (default: adds _filled to input)')
     parser.add_argument('--mode', '-m', choices=['source', 'cch'], default='source',
                         help='Which columns to fill (default: source)')
+    parser.add_argument('--max-workers', type=int,
+                        help='Worker processes when populating several JSON files (default: CPU count, 0 or 1 = no pool)')
 
     args = parser.parse_args()
 
-    json_path = Path(args.json_file)
-    if not json_path.exists():
-        print(f"ERROR: File not found: {json_path}")
+    # Expand wildcards here too - the Windows shell passes them through as-is
+    json_paths = []
+    for json_file in args.json_file:
+        matches = sorted(glob.glob(json_file)) if glob.has_magic(json_file) else [json_file]
+        json_paths.extend(Path(match) for match in matches or [json_file])
+    for json_path in json_paths:
+        if not json_path.exists():
+            print(f"ERROR: File not found: {json_path}")
+            sys.exit(1)
+
+    if args.output and len(json_paths) > 1:
+        print("ERROR: --output can only be used with a single JSON file")
         sys.exit(1)
 
     checksheet_path = Path(args.checksheet)
@@ -767,47 +854,45 @@ Modes:
         print(f"ERROR: Checksheet not found: {checksheet_path}")
         sys.exit(1)
 
-    # Load data
-    print(f"Loading: {json_path}")
-    with open(json_path) as f:
-        parsed_data = json.load(f)
-
-    # Load checksheet
-    print(f"Loading checksheet: {checksheet_path}")
-    workbook = load_workbook(checksheet_path)
-
-    # Populate
-    print(f"\nPopulating {args.mode.upper()} columns...")
-    counts = populate_checksheet(workbook, parsed_data, args.mode)
-
-    # Determine output path - save as client_name_year_checksheet.xlsx in client folder
-    if args.output:
-        output_path = Path(args.output)
+    if len(json_paths) == 1:
+        output_path = Path(args.output) if args.output else None
+        output_path, counts = populate_file(json_paths[0], checksheet_path, args.mode, output_path)
+        results = [(output_path, counts, '', None)]
     else:
-        # Get client name and year from folder structure
-        # JSON is in L:\ClientName\2025\2025_parsed.json
-        client_folder = json_path.parent  # L:\ClientName\2025
-        year = client_folder.name  # 2025
-        client_name = client_folder.parent.name  # ClientName
-
-        # Clean up client name for filename (replace spaces with underscores)
-        client_name_clean = client_name.replace(' ', '_')
-
-        output_filename = f"{client_name_clean}_{year}_checksheet.xlsx"
-        output_path = client_folder / output_filename
-
-    # Save
-    workbook.save(output_path)
-
-    print(f"\n{'='*60}")
-    print("POPULATION COMPLETE")
-    print('='*60)
-    print(f"Mode: {args.mode.upper()}")
-    print(f"Output: {output_path}")
-    print()
-    print("Forms populated:")
-    for form_type, count in counts.items():
-        print(f"  {form_type}: {count}")
+        # Each client loads and saves its own workbook, which dominates the
+        # run time, so clients are populated in separate processes
+        max_workers = args.max_workers if args.max_workers is not None else os.cpu_count() or 1
+        max_workers = min(max_workers, len(json_paths))
+        populate = partial(populate_file_quietly, checksheet_path=checksheet_path, mode=args.mode)
+        if max_workers > 1:
+            print(f"Populating {len(json_paths)} checksheets with {max_workers} worker processes...")
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(populate, json_paths))
+        else:
+            results = map(populate, json_paths)
+
+    failed = []
+    for json_path, (output_path, counts, log, error) in zip(json_paths, results):
+        print(log, end='')
+        if error:
+            print(f"\nERROR: Could not populate {json_path}: {error}")
+            failed.append(json_path)
+            continue
+        print(f"\n{'='*60}")
+        print("POPULATION COMPLETE")
+        print('='*60)
+        print(f"Mode: {args.mode.upper()}")
+        print(f"Output: {output_path}")
+        print()
+        print("Forms populated:")
+        for form_type, count in counts.items():
+            print(f"  {form_type}: {count}")
+
+    if failed:
+        print(f"\n{len(failed)} of {len(json_paths)} checksheets failed:")
+        for json_path in failed:
+            print(f"  {json_path}")
+        sys.exit(1)
 
 
 if __name__ == '__main__':
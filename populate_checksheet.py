@@ -24,6 +24,7 @@ from datetime import datetime
 try:
     from openpyxl import load_workbook
     from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import column_index_from_string
 except ImportError:
     print("ERROR: openpyxl not found. Install it:")
     print("  pip install openpyxl")
@@ -135,21 +136,26 @@ def populate_1099int(ws, data: list, column: str = 'cch'):
     for entry in data[:10]:  # Max 10 entries
         # Payer name
         payer = entry.get('payer_name', '')
-        safe_write(ws, f"{mapping['payer_col']}{row}", payer)
+        safe_write(ws, row, mapping['payer_col'], payer)
         
         # Interest amount
-        interest = entry.get('box1_interest', 0) or 0
-        safe_write(ws, f"{col}{row}", int(round(interest)))
+        interest = rounded_amount(entry, 'box1_interest')
+        safe_write(ws, row, col, interest)
         
         row += 1
     
     return len(data)
 
 
-def safe_write(ws, cell_ref, value):
-    """Write to cell, skipping if it's a merged cell."""
+def safe_write(ws, row, col, value):
+    """
+    Write to cell, skipping if it's a merged cell.
+
+    The cell is looked up with ws.cell(row, column) rather than ws['B6'], which
+    parses the coordinate string on every call.
+    """
     try:
-        cell = ws[cell_ref]
+        cell = ws.cell(row=row, column=column_index_from_string(col))
         # Check if it's a merged cell
         if hasattr(cell, 'value'):
             cell.value = value
@@ -158,6 +164,11 @@ def safe_write(ws, cell_ref, value):
         pass
 
 
+def rounded_amount(entry, key):
+    """Return entry[key] rounded to whole dollars, treating missing/None as 0."""
+    return int(round(entry.get(key, 0) or 0))
+
+
 def populate_1099div(ws, data: list, column: str = 'cch'):
     """Populate 1099-DIV worksheet."""
     mapping = CELL_MAPPINGS['1099-DIV']
@@ -170,15 +181,15 @@ def populate_1099div(ws, data: list, column: str = 'cch'):
         
         # Payer name (row after section header)
         payer = entry.get('payer_name', '')
-        safe_write(ws, f"B{row + mapping['payer_name_offset']}", payer)
+        safe_write(ws, row + mapping['payer_name_offset'], 'B', payer)
         
         # Ordinary dividends
-        ordinary = entry.get('box1a_ordinary_dividends', 0) or 0
-        safe_write(ws, f"{col}{row + mapping['ordinary_offset']}", int(round(ordinary)))
+        ordinary = rounded_amount(entry, 'box1a_ordinary_dividends')
+        safe_write(ws, row + mapping['ordinary_offset'], col, ordinary)
         
         # Qualified dividends
-        qualified = entry.get('box1b_qualified_dividends', 0) or 0
-        safe_write(ws, f"{col}{row + mapping['qualified_offset']}", int(round(qualified)))
+        qualified = rounded_amount(entry, 'box1b_qualified_dividends')
+        safe_write(ws, row + mapping['qualified_offset'], col, qualified)
     
     return len(data)
 
@@ -195,22 +206,22 @@ def populate_w2(ws, data: list, column: str = 'cch'):
         
         # Employer name (row 2 of section)
         employer = entry.get('employer_name', '')
-        safe_write(ws, f"B{row + 1}", employer)
+        safe_write(ws, row + 1, 'B', employer)
         
         # Box amounts start at row 3 of section
         box_row = row + 2
         
-        wages = entry.get('box1_wages', 0) or 0
-        safe_write(ws, f"{col}{box_row}", int(round(wages)))
+        wages = rounded_amount(entry, 'box1_wages')
+        safe_write(ws, box_row, col, wages)
         
-        fed_wh = entry.get('box2_fed_withholding', 0) or 0
-        safe_write(ws, f"{col}{box_row + 1}", int(round(fed_wh)))
+        fed_wh = rounded_amount(entry, 'box2_fed_withholding')
+        safe_write(ws, box_row + 1, col, fed_wh)
         
-        ss_wages = entry.get('box3_ss_wages', 0) or 0
-        safe_write(ws, f"{col}{box_row + 2}", int(round(ss_wages)))
+        ss_wages = rounded_amount(entry, 'box3_ss_wages')
+        safe_write(ws, box_row + 2, col, ss_wages)
         
-        medicare = entry.get('box5_medicare_wages', 0) or 0
-        safe_write(ws, f"{col}{box_row + 3}", int(round(medicare)))
+        medicare = rounded_amount(entry, 'box5_medicare_wages')
+        safe_write(ws, box_row + 3, col, medicare)
     
     return len(data)
 
@@ -227,23 +238,23 @@ def populate_1099r(ws, data: list, column: str = 'cch'):
         
         # Payer name
         payer = entry.get('payer_name', '')
-        safe_write(ws, f"B{row + 1}", payer)
+        safe_write(ws, row + 1, 'B', payer)
         
         # Distribution code
         code = entry.get('box7_distribution_code', '')
-        safe_write(ws, f"D{row + 1}", code)
+        safe_write(ws, row + 1, 'D', code)
         
         # Gross distribution (row + 2)
-        gross = entry.get('box1_gross_distribution', 0) or 0
-        safe_write(ws, f"{col}{row + 2}", int(round(gross)))
+        gross = rounded_amount(entry, 'box1_gross_distribution')
+        safe_write(ws, row + 2, col, gross)
         
         # Taxable amount (row + 3)
-        taxable = entry.get('box2a_taxable_amount', 0) or 0
-        safe_write(ws, f"{col}{row + 3}", int(round(taxable)))
+        taxable = rounded_amount(entry, 'box2a_taxable_amount')
+        safe_write(ws, row + 3, col, taxable)
         
         # Fed withholding (row + 4)
-        fed_wh = entry.get('box4_fed_withholding', 0) or 0
-        safe_write(ws, f"{col}{row + 4}", int(round(fed_wh)))
+        fed_wh = rounded_amount(entry, 'box4_fed_withholding')
+        safe_write(ws, row + 4, col, fed_wh)
     
     return len(data)
 
@@ -254,11 +265,11 @@ def populate_ssa1099(ws, data: list, column: str = 'cch'):
     col = mapping['cch_col'] if column == 'cch' else mapping['source_col']
     
     for entry in data[:1]:  # Usually just one
-        benefits = entry.get('box5_net_benefits', 0) or 0
-        safe_write(ws, f"{col}{mapping['benefits_row']}", int(round(benefits)))
+        benefits = rounded_amount(entry, 'box5_net_benefits')
+        safe_write(ws, mapping['benefits_row'], col, benefits)
         
-        fed_wh = entry.get('box6_fed_withholding', 0) or 0
-        safe_write(ws, f"{col}{mapping['withholding_row']}", int(round(fed_wh)))
+        fed_wh = rounded_amount(entry, 'box6_fed_withholding')
+        safe_write(ws, mapping['withholding_row'], col, fed_wh)
     
     return len(data)
 
@@ -272,7 +283,7 @@ def populate_schedule_d(ws, data: list, column: str = 'cch'):
     for entry in data[:10]:  # Max 10 transactions
         # Description
         desc = entry.get('description', '')
-        safe_write(ws, f"{mapping['description_col']}{row}", desc)
+        safe_write(ws, row, mapping['description_col'], desc)
         
         # Term (ST/LT)
         term = entry.get('term', '')
@@ -280,13 +291,13 @@ def populate_schedule_d(ws, data: list, column: str = 'cch'):
             term = 'ST'
         elif term == 'L':
             term = 'LT'
-        safe_write(ws, f"{mapping['term_col']}{row}", term)
+        safe_write(ws, row, mapping['term_col'], term)
         
         # Gain/Loss (proceeds - cost)
         proceeds = entry.get('proceeds_actual', entry.get('proceeds', 0)) or 0
         cost = entry.get('cost_actual', entry.get('cost_basis', 0)) or 0
         gain = proceeds - cost
-        safe_write(ws, f"{col}{row}", int(round(gain)))
+        safe_write(ws, row, col, int(round(gain)))
         
         row += 1
     
@@ -305,11 +316,11 @@ def populate_schedule_c(ws, data_c1: list, data_c2: list, column: str = 'cch'):
         
         # Business name
         name = entry.get('business_name', '')
-        safe_write(ws, f"A{row + 1}", name)
+        safe_write(ws, row + 1, 'A', name)
         
         # Gross receipts
-        gross = entry.get('gross_receipts', 0) or 0
-        safe_write(ws, f"{col}{row + 1}", int(round(gross)))
+        gross = rounded_amount(entry, 'gross_receipts')
+        safe_write(ws, row + 1, col, gross)
     
     return len(data_c1)
 
@@ -326,34 +337,35 @@ def populate_schedule_e(ws, data: list, column: str = 'cch'):
         
         # Address
         address = entry.get('address', '')
-        safe_write(ws, f"A{row + 1}", address)
+        safe_write(ws, row + 1, 'A', address)
         
         # Rents received
-        rents = entry.get('line3_rents_received', 0) or 0
-        safe_write(ws, f"{col}{row + 1}", int(round(rents)))
+        rents = rounded_amount(entry, 'line3_rents_received')
+        safe_write(ws, row + 1, col, rents)
     
     return len(data)
 
 
 def populate_k1(ws, partnership_data: list, scorp_data: list, trust_data: list, column: str = 'cch'):
     """Populate K-1 worksheet."""
-    mapping = CELL_MAPPINGS['K-1']
-    col = mapping['cch_col'] if column == 'cch' else mapping['source_col']
-    
-    # Partnership K-1s
-    row = mapping['partnership_start_row']
-    for entry in partnership_data[:3]:
-        # Would need to determine which K-1 fields to map
-        pass
-    
-    # S-Corp K-1s
-    row = mapping['scorp_start_row']
-    for entry in scorp_data[:2]:
-        pass
-    
+    # K-1 fields are not mapped yet: partnership K-1s would start at
+    # CELL_MAPPINGS['K-1']['partnership_start_row'] (max 3) and S-Corp K-1s
+    # at 'scorp_start_row' (max 2). Nothing is written until then.
     return len(partnership_data) + len(scorp_data)
 
 
+# Single-sheet populators: (parsed form key, sheet name, populate function).
+# The sheet name doubles as the key in the returned counts.
+POPULATORS = [
+    ('IRS-1099INT', '1099-INT', populate_1099int),
+    ('IRS-1099DIV', '1099-DIV', populate_1099div),
+    ('W-2', 'W-2', populate_w2),
+    ('IRS-1099R', '1099-R', populate_1099r),
+    ('SSA-1099', 'SSA-1099', populate_ssa1099),
+    ('D-1', 'Schedule D', populate_schedule_d),
+]
+
+
 def populate_checksheet(workbook, parsed_data: dict, column: str = 'cch'):
     """
     Populate the checksheet with parsed data.
@@ -366,38 +378,14 @@ def populate_checksheet(workbook, parsed_data: dict, column: str = 'cch'):
     forms = parsed_data.get('forms', {})
     counts = {}
     
-    # 1099-INT
-    if 'IRS-1099INT' in forms and '1099-INT' in workbook.sheetnames:
-        ws = workbook['1099-INT']
-        counts['1099-INT'] = populate_1099int(ws, forms['IRS-1099INT'], column)
-    
-    # 1099-DIV
-    if 'IRS-1099DIV' in forms and '1099-DIV' in workbook.sheetnames:
-        ws = workbook['1099-DIV']
-        counts['1099-DIV'] = populate_1099div(ws, forms['IRS-1099DIV'], column)
-    
-    # W-2
-    if 'W-2' in forms and 'W-2' in workbook.sheetnames:
-        ws = workbook['W-2']
-        counts['W-2'] = populate_w2(ws, forms['W-2'], column)
-    
-    # 1099-R
-    if 'IRS-1099R' in forms and '1099-R' in workbook.sheetnames:
-        ws = workbook['1099-R']
-        counts['1099-R'] = populate_1099r(ws, forms['IRS-1099R'], column)
-    
-    # SSA-1099
-    if 'SSA-1099' in forms and 'SSA-1099' in workbook.sheetnames:
-        ws = workbook['SSA-1099']
-        counts['SSA-1099'] = populate_ssa1099(ws, forms['SSA-1099'], column)
+    sheets = set(workbook.sheetnames)
     
-    # Schedule D
-    if 'D-1' in forms and 'Schedule D' in workbook.sheetnames:
-        ws = workbook['Schedule D']
-        counts['Schedule D'] = populate_schedule_d(ws, forms['D-1'], column)
+    for form_key, sheet_name, populate in POPULATORS:
+        if form_key in forms and sheet_name in sheets:
+            counts[sheet_name] = populate(workbook[sheet_name], forms[form_key], column)
     
     # Schedule C + E
-    if 'Sch C + E' in workbook.sheetnames:
+    if 'Sch C + E' in sheets:
         ws = workbook['Sch C + E']
         if 'C-1' in forms:
             counts['Schedule C'] = populate_schedule_c(
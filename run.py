@@ -17,6 +17,7 @@ Requirements:
     - Ubuntu/Debian: sudo apt-get install poppler-utils
     - Mac: brew install poppler
     - Windows: Install poppler and add to PATH
+    - or, without poppler: pip install pypdfium2
 """
 
 import argparse
@@ -190,7 +191,6 @@ def do_parse(file_path: Path, output_path: Path = None):
     print("Parsing data...")
     parsed = parse_input_listing(text)
     parsed['summary'] = calculate_summary(parsed)
-    parsed['forms'] = dict(parsed['forms'])
     
     # Output path
     if not output_path:
@@ -199,7 +199,7 @@ def do_parse(file_path: Path, output_path: Path = None):
     
     # Save
     with open(output_path, 'w') as f:
-        json.dump(parsed, f, indent=2, default=str)
+        f.write(json.dumps(parsed, indent=2, default=str))
     
     print(f"\nSaved: {output_path}")
     